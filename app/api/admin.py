@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.db import read_session_factory, slow_query_log
+from app.core.book_facets import BookFilters, book_filter_params
+from app.core.export import MEDIA_TYPES, ExportFormat, build_export_query, stream_export
+from app.core.search import keyword_filter
+from app.core.security import get_current_admin
+from app.api.books import BOOK_SORT_COLUMNS
+from app.api.orders import ORDER_SORT_COLUMNS
+from app.api.users import USER_SORT_COLUMNS, user_keyword_filter
+from app.models.books import Book
+from app.models.orders import Order
+from app.models.users import User
+from app.schemas.books import BookRead
+from app.schemas.users import UserRead
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+
+
+@router.get("/slow-queries", summary="최근 느린 쿼리 목록 (ADMIN)")
+def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    admin: User = Depends(get_current_admin),
+):
+    # 워커 프로세스별 버퍼라서 요청이 간 워커의 기록만 보임
+    entries = slow_query_log.entries()
+    return {
+        "isSuccess": True,
+        "message": "OK",
+        "payload": {
+            "thresholdMs": slow_query_log.threshold_ms,
+            "total": len(entries),
+            "content": entries[:limit],
+        },
+    }
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="느린 쿼리 기록 비우기 (ADMIN)",
+)
+def clear_slow_queries(admin: User = Depends(get_current_admin)):
+    slow_query_log.clear()
+    return
+
+
+# ===== export (NDJSON / CSV 스트리밍) =====
+# 응답 스키마에 있는 컬럼만 내보냄 (users.password 같은 컬럼은 제외)
+_BOOK_COLUMNS = [getattr(Book, name) for name in BookRead.model_fields]
+_ORDER_COLUMNS = [Order.order_id, Order.user_id, Order.status, Order.total_items, Order.created_at, Order.deleted_at]
+_USER_COLUMNS = [getattr(User, name) for name in UserRead.model_fields]
+
+_AFTER_DESCRIPTION = "이어 받기: 마지막으로 받은 행의 _cursor 값 (같은 sort 로만)"
+
+
+def _export(request: Request, name: str, fmt: ExportFormat, columns, filters, sort_columns, default_col, id_col, sort, after):
+    field, direction = (sort.split(",") + ["desc"])[:2]
+    col = sort_columns.get(field, default_col)
+    descending = direction.lower() != "asc"
+    sort_key = f"{col.key},{'desc' if descending else 'asc'}"
+
+    query = build_export_query(columns, filters, col, id_col, descending, sort_key, after)
+    filename = f"{name}-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.{fmt.value}"
+    return StreamingResponse(
+        stream_export(read_session_factory(request), query, fmt, sort_key, col.key, id_col.key),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/export/books", summary="도서 전체 export (ADMIN, NDJSON/CSV 스트리밍)")
+async def export_books(
+    request: Request,
+    fmt: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+    keyword: Optional[str] = None,
+    sort: str = Query("created_at,desc", description="도서 목록과 같은 field,asc|desc"),
+    after: Optional[str] = Query(None, description=_AFTER_DESCRIPTION),
+    book_filters: BookFilters = Depends(book_filter_params),
+    admin: User = Depends(get_current_admin),
+):
+    filters = [await keyword_filter(keyword)] if keyword else []
+    filters += book_filters.conditions()
+    return _export(request, "books", fmt, _BOOK_COLUMNS, filters, BOOK_SORT_COLUMNS, Book.created_at, Book.book_id, sort, after)
+
+
+@router.get("/export/orders", summary="주문 전체 export (ADMIN, NDJSON/CSV 스트리밍)")
+def export_orders(
+    request: Request,
+    fmt: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    sort: str = Query("order_id,desc", description="관리자 주문 목록과 같은 field,asc|desc"),
+    after: Optional[str] = Query(None, description=_AFTER_DESCRIPTION),
+    admin: User = Depends(get_current_admin),
+):
+    filters = [Order.status == status_filter] if status_filter else []
+    return _export(request, "orders", fmt, _ORDER_COLUMNS, filters, ORDER_SORT_COLUMNS, Order.order_id, Order.order_id, sort, after)
+
+
+@router.get("/export/users", summary="회원 전체 export (ADMIN, NDJSON/CSV 스트리밍)")
+def export_users(
+    request: Request,
+    fmt: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+    keyword: Optional[str] = None,
+    sort: str = Query("created_at,desc", description="회원 목록과 같은 field,asc|desc"),
+    after: Optional[str] = Query(None, description=_AFTER_DESCRIPTION),
+    admin: User = Depends(get_current_admin),
+):
+    filters = [user_keyword_filter(keyword)] if keyword else []
+    return _export(request, "users", fmt, _USER_COLUMNS, filters, USER_SORT_COLUMNS, User.created_at, User.user_id, sort, after)
@@ -1,14 +1,18 @@
+import hmac
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.security import (
-    verify_password,
-    hash_password,
+    averify_and_rehash_password,
+    invalidate_principal,
     create_access_token,
     create_refresh_token,
     decode_token,
+    token_fingerprint,
 )
 from app.core.config import get_settings
+from app.core.token_maintenance import enforce_session_cap
 from app.db import get_db
 from datetime import datetime, timedelta, timezone
 
@@ -22,6 +26,7 @@ from app.schemas.auth import (
     LogoutRequest,
 )
 from fastapi.security import OAuth2PasswordRequestForm
+from starlette.concurrency import run_in_threadpool
 
 settings = get_settings()
 
@@ -32,17 +37,18 @@ router = APIRouter(
 
 
 def _save_refresh_token(db: Session, user: User, refresh_token: str) -> None:
-    """리프레시 토큰을 해시해서 DB에 저장 (user_token 테이블)."""
-    token_hash = hash_password(refresh_token)
+    """리프레시 토큰의 HMAC 지문을 DB에 저장 (user_token 테이블)."""
     now = datetime.now(timezone.utc)
     expires_at = now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
     user_token = UserToken(
         user_id=user.user_id,
-        refresh_token_hash=token_hash,
+        refresh_token_fingerprint=token_fingerprint(refresh_token),
         expires_at=expires_at,
     )
     db.add(user_token)
+    db.flush()
+    enforce_session_cap(db, user.user_id, settings.MAX_SESSIONS_PER_USER)
     db.commit()
 
 def _find_valid_refresh_token(
@@ -50,55 +56,74 @@ def _find_valid_refresh_token(
     user: User,
     refresh_token: str,
 ) -> UserToken:
-    """DB에 저장된 해시 중에서, 이 refresh_token과 일치하고 아직 유효한 토큰 찾기."""
+    """지문(unique index)으로 토큰 row 하나만 찾아서 유효성 확인."""
     now = datetime.now(timezone.utc)
+    fingerprint = token_fingerprint(refresh_token)
 
-    candidates = (
+    token_row = (
         db.query(UserToken)
-        .filter(
-            UserToken.user_id == user.user_id,
-            UserToken.revoked_at.is_(None),
-            UserToken.expires_at > now,
-        )
-        .all()
+        .filter(UserToken.refresh_token_fingerprint == fingerprint)
+        .first()
     )
 
-    for token_row in candidates:
-        # bcrypt 해시 비교 재사용
-        if verify_password(refresh_token, token_row.refresh_token_hash):
-            return token_row
+    if (
+        token_row is not None
+        and token_row.user_id == user.user_id
+        and token_row.revoked_at is None
+        and _as_utc(token_row.expires_at) > now
+        and hmac.compare_digest(token_row.refresh_token_fingerprint, fingerprint)
+    ):
+        return token_row
 
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid or expired refresh token",
     )
 
+
+def _as_utc(value: datetime) -> datetime:
+    # DateTime 컬럼은 naive 로 돌아오므로 UTC 로 간주
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
 @router.post(path="/login", response_model=TokenPair)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
 ):
+    # bcrypt 는 전용 풀에서 await, DB 작업만 스레드풀에서
+    # (bcrypt 가 도는 동안 AnyIO 스레드를 잡고 있지 않음)
     email = form_data.username
     password = form_data.password
 
-    user = db.query(User).filter(User.email == email).first()
+    user = await run_in_threadpool(
+        lambda: db.query(User).filter(User.email == email).first()
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email or password",
         )
 
-    if not verify_password(password, user.password):
+    verified, new_hash = await averify_and_rehash_password(password, user.password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email or password",
         )
 
+    # 저장된 해시의 cost/scheme 이 현재 설정과 다르면 평문을 아는 지금 재해시
+    # (아래 _save_refresh_token 의 commit 에 같이 반영됨)
+    if new_hash:
+        user.password = new_hash
+
     # 아래는 기존 토큰 생성 / 저장 로직 그대로 두면 됨
-    claims = {"sub": str(user.user_id), "role": user.role}
+    user_id = user.user_id
+    claims = {"sub": str(user_id), "role": user.role}
     access_token = create_access_token(claims)
     refresh_token = create_refresh_token(claims)
-    _save_refresh_token(db, user, refresh_token)
+    await run_in_threadpool(_save_refresh_token, db, user, refresh_token)
+    if new_hash:
+        invalidate_principal(user_id)
 
     return TokenPair(
         access_token=access_token,
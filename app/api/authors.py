@@ -1,13 +1,13 @@
 # app/api/authors.py
-from typing import List, Optional
-from app.schemas.common import AuthorListPage
+from typing import List, Optional, Union
+from app.schemas.common import AuthorBatch, AuthorListPage
 import math
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 from app.models.books import Author, Book
 from app.models.users import User
-from app.db import get_db
+from app.db import get_db, get_read_db
 from app.schemas.authors import (
     AuthorCreate,
     AuthorUpdateFull,
@@ -16,6 +16,10 @@ from app.schemas.authors import (
 )
 from app.schemas.books import BookRead
 from app.core.security import get_current_user, get_current_admin
+from app.core.count_cache import CountMode, count_rows, total_pages
+from app.core.batch import in_request_order, parse_ids
+from app.core.fields import dump_page, parse_fields
+from app.core.etag import etag_matches, make_body_etag, not_modified, set_etag
 
 router = APIRouter(
     prefix="/api/v1/authors",
@@ -54,20 +58,37 @@ def create_author(
 # -----------------------------------------------
 # 2) 작가 목록 조회 (검색 + 페이지네이션, USER 이상)
 # -----------------------------------------------
-@router.get("", response_model=AuthorListPage)
+@router.get("", response_model=Union[AuthorListPage, AuthorBatch])
 def list_authors(
     keyword: Optional[str] = Query(default=None, description="이름 / 프로필 검색 (부분 일치)"),
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=100),
     sort: str = Query("author_id,desc"),  # 추가
-    db: Session = Depends(get_db),
+    count: CountMode = Query(CountMode.exact, description="totalElements 계산 방식: exact | approx(테이블 통계) | none"),
+    fields: Optional[str] = Query(None, description="응답에 넣을 필드 (예: author_id,name). profile 을 빼면 SELECT 에서도 빠짐"),
+    ids: Optional[str] = Query(None, description="일괄 조회 (예: ids=3,1,2). 요청 순서대로, 없는 id 는 null + missing"),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_user),
 ):
-    query = db.query(Author)
+    fieldset = parse_fields(fields, Author, AuthorRead, pk="author_id")
+
+    author_ids = parse_ids(ids)
+    if author_ids is not None:
+        query = db.query(Author).filter(Author.author_id.in_(set(author_ids)))
+        if fieldset:
+            query = query.options(*fieldset.options())
+        found = {author.author_id: author for author in query.all()}
+        content, missing = in_request_order(author_ids, found)
+        if fieldset:
+            content = [fieldset.dump(author) if author is not None else None for author in content]
+        return {"content": content, "missing": missing}
+    filters = []
 
     if keyword:
         like = f"%{keyword}%"
-        query = query.filter(or_(Author.name.like(like), Author.profile.like(like)))
+        filters.append(or_(Author.name.like(like), Author.profile.like(like)))
+
+    query = db.query(Author).filter(*filters)
 
     field, direction = (sort.split(",") + ["desc"])[:2]
     direction = direction.lower()
@@ -78,17 +99,21 @@ def list_authors(
     }
     col = sort_map.get(field, Author.author_id)
     query = query.order_by(col.asc() if direction == "asc" else col.desc())
+    if fieldset:
+        query = query.options(*fieldset.options())
 
-    total = query.order_by(None).count()
+    total, exact = count_rows(
+        db, select(func.count()).select_from(Author).where(*filters), ["authors"], count
+    )
     items = query.offset(page * size).limit(size).all()
-    total_pages = (total + size - 1) // size
 
     return {
-        "content": items,
+        "content": dump_page(items, fieldset),
         "page": page,
         "size": size,
         "totalElements": total,
-        "totalPages": total_pages,
+        "totalPages": total_pages(total, size),
+        "totalExact": exact,
         "sort": sort,
     }
 
@@ -103,6 +128,8 @@ def list_authors(
 )
 def get_author(
     author_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user),
 ):
@@ -112,7 +139,13 @@ def get_author(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Author not found",
         )
-    return author
+    # 본문 해시가 클라이언트가 가진 것과 같으면 본문 없이 304
+    body = AuthorRead.model_validate(author)
+    etag = make_body_etag("author", body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return body
 
 
 # ---------------------------
@@ -212,21 +245,29 @@ def delete_author(
             summary="특정 작가의 도서 목록 조회")
 def list_author_books(
     author_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     page: int = Query(0, ge=0, description="페이지 번호 (0부터 시작)"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
 ):
     # 작가 존재 여부 확인
-    author = db.query(Author).filter(Author.author_id == author_id).first()
-    if not author:
+    exists = db.execute(select(Author.author_id).where(Author.author_id == author_id)).first()
+    if not exists:
         raise HTTPException(status_code=404, detail="Author not found")
 
-    query = (
-        db.query(Book)
+    books = [
+        BookRead.model_validate(book)
+        for book in db.query(Book)
         .filter(Book.author_id == author_id)
         .order_by(Book.book_id.desc())
-    )
-
-    books = query.offset(page * size).limit(size).all()
-    return books
\ No newline at end of file
+        .offset(page * size)
+        .limit(size)
+    ]
+    # 페이지 본문 전체를 해시 (같은 초 안의 수정, 집계 컬럼 변경도 ETag 가 바뀜)
+    etag = make_body_etag("author-books", books, author_id, page, size)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return books
@@ -1,11 +1,13 @@
 # app/api/books.py
 from typing import List, Optional
 import math
+import tempfile
 from app.models.users import User
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
-from sqlalchemy import or_,asc, desc
-from app.db import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import or_,asc, desc, select, func
+from app.db import get_db, get_async_read_db
 from app.core.security import require_admin
 from app.schemas.authors import AuthorRead
 from app.schemas.books import BookCreate, BookUpdateFull, BookUpdatePartial, BookRead, BookPut
@@ -14,77 +16,210 @@ from app.models.books import Book, Author
 from pydantic import BaseModel
 
 from app.core.error_codes import raise_http, ErrorCode
+from app.core.batch import in_request_order, parse_ids
+from app.core.book_import import FORMATS as IMPORT_FORMATS, detect_format, import_books, iter_rows
+from app.core.book_cache import book_cache
+from app.core.book_facets import BookFilters, afacet_counts, book_filter_params
+from app.core.fields import dump_page, parse_fields
+from app.core.etag import etag_matches, make_body_etag, not_modified, set_etag
+from app.core.count_cache import CountMode, acount_rows, total_pages
+from app.core.pagination import apply_keyset, build_keyset_page, decode_cursor
+from app.core.search import index_book, keyword_filter, relevance_page, search_content, unindex_book
 from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
 
 class BookPage(BaseModel):
     content: list[BookRead]
     page: int
     size: int
-    totalElements: int
-    totalPages: int
+    totalElements: Optional[int]
+    totalPages: Optional[int]
+    totalExact: bool = True
     sort: str
 router = APIRouter(prefix="/api/v1/books", tags=["books"])
 
+# sort=field,asc|desc 로 받을 수 있는 컬럼 (목록/커서/export 공용). 모르는 field 는 created_at
+BOOK_SORT_COLUMNS = {
+    "created_at": Book.created_at,
+    "title": Book.title,
+    "price": Book.price,
+    "rating": Book.rating_avg,
+}
+
 
 
 @router.get("", summary="전체 도서 목록 조회 (부분 검색)")
-def list_books(
-    db: Session = Depends(get_db),
+async def list_books(
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user),
     keyword: str | None = None,
-    page: int = 0,
-    size: int = 20,
-    sort: str = "created_at,desc",
+    page: int = Query(0, ge=0),
+    size: int = Query(20, ge=1, le=100),
+    sort: str = Query(
+        "created_at,desc",
+        description="field,asc|desc (created_at / title / price / rating) 또는 relevance(keyword 검색 점수순, 커서 모드 제외)",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="keyset 페이지네이션. 빈 값이면 첫 페이지, 이후엔 nextCursor/prevCursor 를 그대로 전달",
+    ),
+    withTotal: bool = Query(False, description="cursor 모드에서 totalElements 도 계산 (COUNT 1회 추가)"),
+    count: CountMode = Query(CountMode.exact, description="totalElements 계산 방식: exact | approx(테이블 통계) | none"),
+    fields: str | None = Query(
+        None,
+        description="응답에 넣을 필드 (예: book_id,title,price). author 를 넣으면 저자를 JOIN 해서 같이 내려줌",
+    ),
+    ids: str | None = Query(
+        None,
+        description="일괄 조회 (예: ids=3,1,2). 요청 순서대로, 없는 id 는 null + missing. 다른 목록 파라미터는 무시",
+    ),
+    filters: BookFilters = Depends(book_filter_params),
+    facets: bool = Query(
+        False,
+        description="payload.facets 에 저자별/상태별/가격대별 도서 수 (totalElements 와 같은 쿼리 1번으로 계산)",
+    ),
 ):
-    query = db.query(Book)
-
-    if keyword:
-        like = f"%{keyword}%"
-        query = query.filter((Book.title.ilike(like)) | (Book.description.ilike(like)))
-
-    total = query.count()
+    fieldset = parse_fields(fields, Book, BookRead, pk="book_id", relations={"author": AuthorRead})
+
+    book_ids = parse_ids(ids)
+    if book_ids is not None:
+        if fieldset and fieldset.relations:
+            raise_http(ErrorCode.INVALID_REQUEST, message="ids does not support relation fields")
+        # 상세 조회와 같은 도서 캐시 사용. 캐시에 없는 것만 IN 쿼리 한 번
+        found = await book_cache.aget_many(db, book_ids)
+        content, missing = in_request_order(book_ids, found)
+        if fieldset:
+            content = [fieldset.dump(book) if book is not None else None for book in content]
+        return {
+            "isSuccess": True,
+            "message": "OK",
+            "payload": {"content": content, "missing": missing},
+        }
+
+    conditions = filters.conditions()
+
+    if keyword and sort == "relevance":
+        if cursor is not None:
+            raise_http(ErrorCode.INVALID_REQUEST, message="cursor pagination does not support sort=relevance")
+        books, total, scores = await relevance_page(
+            db, keyword, page, size, fieldset.options() if fieldset else (), conditions
+        )
+        payload = {
+            "content": search_content(books, keyword, scores, fieldset),
+            "page": page,
+            "size": size,
+            "totalElements": total,
+            "totalPages": math.ceil(total / size) if size else 0,
+            "totalExact": True,
+            "sort": sort,
+        }
+        if facets:
+            _, payload["facets"] = await afacet_counts(db, [await keyword_filter(keyword)], filters)
+        return {"isSuccess": True, "message": "OK", "payload": payload}
+
+    base = [await keyword_filter(keyword)] if keyword else []
+    where = [*base, *conditions]
+    facet_block = None
+    if facets:
+        # 전체 수도 facet 쿼리에서 같이 나옴 → 별도 COUNT 안 함
+        facet_total, facet_block = await afacet_counts(db, base, filters)
 
     # sort 파싱
     field, direction = (sort.split(",") + ["desc"])[:2]
     direction = direction.lower()
 
-    sort_map = {
-        "created_at": Book.created_at,
-        "title": Book.title,
-        "price": Book.price,
-    }
-    col = sort_map.get(field, Book.created_at)
-    query = query.order_by(col.asc() if direction == "asc" else col.desc())
+    col = BOOK_SORT_COLUMNS.get(field, Book.created_at)
+    options = fieldset.options(col) if fieldset else ()
+
+    if cursor is not None:
+        # 커서 모드: OFFSET 없이 (정렬컬럼, book_id) 인덱스 range scan
+        sort_key = f"{col.key},{'asc' if direction == 'asc' else 'desc'}"
+        decoded = decode_cursor(cursor, sort_key) if cursor else None
+        query = apply_keyset(
+            select(Book).options(*options).where(*where),
+            col,
+            Book.book_id,
+            descending=direction != "asc",
+            size=size,
+            cursor=decoded,
+        )
+        rows = (await db.scalars(query)).all()
+        items, next_cursor, prev_cursor = build_keyset_page(
+            rows, sort_key, col.key, "book_id", size, decoded
+        )
+        if facet_block is not None:
+            total, exact = facet_total, True
+        elif withTotal:
+            total, exact = await acount_rows(db, select(func.count()).select_from(Book).where(*where), ["book"], count)
+        else:
+            total, exact = None, False
+        payload = {
+            "content": search_content(items, keyword, fieldset=fieldset) if keyword else dump_page(items, fieldset),
+            "size": size,
+            "sort": sort_key,
+            "nextCursor": next_cursor,
+            "prevCursor": prev_cursor,
+            "totalElements": total,
+            "totalExact": exact,
+        }
+        if facet_block is not None:
+            payload["facets"] = facet_block
+        return {"isSuccess": True, "message": "OK", "payload": payload}
+
+    if facet_block is not None:
+        total, exact = facet_total, True
+    else:
+        total, exact = await acount_rows(
+            db, select(func.count()).select_from(Book).where(*where), ["book"], count
+        )
 
-    items = (
-        query.offset(page * size)
-             .limit(size)
-             .all()
+    query = (
+        select(Book)
+        .options(*options)
+        .where(*where)
+        .order_by(col.asc() if direction == "asc" else col.desc())
     )
 
-    total_pages = math.ceil(total / size) if size else 0
-
-    return {
-        "isSuccess": True,
-        "message": "OK",
-        "payload": {
-            "content": items,
-            "page": page,
-            "size": size,
-            "totalElements": total,
-            "totalPages": total_pages,
-            "sort": sort,
-        },
+    items = (
+        await db.scalars(
+            query.offset(page * size)
+                 .limit(size)
+        )
+    ).all()
+
+    payload = {
+        "content": search_content(items, keyword, fieldset=fieldset) if keyword else dump_page(items, fieldset),
+        "page": page,
+        "size": size,
+        "totalElements": total,
+        "totalPages": total_pages(total, size),
+        "totalExact": exact,
+        "sort": sort,
     }
+    if facet_block is not None:
+        payload["facets"] = facet_block
+    return {"isSuccess": True, "message": "OK", "payload": payload}
 
 @router.get("/{book_id}", response_model=BookRead, summary="도서 상세 조회")
-def get_book(book_id: int, db: Session = Depends(get_db)):
-    book = db.query(Book).filter(Book.book_id == book_id).first()
-    if not book:
+async def get_book(
+    book_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    # 캐시된 스냅샷이면 DB 를 안 거침. ETag 는 스냅샷 본문 해시라 hit 이면 304 도 DB 없이
+    # (updated_at 만 쓰면 같은 초 안의 수정 / 별점·재고 Core UPDATE 를 못 잡음)
+    book = await book_cache.aget(db, book_id)
+    if book is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Book not found",
         )
+    etag = make_body_etag("book", book)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
     return book
 
 
@@ -123,6 +258,8 @@ def update_book_full(
 
     db.commit()
     db.refresh(book)
+    index_book(book)
+    book_cache.invalidate(book.book_id)
     return book
 
 @router.patch(
@@ -162,6 +299,8 @@ def update_book_partial(
 
     db.commit()
     db.refresh(book)
+    index_book(book)
+    book_cache.invalidate(book.book_id)
     return book
 
 @router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -176,6 +315,8 @@ def delete_book(
 
     db.delete(book)
     db.commit()
+    unindex_book(book_id)
+    book_cache.invalidate(book_id)
     return None
 
 @router.get("/{book_id}/author",
@@ -226,4 +367,33 @@ def create_book(
         raise_http(ErrorCode.CONFLICT, message="duplicate constraint", status_code=409)
 
     db.refresh(book)
-    return book
\ No newline at end of file
+    index_book(book)
+    book_cache.invalidate(book.book_id)
+    return book
+
+@router.post("/import", summary="도서 일괄 등록 (ADMIN, CSV/NDJSON)")
+async def import_books_upload(
+    request: Request,
+    fmt: str | None = Query(None, alias="format", description="csv | ndjson. 없으면 Content-Type 으로 판단"),
+    db: Session = Depends(get_db),
+    _admin: User = Depends(require_admin),
+):
+    """요청 본문이 곧 파일 (Content-Type: text/csv 또는 application/x-ndjson).
+
+    행 단위 실패(검증/저자 없음/ISBN 중복)는 건너뛰고 payload.errors 에 행 번호와 함께 남김.
+    """
+    fmt = fmt or detect_format(request.headers.get("content-type"))
+    if fmt not in IMPORT_FORMATS:
+        raise_http(
+            ErrorCode.INVALID_REQUEST,
+            message="format must be csv or ndjson (Content-Type: text/csv | application/x-ndjson)",
+        )
+
+    # 본문은 임시 파일로 흘려 받고(8MB 넘으면 디스크), 파싱/INSERT 는 스레드풀에서 한 줄씩
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        report = await run_in_threadpool(lambda: import_books(db, iter_rows(spool, fmt)))
+
+    return {"isSuccess": True, "message": "OK", "payload": report.to_dict()}
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db import get_db
+from app.db import get_db, get_async_db
 from app.core.security import get_current_user
+from app.core.book_cache import book_cache
 from app.models.users import User
-from app.models.books import Book
 from app.models.carts import Cart, CartItem
 from app.schemas.carts import CartItemCreate, CartItemUpdate, CartRead, CartItemRead, CartItemPut
 
@@ -28,7 +30,7 @@ def add_cart_item(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    book = db.query(Book).filter(Book.book_id == payload.book_id).first()
+    book = book_cache.get(db, payload.book_id)
     if not book:
         raise HTTPException(status_code=404, detail="BOOK_NOT_FOUND")
 
@@ -65,31 +67,34 @@ def add_cart_item(
 
 
 @router.get("", response_model=CartRead)
-def get_my_cart(
-    db: Session = Depends(get_db),
+async def get_my_cart(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    cart = db.query(Cart).filter(Cart.user_id == current_user.user_id).first()
+    cart = await db.scalar(select(Cart).where(Cart.user_id == current_user.user_id))
     if not cart:
         # 빈 카트 반환(스펙 취향)
         return {"cart_id": 0, "items": []}
 
-    rows = (
-        db.query(CartItem, Book)
-        .join(Book, CartItem.book_id == Book.book_id)
-        .filter(CartItem.cart_id == cart.cart_id)
-        .order_by(CartItem.cart_item_id.desc())
-        .all()
-    )
+    cart_items = (
+        await db.scalars(
+            select(CartItem)
+            .where(CartItem.cart_id == cart.cart_id)
+            .order_by(CartItem.cart_item_id.desc())
+        )
+    ).all()
+    # 도서 제목은 캐시에서 (없는 것만 IN 한 번). 도서가 없어진 항목은 기존 JOIN 처럼 제외
+    books = await book_cache.aget_many(db, [item.book_id for item in cart_items])
 
     items = [
         CartItemRead(
             cart_item_id=item.cart_item_id,
-            book_id=book.book_id,
-            title=book.title,
+            book_id=item.book_id,
+            title=books[item.book_id].title,
             quantity=item.quantity,
         )
-        for item, book in rows
+        for item in cart_items
+        if item.book_id in books
     ]
     return {"cart_id": cart.cart_id, "items": items}
 
@@ -116,7 +121,7 @@ def update_cart_item(
     db.commit()
     db.refresh(item)
 
-    book = db.query(Book).filter(Book.book_id == item.book_id).first()
+    book = book_cache.get(db, item.book_id)
     return {
         "cart_item_id": item.cart_item_id,
         "book_id": item.book_id,
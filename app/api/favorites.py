@@ -2,14 +2,17 @@
 import math
 from datetime import datetime, timezone
 from typing import List
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from app.schemas.common import FavoriteListPage
-from app.db import get_db
+from app.db import get_db, get_async_db
 from app.models.books import Favorite, Book
 from app.models.users import User
 from app.core.security import get_current_user
+from app.core.book_cache import book_cache
+from app.core.count_cache import CountMode, acount_rows, total_pages
 from app.schemas.favorites import FavoriteCreate, FavoriteRead
 
 
@@ -28,11 +31,7 @@ def add_favorite(
     current_user: User = Depends(get_current_user),
 ):
     # 1) 책 존재 확인
-    book = (
-        db.query(Book)
-        .filter(Book.book_id == payload.book_id)
-        .first()
-    )
+    book = book_cache.get(db, payload.book_id)
     if not book:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -73,20 +72,23 @@ def add_favorite(
 
 # 601. 내 위시리스트 조회
 @router.get("", response_model=FavoriteListPage)
-def list_favorites(
+async def list_favorites(
     page: int = 0,
     size: int = 20,
     sort: str = Query("created_at,desc"),  # 추가
-    db: Session = Depends(get_db),
+    count: CountMode = Query(CountMode.exact, description="totalElements 계산 방식: exact | approx(테이블 통계) | none"),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
+    filters = (
+        Favorite.user_id == current_user.user_id,
+        Favorite.deleted_at.is_(None),
+    )
+    # 페이지 범위는 기존처럼 JOIN 으로 정하고, Book 행(+joined author)은 안 읽음. 제목은 캐시에서
     base_q = (
-        db.query(Favorite, Book)
+        select(Favorite)
         .join(Book, Favorite.book_id == Book.book_id)
-        .filter(
-            Favorite.user_id == current_user.user_id,
-            Favorite.deleted_at.is_(None),
-        )
+        .where(*filters)
     )
 
     field, direction = (sort.split(",") + ["desc"])[:2]
@@ -98,13 +100,21 @@ def list_favorites(
     col = sort_map.get(field, Favorite.created_at)
 
 
-    total = base_q.with_entities(func.count(func.distinct(Favorite.favorite_id))).scalar()
+    total, exact = await acount_rows(
+        db,
+        select(func.count(func.distinct(Favorite.favorite_id)))
+        .join(Book, Favorite.book_id == Book.book_id)
+        .where(*filters),
+        ["favorite", "book"],
+        count,
+    )
     ordered_q = base_q.order_by(col.asc() if direction == "asc" else col.desc())
-    rows = ordered_q.offset(page * size).limit(size).all()
-    total_pages = (total + size - 1) // size
+    favorites = (await db.scalars(ordered_q.offset(page * size).limit(size))).all()
+    books = await book_cache.aget_many(db, [fav.book_id for fav in favorites])
     content = [
-        {"favorite_id": fav.favorite_id, "book_id": book.book_id, "title": book.title}
-        for fav, book in rows
+        {"favorite_id": fav.favorite_id, "book_id": fav.book_id, "title": books[fav.book_id].title}
+        for fav in favorites
+        if fav.book_id in books
     ]
 
     return {
@@ -112,7 +122,8 @@ def list_favorites(
     "page": page,
     "size": size,
     "totalElements": total,
-    "totalPages": total_pages,
+    "totalPages": total_pages(total, size),
+    "totalExact": exact,
     "sort": sort,
     }
 
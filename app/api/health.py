@@ -5,7 +5,14 @@ from sqlalchemy.exc import SQLAlchemyError
 
 import os
 
-from app.db import get_db
+from app.db import get_db, engine, replica_engines
+from app.core.pool_metrics import pool_stats
+from app.core.security import principal_cache, decoded_token_cache, password_executor, get_current_admin
+from app.core.search import search_index
+from app.core.book_cache import book_cache
+from app.core.count_cache import count_cache
+from app.core.like_counters import like_buffer
+from app.models.users import User
 
 router = APIRouter(prefix="/health", tags=["system"])
 
@@ -25,3 +32,19 @@ def health(db: Session = Depends(get_db)):
     except SQLAlchemyError:
         # DB 연결/쿼리 실패는 503이 맞음
         raise HTTPException(status_code=503, detail="DB_UNAVAILABLE")
+
+
+@router.get("/metrics", summary="프로세스 내부 카운터 (ADMIN)")
+def metrics(admin: User = Depends(get_current_admin)):
+    """프로세스 내 캐시/리소스 카운터 (워커 프로세스별 값). 내부 구조가 드러나므로 관리자만."""
+    return {
+        "principalCache": principal_cache.stats(),
+        "jwtDecodeCache": decoded_token_cache.stats(),
+        "passwordHashExecutor": password_executor.stats(),
+        "dbPool": pool_stats(engine.pool),
+        "dbReplicaPools": [pool_stats(replica.pool) for replica in replica_engines],
+        "searchIndex": search_index.stats(),
+        "countCache": count_cache.stats(),
+        "bookCache": book_cache.stats(),
+        "likeCounter": like_buffer.stats(),
+    }
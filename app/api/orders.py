@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Query
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 from app.db import get_db
 from app.core.security import get_current_user
+from app.core.count_cache import CountMode, count_rows, total_pages
 from app.models.users import User
 from app.models.books import Book
 from app.models.carts import Cart, CartItem
@@ -14,6 +16,15 @@ import math
 
 
 router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
+
+# 관리자 주문 목록/export 의 sort 컬럼. 모르는 field 는 order_id
+ORDER_SORT_COLUMNS = {
+    "order_id": Order.order_id,
+    "created_at": Order.created_at,
+    "user_id": Order.user_id,
+    "status": Order.status,
+    "total_items": Order.total_items,
+}
 def require_admin(current_user = Depends(get_current_user)):
     if getattr(current_user, "role", None) != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="FORBIDDEN")
@@ -32,19 +43,27 @@ def create_order_from_cart(
     if not cart_items:
         raise HTTPException(status_code=400, detail="CART_EMPTY")
 
+    # 주문 아이템 스냅샷(title)은 주문 시점 DB 값이어야 하므로 도서 캐시가 아니라
+    # 이 트랜잭션(primary)에서 IN 한 번으로 읽음 (아이템마다 조회하던 N+1 제거)
+    # 주문을 만들기 전에 전부 확인해서, 없는 도서가 있으면 빈 주문이 남지 않게 함
+    books = {
+        row.book_id: row
+        for row in db.execute(
+            select(Book.book_id, Book.title).where(Book.book_id.in_({ci.book_id for ci in cart_items}))
+        )
+    }
+    if any(ci.book_id not in books for ci in cart_items):
+        raise HTTPException(status_code=404, detail="BOOK_NOT_FOUND")
+
     # 주문 생성
     order = Order(user_id=current_user.user_id, status="CREATED", total_items=sum(i.quantity for i in cart_items))
     db.add(order)
-    db.commit()
-    db.refresh(order)
+    db.flush()
 
-    # 주문 아이템 생성(스냅샷)
-    items_out = []
+    # 주문 아이템 생성(스냅샷) + 카트 비우기를 한 트랜잭션으로
+    order_items = []
     for ci in cart_items:
-        book = db.query(Book).filter(Book.book_id == ci.book_id).first()
-        if not book:
-            raise HTTPException(status_code=404, detail="BOOK_NOT_FOUND")
-
+        book = books[ci.book_id]
         oi = OrderItem(
             order_id=order.order_id,
             book_id=book.book_id,
@@ -52,17 +71,19 @@ def create_order_from_cart(
             quantity=ci.quantity,
         )
         db.add(oi)
-        db.commit()
-        db.refresh(oi)
+        order_items.append(oi)
 
-        items_out.append(OrderItemRead(
+    db.flush()   # order_item_id 확보 (커밋하면 만료돼서 아이템마다 다시 SELECT 됨)
+    items_out = [
+        OrderItemRead(
             order_item_id=oi.order_item_id,
             book_id=oi.book_id,
             title=oi.title,
             quantity=oi.quantity,
-        ))
+        )
+        for oi in order_items
+    ]
 
-    # 카트 비우기
     for ci in cart_items:
         db.delete(ci)
     db.commit()
@@ -80,52 +101,36 @@ def admin_list_orders(
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=100),
     sort: str = Query("order_id,desc"),
+    count: CountMode = Query(CountMode.exact, description="totalElements 계산 방식: exact | approx(테이블 통계) | none"),
     db: Session = Depends(get_db),
     admin_user=Depends(require_admin),
 ):
-    q = db.query(Order)
+    filters = []
 
     if status_filter:
-        q = q.filter(Order.status == status_filter)
+        filters.append(Order.status == status_filter)
+
+    q = db.query(Order).filter(*filters)
 
     # sort 파싱: "field,asc|desc"
     field, direction = (sort.split(",") + ["desc"])[:2]
     direction = direction.lower()
 
-    sort_map = {
-        "order_id": Order.order_id,
-        "created_at": Order.created_at,
-        "user_id": Order.user_id,
-        "status": Order.status,
-        "total_items": Order.total_items,
-    }
-    col = sort_map.get(field, Order.order_id)
+    col = ORDER_SORT_COLUMNS.get(field, Order.order_id)
     q = q.order_by(col.asc() if direction == "asc" else col.desc())
 
-    # totalElements / totalPages 계산은 offset/limit 전에
-    total = q.order_by(None).count()
-    orders = q.offset(page * size).limit(size).all()
-
-    content = [
-        {
-            "order_id": o.order_id,
-            "user_id": o.user_id,
-            "status": o.status,
-            "total_items": o.total_items,
-        }
-        for o in orders
-    ]
-
-    total = q.order_by(None).count()
+    total, exact = count_rows(
+        db, select(func.count()).select_from(Order).where(*filters), ["order"], count
+    )
     items = q.offset(page * size).limit(size).all()
-    total_pages = (total + size - 1) // size
 
     return {
         "content": items,
         "page": page,
         "size": size,
         "totalElements": total,
-        "totalPages": total_pages,
+        "totalPages": total_pages(total, size),
+        "totalExact": exact,
         "sort": sort,
     }
 
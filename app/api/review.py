@@ -1,30 +1,51 @@
 # app/api/reviews.py
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, update
 
-from app.db import get_db  # 프로젝트에 맞게 수정
+from app.db import get_db, get_read_db, get_async_read_db  # 프로젝트에 맞게 수정
 from app.core.security import get_current_user  # 프로젝트에 맞게 수정
+from app.core.etag import etag_matches, make_body_etag, not_modified, set_etag
+from app.core.pagination import apply_keyset, build_keyset_page, decode_cursor
+from app.models.books import Book
 from app.models.review import Review, ReviewLike, Comment, CommentLike
-from app.models.books import Book  # 프로젝트 Book 모델 import 경로 맞추기
+from app.models.users import User
+from app.core.book_cache import book_cache
+from app.core.book_ratings import STARS, apply_rating_change
+from app.core.like_counters import COMMENT, REVIEW, change_like_count, current_like_count
+from app.schemas.books import BookRead
 from app.schemas.review import (
-    ReviewCreate, ReviewUpdate, ReviewOut, ReviewListResponse, PageMeta,
+    ReviewCreate, ReviewUpdate, ReviewOut, ReviewListResponse, PageMeta, RatingSummary, UserSummary,
     CommentCreate, CommentUpdate, CommentOut, CommentListResponse
 )
 
 router = APIRouter(prefix="/api/v1", tags=["Reviews"])
 
 
-def _ensure_book(db: Session, book_id: int) -> Book:
-    book = db.get(Book, book_id)
-    if not book or getattr(book, "deleted_at", None) is not None:
+def _ensure_book(db: Session, book_id: int) -> BookRead:
+    book = book_cache.get(db, book_id)
+    if not book:
         raise HTTPException(status_code=404, detail="BOOK_NOT_FOUND")
     return book
 
 
+# 리뷰 목록용 book 집계 컬럼. PK 조회 1번, 목록 쿼리와 같은 세션(같은 primary/replica)에서 읽음
+_RATING_AGGREGATE_COLUMNS = (
+    Book.review_count, Book.rating_avg, *(getattr(Book, f"rating_{star}") for star in STARS)
+)
+
+
+async def _aread_rating_aggregates(db: AsyncSession, book_id: int):
+    row = (await db.execute(select(*_RATING_AGGREGATE_COLUMNS).where(Book.book_id == book_id))).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="BOOK_NOT_FOUND")
+    return row
+
+
 def _ensure_review(db: Session, review_id: int) -> Review:
     review = db.get(Review, review_id)
     if not review or review.deleted_at is not None:
@@ -39,6 +60,62 @@ def _ensure_comment(db: Session, comment_id: int) -> Comment:
     return c
 
 
+def _cas_failed(db: Session, review_id: int) -> None:
+    """조건부 UPDATE 가 0 행: 이미 삭제됐으면 404, 동시에 별점이 바뀌었으면 409."""
+    db.rollback()
+    _ensure_review(db, review_id)
+    raise HTTPException(status_code=409, detail="REVIEW_CONFLICT")
+
+
+# expand=user: 목록의 작성자 요약을 IN 쿼리 1번으로 (행마다 user JOIN / lazy load 안 함)
+_EXPANDABLE = {"user"}
+
+
+def _parse_expand(raw: str | None) -> set:
+    names = {name.strip() for name in raw.split(",") if name.strip()} if raw else set()
+    if names - _EXPANDABLE:
+        raise HTTPException(status_code=400, detail="INVALID_EXPAND")
+    return names
+
+
+def _user_summaries_query(rows):
+    user_ids = {row.user_id for row in rows}
+    return select(User.user_id, User.name).where(User.user_id.in_(user_ids))
+
+
+def _with_authors(items, summaries):
+    by_id = {row.user_id: UserSummary(user_id=row.user_id, name=row.name) for row in summaries}
+    for item in items:
+        item.author = by_id.get(item.user_id)
+    return items
+
+
+# sort=field,asc|desc 로 받을 수 있는 컬럼. 모르는 field 는 created_at
+# (book_id|review_id, deleted_at, 정렬컬럼, PK) 복합 인덱스로 필터 + 정렬 + keyset 이 인덱스 range scan 한 번
+REVIEW_SORT_COLUMNS = {
+    "created_at": Review.created_at,
+    "likes": Review.like_count,
+}
+COMMENT_SORT_COLUMNS = {
+    "created_at": Comment.created_at,
+    "likes": Comment.like_count,
+}
+
+_SORT_DESCRIPTION = "created_at|likes,asc|desc. likes 는 좋아요 수가 바뀌면 커서 페이지 사이에 순서가 바뀔 수 있음"
+_CURSOR_DESCRIPTION = "keyset 페이지네이션. 빈 값이면 첫 페이지, 이후엔 meta.nextCursor/prevCursor 를 그대로 전달"
+
+
+def _parse_sort(sort: str, columns, default_direction: str):
+    field, direction = (sort.split(",") + [default_direction])[:2]
+    col = columns.get(field, columns["created_at"])
+    descending = direction.lower() == "desc"
+    return col, descending, f"{col.key},{'desc' if descending else 'asc'}"
+
+
+def _offset_order(col, id_col, descending: bool):
+    return (col.desc(), id_col.desc()) if descending else (col.asc(), id_col.asc())
+
+
 # ---------- Reviews ----------
 @router.post("/books/{book_id}/reviews", response_model=ReviewOut, status_code=status.HTTP_201_CREATED)
 def create_review(
@@ -57,41 +134,74 @@ def create_review(
         like_count=0,
     )
     db.add(review)
+    apply_rating_change(db, book_id, added=body.rating)
     db.commit()
+    book_cache.invalidate(book_id)
     db.refresh(review)
     return review
 
 
 @router.get("/books/{book_id}/reviews", response_model=ReviewListResponse)
-def list_book_reviews(
+async def list_book_reviews(
     book_id: int,
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    sort: str = Query("created_at,desc", description=_SORT_DESCRIPTION),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
+    expand: str | None = Query(None, description="user: 리뷰마다 작성자 요약(author: user_id, name) 포함"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    _ensure_book(db, book_id)
-
-    total = db.scalar(
-        select(func.count()).select_from(Review).where(
-            Review.book_id == book_id,
-            Review.deleted_at.is_(None),
+    expand_names = _parse_expand(expand)
+    book = await _aread_rating_aggregates(db, book_id)
+    col, descending, sort_key = _parse_sort(sort, REVIEW_SORT_COLUMNS, "desc")
+
+    # 관계는 응답에 안 나가므로 로드 금지 (실수로 접근하면 N+1 대신 에러)
+    query = select(Review).options(raiseload("*")).where(
+        Review.book_id == book_id,
+        Review.deleted_at.is_(None),
+    )
+    # 전체 수는 book.review_count (리뷰 쓰기와 같은 트랜잭션에서 갱신되는 집계) → COUNT 안 함
+    # 도서 캐시 스냅샷이 아니라 페이지와 같은 세션에서 읽은 값이라 total 과 content 가 같은 시점
+    meta = PageMeta(size=size, total=book.review_count, sort=sort_key)
+    if cursor is not None:
+        decoded = decode_cursor(cursor, sort_key) if cursor else None
+        rows = (await db.scalars(apply_keyset(query, col, Review.review_id, descending, size, decoded))).all()
+        rows, meta.nextCursor, meta.prevCursor = build_keyset_page(
+            rows, sort_key, col.key, "review_id", size, decoded
         )
+    else:
+        meta.page = page
+        rows = (await db.scalars(
+            query.order_by(*_offset_order(col, Review.review_id, descending)).offset(page * size).limit(size)
+        )).all()
+    content = [ReviewOut.model_validate(row) for row in rows]
+    if "user" in expand_names and rows:
+        _with_authors(content, (await db.execute(_user_summaries_query(rows))).all())
+
+    # 별점 요약도 위에서 읽은 book 집계 컬럼 그대로 (review 집계 쿼리 없음)
+    rating = RatingSummary(
+        review_count=book.review_count,
+        rating_avg=book.rating_avg,
+        histogram={star: getattr(book, f"rating_{star}") for star in STARS},
     )
-
-    rows = db.scalars(
-        select(Review).where(
-            Review.book_id == book_id,
-            Review.deleted_at.is_(None),
-        ).order_by(Review.created_at.desc())
-        .offset(page * size).limit(size)
-    ).all()
-
-    return ReviewListResponse(content=rows, meta=PageMeta(page=page, size=size, total=total or 0))
+    return ReviewListResponse(content=content, meta=meta, rating=rating)
 
 
 @router.get("/reviews/{review_id}", response_model=ReviewOut)
-def get_review(review_id: int, db: Session = Depends(get_db)):
-    return _ensure_review(db, review_id)
+def get_review(
+    review_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    review = _ensure_review(db, review_id)
+    # 본문 해시가 클라이언트가 가진 것과 같으면 본문 없이 304
+    body = ReviewOut.model_validate(review)
+    etag = make_body_etag("review", body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return body
 
 
 @router.patch("/reviews/{review_id}", response_model=ReviewOut)
@@ -107,10 +217,21 @@ def update_review(
 
     if body.content is not None:
         review.content = body.content
-    if body.rating is not None:
-        review.rating = body.rating
+    if body.rating is not None and body.rating != review.rating:
+        # 읽은 별점 그대로일 때만 바꿈 → 동시 수정이 있어도 집계에 이전 별점이 두 번 빠지지 않음
+        old_rating = review.rating
+        changed = db.execute(
+            update(Review)
+            .where(Review.review_id == review_id, Review.rating == old_rating, Review.deleted_at.is_(None))
+            .values(rating=body.rating)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not changed:
+            _cas_failed(db, review_id)
+        apply_rating_change(db, review.book_id, added=body.rating, removed=old_rating)
 
     db.commit()
+    book_cache.invalidate(review.book_id)
     db.refresh(review)
     return review
 
@@ -125,9 +246,19 @@ def delete_review(
     if review.user_id != me.user_id and getattr(me, "role", None) != "admin":
         raise HTTPException(status_code=403, detail="FORBIDDEN")
 
-    # soft delete
-    review.deleted_at = func.now()
+    # soft delete. 아직 안 지워졌고 별점이 읽은 값 그대로일 때만 → 동시 삭제로 두 번 빼지 않음
+    book_id, rating = review.book_id, review.rating
+    deleted = db.execute(
+        update(Review)
+        .where(Review.review_id == review_id, Review.rating == rating, Review.deleted_at.is_(None))
+        .values(deleted_at=func.now())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not deleted:
+        _cas_failed(db, review_id)
+    apply_rating_change(db, book_id, removed=rating)
     db.commit()
+    book_cache.invalidate(book_id)
     return None
 
 
@@ -140,18 +271,20 @@ def like_review(
 ):
     review = _ensure_review(db, review_id)
 
-    like = ReviewLike(user_id=me.user_id, review_id=review.review_id)
-    db.add(like)
+    review_id = review.review_id
+    db.add(ReviewLike(user_id=me.user_id, review_id=review_id))
 
     try:
-        # 중복 좋아요는 DB unique constraint로 방어
-        review.like_count += 1
+        # 중복 좋아요는 DB unique constraint로 방어. 카운트는 like_count = like_count + 1 (원자적)
+        db.flush()
+        change_like_count(db, REVIEW, review_id, +1)
+        like_count = current_like_count(db, REVIEW, review_id)
         db.commit()
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=409, detail="DUPLICATE_REVIEW_LIKE")
 
-    return {"review_id": review.review_id, "like_count": review.like_count}
+    return {"review_id": review_id, "like_count": like_count}
 
 
 @router.delete("/reviews/{review_id}/like", status_code=status.HTTP_200_OK)
@@ -171,11 +304,14 @@ def unlike_review(
     if not row:
         raise HTTPException(status_code=404, detail="REVIEW_LIKE_NOT_FOUND")
 
+    review_id = review.review_id
     db.delete(row)
-    review.like_count = max(0, review.like_count - 1)
+    db.flush()
+    change_like_count(db, REVIEW, review_id, -1)
+    like_count = current_like_count(db, REVIEW, review_id)
     db.commit()
 
-    return {"review_id": review.review_id, "like_count": review.like_count}
+    return {"review_id": review_id, "like_count": like_count}
 
 
 # ---------- Comments ----------
@@ -205,26 +341,43 @@ def list_comments(
     review_id: int,
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    sort: str = Query("created_at,asc", description=_SORT_DESCRIPTION),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
+    expand: str | None = Query(None, description="user: 댓글마다 작성자 요약(author: user_id, name) 포함"),
+    db: Session = Depends(get_read_db),
 ):
+    expand_names = _parse_expand(expand)
     review = _ensure_review(db, review_id)
+    col, descending, sort_key = _parse_sort(sort, COMMENT_SORT_COLUMNS, "asc")
 
-    total = db.scalar(
-        select(func.count()).select_from(Comment).where(
-            Comment.review_id == review.review_id,
-            Comment.deleted_at.is_(None),
-        )
+    query = select(Comment).options(raiseload("*")).where(
+        Comment.review_id == review.review_id,
+        Comment.deleted_at.is_(None),
     )
-
-    rows = db.scalars(
-        select(Comment).where(
-            Comment.review_id == review.review_id,
-            Comment.deleted_at.is_(None),
-        ).order_by(Comment.created_at.asc())
-        .offset(page * size).limit(size)
-    ).all()
-
-    return CommentListResponse(content=rows, meta=PageMeta(page=page, size=size, total=total or 0))
+    meta = PageMeta(size=size, sort=sort_key)
+    if cursor is not None:
+        # 커서 모드는 COUNT 없이 다음/이전 커서만
+        decoded = decode_cursor(cursor, sort_key) if cursor else None
+        rows = db.scalars(apply_keyset(query, col, Comment.comment_id, descending, size, decoded)).all()
+        rows, meta.nextCursor, meta.prevCursor = build_keyset_page(
+            rows, sort_key, col.key, "comment_id", size, decoded
+        )
+    else:
+        meta.page = page
+        meta.total = db.scalar(
+            select(func.count()).select_from(Comment).where(
+                Comment.review_id == review.review_id,
+                Comment.deleted_at.is_(None),
+            )
+        ) or 0
+        rows = db.scalars(
+            query.order_by(*_offset_order(col, Comment.comment_id, descending)).offset(page * size).limit(size)
+        ).all()
+    content = [CommentOut.model_validate(row) for row in rows]
+    if "user" in expand_names and rows:
+        _with_authors(content, db.execute(_user_summaries_query(rows)).all())
+
+    return CommentListResponse(content=content, meta=meta)
 
 
 @router.patch("/comments/{comment_id}", response_model=CommentOut)
@@ -270,17 +423,19 @@ def like_comment(
 ):
     c = _ensure_comment(db, comment_id)
 
-    like = CommentLike(user_id=me.user_id, comment_id=c.comment_id)
-    db.add(like)
+    comment_id = c.comment_id
+    db.add(CommentLike(user_id=me.user_id, comment_id=comment_id))
 
     try:
-        c.like_count += 1
+        db.flush()
+        change_like_count(db, COMMENT, comment_id, +1)
+        like_count = current_like_count(db, COMMENT, comment_id)
         db.commit()
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=409, detail="DUPLICATE_COMMENT_LIKE")
 
-    return {"comment_id": c.comment_id, "like_count": c.like_count}
+    return {"comment_id": comment_id, "like_count": like_count}
 
 
 @router.delete("/comments/{comment_id}/like", status_code=status.HTTP_200_OK)
@@ -300,8 +455,11 @@ def unlike_comment(
     if not row:
         raise HTTPException(status_code=404, detail="COMMENT_LIKE_NOT_FOUND")
 
+    comment_id = c.comment_id
     db.delete(row)
-    c.like_count = max(0, c.like_count - 1)
+    db.flush()
+    change_like_count(db, COMMENT, comment_id, -1)
+    like_count = current_like_count(db, COMMENT, comment_id)
     db.commit()
 
-    return {"comment_id": c.comment_id, "like_count": c.like_count}
+    return {"comment_id": comment_id, "like_count": like_count}
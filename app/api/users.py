@@ -9,16 +9,35 @@ from datetime import datetime
 
 from app.models.users import User
 from app.schemas.users import UserCreate, UserRead, UserUpdateFull, UserUpdatePartial
-from app.core.security import hash_password
+from app.core.security import ahash_password
 from app.core.security import get_current_admin
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from app.db import get_db
-from app.core.security import get_current_user
+from app.core.security import get_current_user, invalidate_principal
+from app.core.count_cache import CountMode, count_rows, total_pages
+from app.core.fields import dump_page, parse_fields
+from starlette.concurrency import run_in_threadpool
 
 
 
 router = APIRouter(prefix="/api/v1/users", tags=["users"])
 
+# 회원 목록/export 의 sort 컬럼. 모르는 field 는 created_at
+USER_SORT_COLUMNS = {
+    "created_at": User.created_at,
+    "user_id": User.user_id,
+    "name": User.name,
+    "email": User.email,
+    "status": User.status,
+    "role": User.role,
+}
+
+
+def user_keyword_filter(keyword: str):
+    like = f"%{keyword}%"
+    return (User.name.ilike(like)) | (User.email.ilike(like))
+
 
 @router.get("/me", response_model=UserRead)
 def get_me(
@@ -50,17 +69,26 @@ def update_me_partial(
     user.updated_at = datetime.utcnow()
 
     db.commit()
+    invalidate_principal(user.user_id)
     db.refresh(user)
     return user
 
+def _commit_and_refresh(db: Session, user: User) -> None:
+    db.commit()
+    db.refresh(user)
+
+
 @router.post(
     "",
     response_model=UserRead,
     status_code=status.HTTP_201_CREATED,
 )
-def create_user(payload: UserCreate, db: Session = Depends(get_db)):
+async def create_user(payload: UserCreate, db: Session = Depends(get_db)):
+    # bcrypt 는 전용 풀에서 await, DB 작업만 스레드풀에서 (로그인과 같은 방식)
     # 이메일 중복 체크
-    existing = db.query(User).filter(User.email == payload.email).first()
+    existing = await run_in_threadpool(
+        lambda: db.query(User).filter(User.email == payload.email).first()
+    )
     if existing:
         # 나중에 에러 포맷 통일할 때 수정
         raise HTTPException(
@@ -70,7 +98,7 @@ def create_user(payload: UserCreate, db: Session = Depends(get_db)):
 
     user = User(
         email=payload.email,
-        password=hash_password(payload.password),
+        password=await ahash_password(payload.password),
         name=payload.name,
         is_korean=payload.is_korean,
         address=payload.address,
@@ -82,8 +110,7 @@ def create_user(payload: UserCreate, db: Session = Depends(get_db)):
         status="active",
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await run_in_threadpool(_commit_and_refresh, db, user)
     return user
 
 
@@ -113,6 +140,7 @@ def update_me_full(
     user.updated_at = datetime.utcnow()
 
     db.commit()
+    invalidate_principal(user.user_id)
     db.refresh(user)
     return user
 
@@ -134,6 +162,7 @@ def deactivate_me(
 
     db.add(current_user)
     db.commit()
+    invalidate_principal(current_user.user_id)
     # 204라서 바디 없이 리턴
     return
 
@@ -146,8 +175,10 @@ def delete_me_permanent(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
+    user_id = current_user.user_id
     db.delete(current_user)
     db.commit()
+    invalidate_principal(user_id)
     return
 
 @router.get("", response_model=UserListPage)
@@ -158,37 +189,36 @@ def list_users(
     size: int = Query(20, ge=1, le=100),
     keyword: Optional[str] = Query(None),
     sort: str = Query("created_at,desc"),  # 추가
+    count: CountMode = Query(CountMode.exact, description="totalElements 계산 방식: exact | approx(테이블 통계) | none"),
+    fields: Optional[str] = Query(None, description="응답에 넣을 필드 (예: user_id,email,name,role). profile 을 빼면 SELECT 에서도 빠짐"),
 ):
-    query = db.query(User)
+    fieldset = parse_fields(fields, User, UserRead, pk="user_id")
+    filters = []
 
     if keyword:
-        like = f"%{keyword}%"
-        query = query.filter((User.name.ilike(like)) | (User.email.ilike(like)))
+        filters.append(user_keyword_filter(keyword))
+
+    query = db.query(User).filter(*filters)
 
     field, direction = (sort.split(",") + ["desc"])[:2]
     direction = direction.lower()
-    sort_map = {
-        "created_at": User.created_at,
-        "user_id": User.user_id,
-        "name": User.name,
-        "email": User.email,
-        "status": User.status,
-        "role": User.role,
-    }
-    col = sort_map.get(field, User.created_at)
+    col = USER_SORT_COLUMNS.get(field, User.created_at)
     query = query.order_by(col.asc() if direction == "asc" else col.desc())
-
+    if fieldset:
+        query = query.options(*fieldset.options())
 
     items = query.offset(page * size).limit(size).all()
-    total = query.order_by(None).count()
-    total_pages = (total + size - 1) // size
+    total, exact = count_rows(
+        db, select(func.count()).select_from(User).where(*filters), ["user"], count
+    )
 
     return {
-        "content": items,
+        "content": dump_page(items, fieldset),
         "page": page,
         "size": size,
         "totalElements": total,
-        "totalPages": total_pages,
+        "totalPages": total_pages(total, size),
+        "totalExact": exact,
         "sort": sort,
     }
 
@@ -239,5 +269,6 @@ def update_user_status(
         user.role = data["role"]
 
     db.commit()
+    invalidate_principal(user.user_id)
     db.refresh(user)
     return user
\ No newline at end of file
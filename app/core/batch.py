@@ -0,0 +1,41 @@
+# app/core/batch.py
+"""목록 API 의 ids= 일괄 조회 (GET /books?ids=1,2,3, GET /authors?ids=...).
+
+- ids 는 콤마 구분 정수. 최대 BATCH_GET_MAX_IDS 개 (중복은 허용, 조회는 한 번)
+- 결과는 요청 순서 그대로, 없는 id 자리는 null + missing 목록에 id
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.error_codes import ErrorCode, raise_http
+
+settings = get_settings()
+
+
+def parse_ids(raw: Optional[str]) -> Optional[List[int]]:
+    """ids 쿼리 파라미터 파싱. 없으면 None (= 일반 목록)."""
+    if raw is None:
+        return None
+    parts = [part.strip() for part in raw.split(",") if part.strip()]
+    try:
+        ids = [int(part) for part in parts]
+    except ValueError:
+        raise_http(ErrorCode.INVALID_REQUEST, message="ids must be comma separated integers")
+    if not ids:
+        raise_http(ErrorCode.INVALID_REQUEST, message="ids is empty")
+    if len(ids) > settings.BATCH_GET_MAX_IDS:
+        raise_http(
+            ErrorCode.INVALID_REQUEST,
+            message=f"too many ids (max {settings.BATCH_GET_MAX_IDS})",
+            details={"count": len(ids), "max": settings.BATCH_GET_MAX_IDS},
+        )
+    return ids
+
+
+def in_request_order(ids: List[int], found: Dict[int, Any]) -> Tuple[List[Any], List[int]]:
+    """(요청 순서대로 결과(없으면 None), 없는 id 목록)."""
+    content = [found.get(i) for i in ids]
+    missing = list(dict.fromkeys(i for i in ids if i not in found))
+    return content, missing
@@ -0,0 +1,214 @@
+# app/core/book_cache.py
+"""도서 스냅샷(BookRead) read-through 캐시.
+
+- TTLCache(LRU + TTL) 에 book_id -> BookRead 저장. 없는 book_id 도 잠깐(NEGATIVE_TTL_SEC) 기억
+- 같은 book_id 를 동시에 여러 요청이 놓치면 DB 조회는 한 번만 (single-flight)
+  동기 핸들러(스레드)끼리는 Future, async 핸들러끼리는 asyncio.Future 로 합침
+- create/update/delete 커밋 후 invalidate(). 조회 도중 무효화가 끼면 그 결과는 캐시에 안 넣음
+- miss 는 항상 primary 에서 읽음 (핸들러가 replica 세션을 넘겨도). replica 로 채우면 방금 invalidate 한
+  항목을 아직 복제 안 된 옛 값으로 다시 채워서 TTL 내내 옛 재고/별점이 남을 수 있음
+- 다른 워커 프로세스의 변경은 BOOK_CACHE_TTL_SEC 만큼 늦게 반영될 수 있음
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.db import SessionLocal, get_async_sessionmaker, is_replica_session
+from app.models.books import Book
+from app.schemas.books import BookRead
+
+settings = get_settings()
+
+NEGATIVE_TTL_SEC = 5.0
+_NOT_FOUND = object()   # 없는 book_id 캐시용 표식
+
+
+def _snapshot(book: Optional[Book]):
+    return BookRead.model_validate(book) if book is not None else _NOT_FOUND
+
+
+# ===== DB 조회 (replica 세션이면 primary 세션을 따로 열어서) =====
+def _load_one(db: Session, book_id: int):
+    if is_replica_session(db):
+        with SessionLocal() as primary:
+            return _snapshot(primary.get(Book, book_id))
+    return _snapshot(db.get(Book, book_id))
+
+
+def _load_many(db: Session, book_ids: List[int]) -> Dict[int, BookRead]:
+    if is_replica_session(db):
+        with SessionLocal() as primary:
+            return _load_many(primary, book_ids)
+    return {book.book_id: _snapshot(book) for book in db.scalars(select(Book).where(Book.book_id.in_(book_ids)))}
+
+
+async def _aload_one(db: AsyncSession, book_id: int):
+    if is_replica_session(db):
+        async with get_async_sessionmaker()() as primary:
+            return _snapshot(await primary.get(Book, book_id))
+    return _snapshot(await db.get(Book, book_id))
+
+
+async def _aload_many(db: AsyncSession, book_ids: List[int]) -> Dict[int, BookRead]:
+    if is_replica_session(db):
+        async with get_async_sessionmaker()() as primary:
+            return await _aload_many(primary, book_ids)
+    books = (await db.scalars(select(Book).where(Book.book_id.in_(book_ids)))).all()
+    return {book.book_id: _snapshot(book) for book in books}
+
+
+class BookCache:
+    def __init__(self, max_size: int, ttl: float):
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+        self._lock = threading.Lock()
+        self._inflight: Dict[int, Future] = {}
+        self._ainflight: Dict[int, asyncio.Future] = {}
+        # invalidate 할 때마다 증가. 조회 시작 때와 다르면 (그 사이 쓰기가 있었으므로) 결과를 캐시에 안 넣음
+        self._epoch = 0
+        self.loads = 0
+        self.coalesced = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.max_size > 0
+
+    def _lookup(self, book_id: int):
+        return self._cache.get(book_id, None)
+
+    def _store(self, book_id: int, value, epoch: int) -> None:
+        with self._lock:
+            if epoch != self._epoch:
+                return
+        ttl = NEGATIVE_TTL_SEC if value is _NOT_FOUND else None
+        self._cache.set(book_id, value, ttl=ttl)
+
+    @staticmethod
+    def _result(value) -> Optional[BookRead]:
+        return None if value is _NOT_FOUND else value
+
+    # ----- 동기 (Session) -----
+    def get(self, db: Session, book_id: int) -> Optional[BookRead]:
+        cached = self._lookup(book_id)
+        if cached is not None:
+            return self._result(cached)
+
+        with self._lock:
+            future = self._inflight.get(book_id)
+            leader = future is None
+            if leader:
+                future = self._inflight[book_id] = Future()
+                epoch = self._epoch
+            else:
+                self.coalesced += 1
+        if not leader:
+            return self._result(future.result())
+
+        try:
+            self.loads += 1
+            value = _load_one(db, book_id)
+            self._store(book_id, value, epoch)
+            future.set_result(value)
+            return self._result(value)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(book_id, None)
+
+    def get_many(self, db: Session, book_ids: Iterable[int]) -> Dict[int, BookRead]:
+        """캐시에 없는 것만 IN 쿼리 한 번으로. 없는 book_id 는 결과 dict 에서 빠짐."""
+        found, missing = self._split(book_ids)
+        if missing:
+            with self._lock:
+                epoch = self._epoch
+            self.loads += 1
+            found.update(self._fill(missing, _load_many(db, missing), epoch))
+        return found
+
+    # ----- async (AsyncSession) -----
+    async def aget(self, db: AsyncSession, book_id: int) -> Optional[BookRead]:
+        cached = self._lookup(book_id)
+        if cached is not None:
+            return self._result(cached)
+
+        future = self._ainflight.get(book_id)
+        if future is not None:
+            self.coalesced += 1
+            # shield: 기다리던 요청이 취소돼도 대표 조회는 계속
+            return self._result(await asyncio.shield(future))
+
+        future = self._ainflight[book_id] = asyncio.get_running_loop().create_future()
+        with self._lock:
+            epoch = self._epoch
+        try:
+            self.loads += 1
+            value = await _aload_one(db, book_id)
+            self._store(book_id, value, epoch)
+            future.set_result(value)
+            return self._result(value)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # 기다리는 쪽이 없으면 "exception was never retrieved" 경고가 나므로 한 번 읽어둠
+            future.exception()
+            raise
+        finally:
+            self._ainflight.pop(book_id, None)
+
+    async def aget_many(self, db: AsyncSession, book_ids: Iterable[int]) -> Dict[int, BookRead]:
+        found, missing = self._split(book_ids)
+        if missing:
+            with self._lock:
+                epoch = self._epoch
+            self.loads += 1
+            found.update(self._fill(missing, await _aload_many(db, missing), epoch))
+        return found
+
+    # ----- 공통 -----
+    def _split(self, book_ids: Iterable[int]):
+        found: Dict[int, BookRead] = {}
+        missing: List[int] = []
+        for book_id in dict.fromkeys(book_ids):
+            cached = self._lookup(book_id)
+            if cached is None:
+                missing.append(book_id)
+            elif cached is not _NOT_FOUND:
+                found[book_id] = cached
+        return found, missing
+
+    def _fill(self, missing: List[int], loaded: Dict[int, BookRead], epoch: int) -> Dict[int, BookRead]:
+        for book_id in missing:
+            self._store(book_id, loaded.get(book_id, _NOT_FOUND), epoch)
+        return loaded
+
+    def invalidate(self, book_id: int) -> None:
+        """도서 생성/수정/삭제 커밋 후 호출."""
+        with self._lock:
+            self._epoch += 1
+        self._cache.invalidate(book_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, object]:
+        stats = dict(self._cache.stats())
+        stats["loads"] = self.loads
+        stats["coalesced"] = self.coalesced
+        return stats
+
+
+book_cache = BookCache(
+    max_size=settings.BOOK_CACHE_MAX_SIZE,
+    ttl=settings.BOOK_CACHE_TTL_SEC,
+)
@@ -0,0 +1,194 @@
+# app/core/book_facets.py
+"""도서 목록 필터 + facet 집계.
+
+    GET /api/v1/books?min_price=10000&max_price=30000&author_id=1&author_id=2&status=active
+                      &published_from=2020-01-01&published_to=2024-12-31&in_stock=true&facets=true
+
+- 필터는 목록의 모든 모드(offset / cursor / relevance)와 관리자 도서 export 에 공통으로 적용
+- facets=true 면 payload.facets 에 저자별 / 상태별 / 가격대별 도서 수
+  전체 수(totalElements)와 facet 들을 UNION ALL 로 묶어 쿼리 1번에 계산
+  (결과는 totalElements 와 같은 count 캐시에 저장 → book/authors 쓰기 커밋 시 무효화)
+- facet 은 "다른 필터는 적용하고 자기 차원 필터만 뺀" 수
+  예) author_id=1 로 걸러 보고 있어도 author facet 은 다른 저자들의 수도 보여줘서 다중 선택 UI 에 그대로 사용
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import Query
+from sqlalchemy import String, case, cast, func, literal, literal_column, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.count_cache import acached_rows
+from app.core.error_codes import ErrorCode, raise_http
+from app.models.books import Author, Book
+
+settings = get_settings()
+
+PRICE_BANDS: List[int] = sorted({int(bound) for bound in settings.FACET_PRICE_BANDS.split(",") if bound.strip()})
+
+
+@dataclass
+class BookFilters:
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    author_ids: List[int] = field(default_factory=list)
+    status: Optional[str] = None
+    published_from: Optional[date] = None
+    published_to: Optional[date] = None
+    in_stock: Optional[bool] = None
+
+    def _by_dimension(self) -> Dict[str, List[Any]]:
+        price = []
+        if self.min_price is not None:
+            price.append(Book.price >= self.min_price)
+        if self.max_price is not None:
+            price.append(Book.price <= self.max_price)
+
+        published = []
+        if self.published_from is not None:
+            published.append(Book.published_date >= self.published_from)
+        if self.published_to is not None:
+            published.append(Book.published_date <= self.published_to)
+
+        stock = []
+        if self.in_stock is not None:
+            stock.append(Book.stock > 0 if self.in_stock else Book.stock <= 0)
+
+        return {
+            "price": price,
+            "author": [Book.author_id.in_(self.author_ids)] if self.author_ids else [],
+            "status": [Book.status == self.status] if self.status else [],
+            "published": published,
+            "stock": stock,
+        }
+
+    def conditions(self, exclude: Optional[str] = None) -> List[Any]:
+        """WHERE 조건 목록. exclude 는 facet 계산 시 뺄 차원 (price / author / status)."""
+        return [
+            condition
+            for dimension, conditions in self._by_dimension().items()
+            if dimension != exclude
+            for condition in conditions
+        ]
+
+
+def book_filter_params(
+    min_price: Optional[int] = Query(None, ge=0, description="가격 하한 (포함)"),
+    max_price: Optional[int] = Query(None, ge=0, description="가격 상한 (포함)"),
+    author_id: Optional[List[int]] = Query(None, description="저자 id. 여러 번 지정 가능 (author_id=1&author_id=2)"),
+    status: Optional[str] = Query(None, description="도서 상태 (예: active)"),
+    published_from: Optional[date] = Query(None, description="출간일 하한 (YYYY-MM-DD, 포함)"),
+    published_to: Optional[date] = Query(None, description="출간일 상한 (YYYY-MM-DD, 포함)"),
+    in_stock: Optional[bool] = Query(None, description="true: 재고 있음만, false: 품절만"),
+) -> BookFilters:
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise_http(
+            ErrorCode.INVALID_REQUEST,
+            message="min_price must be <= max_price",
+            details={"min_price": min_price, "max_price": max_price},
+        )
+    if published_from is not None and published_to is not None and published_from > published_to:
+        raise_http(
+            ErrorCode.INVALID_REQUEST,
+            message="published_from must be <= published_to",
+            details={"published_from": str(published_from), "published_to": str(published_to)},
+        )
+    if author_id and len(author_id) > settings.BATCH_GET_MAX_IDS:
+        raise_http(
+            ErrorCode.INVALID_REQUEST,
+            message=f"too many author_id (max {settings.BATCH_GET_MAX_IDS})",
+            details={"count": len(author_id), "max": settings.BATCH_GET_MAX_IDS},
+        )
+    return BookFilters(
+        min_price=min_price,
+        max_price=max_price,
+        author_ids=list(dict.fromkeys(author_id or [])),
+        status=status,
+        published_from=published_from,
+        published_to=published_to,
+        in_stock=in_stock,
+    )
+
+
+# ===== facet 집계 =====
+def _price_band():
+    # 경계값은 설정에서 온 정수라 리터럴로 넣음 → SELECT / GROUP BY 가 같은 식이 됨 (ONLY_FULL_GROUP_BY)
+    if not PRICE_BANDS:
+        return literal_column("0")
+    return case(
+        *(
+            (Book.price < literal_column(str(bound)), literal_column(str(index)))
+            for index, bound in enumerate(PRICE_BANDS)
+        ),
+        else_=literal_column(str(len(PRICE_BANDS))),
+    )
+
+
+def _facet_query(base: Sequence[Any], filters: BookFilters):
+    """(facet, value, label, count) 행들의 UNION ALL. facet = total | author | status | price."""
+    no_label = cast(null(), String)
+
+    total = select(
+        literal("total").label("facet"), no_label.label("value"), no_label.label("label"), func.count().label("cnt")
+    ).select_from(Book).where(*base, *filters.conditions())
+
+    # 저자는 많을 수 있어서 상위 N 명만 (LIMIT 은 UNION 가지 안에서 쓰려고 서브쿼리로)
+    top_authors = (
+        select(Book.author_id.label("author_id"), func.count().label("cnt"))
+        .where(*base, *filters.conditions(exclude="author"))
+        .group_by(Book.author_id)
+        .order_by(func.count().desc(), Book.author_id)
+        .limit(settings.FACET_AUTHOR_LIMIT)
+        .subquery()
+    )
+    authors = select(
+        literal("author"), cast(top_authors.c.author_id, String), Author.name, top_authors.c.cnt
+    ).select_from(top_authors.join(Author, Author.author_id == top_authors.c.author_id))
+
+    statuses = (
+        select(literal("status"), Book.status, no_label, func.count())
+        .where(*base, *filters.conditions(exclude="status"))
+        .group_by(Book.status)
+    )
+
+    band = _price_band()
+    prices = (
+        select(literal("price"), cast(band, String), no_label, func.count())
+        .where(*base, *filters.conditions(exclude="price"))
+        .group_by(band)
+    )
+
+    return union_all(total, authors, statuses, prices)
+
+
+def _price_buckets(counts: Dict[int, int]) -> List[Dict[str, Any]]:
+    bounds = [0, *PRICE_BANDS, None]
+    return [
+        {"min": bounds[index], "max": bounds[index + 1], "count": counts.get(index, 0)}
+        for index in range(len(bounds) - 1)
+    ]
+
+
+async def afacet_counts(db: AsyncSession, base: Sequence[Any], filters: BookFilters):
+    """(전체 수, facets dict). base 는 키워드 조건 등 facet 과 무관하게 항상 거는 조건."""
+    rows = await acached_rows(db, _facet_query(base, filters), ["book", "authors"])
+
+    total = 0
+    authors, statuses, prices = [], [], {}
+    for facet, value, label, count in rows:
+        if facet == "total":
+            total = count
+        elif facet == "author":
+            authors.append({"authorId": int(value), "name": label, "count": count})
+        elif facet == "status":
+            statuses.append({"value": value, "count": count})
+        else:
+            prices[int(value)] = count
+
+    authors.sort(key=lambda item: (-item["count"], item["authorId"]))
+    statuses.sort(key=lambda item: (-item["count"], item["value"]))
+    return total, {"author": authors, "status": statuses, "price": _price_buckets(prices)}
@@ -0,0 +1,259 @@
+# app/core/book_import.py
+"""도서 일괄 등록 (CSV / NDJSON).
+
+    POST /api/v1/books/import  (Content-Type: text/csv | application/x-ndjson)
+    python manage.py import-books catalog.csv
+
+- 파일을 한 줄씩 읽어서 BOOK_IMPORT_CHUNK_SIZE 행 단위로 처리 (파일 전체를 메모리에 안 올림)
+- 청크마다
+    1) BookCreate 와 같은 타입으로 청크 단위 검증 (빈 문자열은 null)
+    2) author_id 존재 여부: IN 쿼리 1번
+    3) ISBN 중복: 파일 안(앞쪽 행) + DB 에 이미 있는 것 IN 쿼리 1번
+    4) 통과한 행만 INSERT executemany 1번 → 커밋
+  실패한 행은 건너뛰고 행 번호/사유를 리포트에 남김 (배치 전체를 중단하지 않음)
+- 검사와 INSERT 사이에 다른 요청이 같은 ISBN 을 넣거나 저자를 지워서 IntegrityError 가 나면
+  그 청크만 SAVEPOINT 로 한 행씩 다시 넣어서 충돌 행을 골라냄
+  (실패한 행은 저자/ISBN 을 다시 조회해서 INVALID_AUTHOR_ID / ISBN_CONFLICT 로 구분)
+- 청크 단위 커밋이라 중간에 실패해도 앞 청크들은 남음 (all-or-nothing 아님)
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing_extensions import NotRequired, TypedDict
+
+from app.core.book_cache import book_cache
+from app.core.config import get_settings
+from app.core.search import search_index
+from app.models.books import Author, Book
+from app.schemas.books import BookCreate
+
+settings = get_settings()
+
+FORMATS = ("csv", "ndjson")
+_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+def detect_format(content_type: Optional[str], filename: Optional[str] = None) -> Optional[str]:
+    if content_type:
+        fmt = _CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+        if fmt:
+            return fmt
+    if filename:
+        lowered = filename.lower()
+        if lowered.endswith(".csv"):
+            return "csv"
+        if lowered.endswith((".ndjson", ".jsonl")):
+            return "ndjson"
+    return None
+
+
+# ===== 파싱 =====
+def iter_rows(fileobj: IO[bytes], fmt: str) -> Iterator[Tuple[int, Any]]:
+    """(행 번호, dict 또는 파싱 에러 메시지). CSV 는 헤더 다음 행이 1번."""
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for line_no, row in enumerate(reader, start=1):
+            if None in row:
+                yield line_no, "too many columns"
+            else:
+                yield line_no, row
+        return
+
+    for line_no, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_no, f"invalid json: {exc.msg}"
+            continue
+        yield line_no, row if isinstance(row, dict) else "each line must be a JSON object"
+
+
+# ===== 리포트 =====
+@dataclass
+class ImportReport:
+    total: int = 0
+    inserted: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    def fail(self, row: int, code: str, message: str, isbn: Optional[str] = None) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.BOOK_IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "isbn": isbn, "code": code, "message": message})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda error: error["row"]),
+            "errorsTruncated": self.failed > len(self.errors),
+            "elapsedMs": round(self.elapsed_ms, 1),
+        }
+
+
+# ===== 등록 =====
+def _clean(row: Dict[str, Any]) -> Dict[str, Any]:
+    # CSV 빈 칸("")/null 은 값이 없는 것으로 → 기본값(stock=0, status=active 등) 적용, 필수면 "Field required"
+    return {key: value for key, value in row.items() if key and value != "" and value is not None}
+
+
+# BookCreate 와 같은 필드/타입의 TypedDict. 모델 인스턴스를 행마다 만들지 않고
+# 청크 전체를 한 번에 검증 (pydantic-core 안에서 끝나서 행당 비용이 훨씬 작음)
+_FIELDS = BookCreate.model_fields
+_DEFAULTS = {name: info.default for name, info in _FIELDS.items() if not info.is_required()}
+_ImportRow = TypedDict(
+    "_ImportRow",
+    {name: info.annotation if info.is_required() else NotRequired[info.annotation] for name, info in _FIELDS.items()},
+)
+_rows_adapter = TypeAdapter(List[_ImportRow])
+
+
+def _validate(chunk: List[Tuple[int, Any]], report: ImportReport) -> List[Tuple[int, Dict[str, Any]]]:
+    candidates = []
+    for line_no, row in chunk:
+        if isinstance(row, str):
+            report.fail(line_no, "VALIDATION_ERROR", row)
+        else:
+            candidates.append((line_no, _clean(row)))
+
+    try:
+        validated = _rows_adapter.validate_python([row for _, row in candidates])
+    except ValidationError as exc:
+        # 행마다 첫 번째 에러만 리포트하고, 나머지 행으로 다시 검증
+        bad: Dict[int, Dict[str, Any]] = {}
+        for error in exc.errors():
+            bad.setdefault(error["loc"][0], error)
+        for index, error in sorted(bad.items()):
+            line_no, row = candidates[index]
+            where = ".".join(str(part) for part in error["loc"][1:])
+            report.fail(line_no, "VALIDATION_ERROR", f"{where}: {error['msg']}", row.get("isbn"))
+        candidates = [candidate for index, candidate in enumerate(candidates) if index not in bad]
+        validated = _rows_adapter.validate_python([row for _, row in candidates])
+
+    valid = []
+    for (line_no, _), values in zip(candidates, validated):
+        values = {**_DEFAULTS, **values}
+        if values["isbn"] is not None:
+            values["isbn"] = values["isbn"].strip() or None
+        valid.append((line_no, values))
+    return valid
+
+
+# ORM bulk insert(insert(Book)) 는 행마다 매핑/기본값 처리를 거쳐서 느림 → 테이블 INSERT 로 executemany
+_INSERT = Book.__table__.insert()
+
+
+def _conflict_reason(db: Session, values: Dict[str, Any]) -> Tuple[str, str]:
+    # IntegrityError 만으로는 FK(author) 인지 UNIQUE(isbn) 인지 모름 → 실패한 행만 다시 확인
+    if db.get(Author, values["author_id"]) is None:
+        return "INVALID_AUTHOR_ID", "author_id does not exist"
+    isbn = values["isbn"]
+    if isbn is not None and db.scalar(select(Book.book_id).where(Book.isbn == isbn)) is not None:
+        return "ISBN_CONFLICT", "isbn already exists"
+    return "CONSTRAINT_VIOLATION", "row violates a database constraint"
+
+
+def _insert_rows_one_by_one(db: Session, rows: List[Tuple[int, Dict[str, Any]]], report: ImportReport) -> None:
+    for line_no, values in rows:
+        try:
+            with db.begin_nested():
+                db.execute(_INSERT, [values])
+            report.inserted += 1
+        except IntegrityError:
+            code, message = _conflict_reason(db, values)
+            report.fail(line_no, code, message, values["isbn"])
+
+
+def _import_chunk(
+    db: Session,
+    chunk: List[Tuple[int, Any]],
+    seen_isbns: Set[str],
+    report: ImportReport,
+) -> None:
+    rows = _validate(chunk, report)
+    if not rows:
+        return
+
+    author_ids = {values["author_id"] for _, values in rows}
+    known_authors = set(db.scalars(select(Author.author_id).where(Author.author_id.in_(author_ids))))
+
+    isbns = {values["isbn"] for _, values in rows if values["isbn"] is not None}
+    taken = set(db.scalars(select(Book.isbn).where(Book.isbn.in_(isbns)))) if isbns else set()
+
+    to_insert = []
+    for line_no, values in rows:
+        isbn = values["isbn"]
+        if values["author_id"] not in known_authors:
+            report.fail(line_no, "INVALID_AUTHOR_ID", "author_id does not exist", isbn)
+        elif isbn is not None and (isbn in taken or isbn in seen_isbns):
+            report.fail(line_no, "ISBN_CONFLICT", "isbn already exists", isbn)
+        else:
+            if isbn is not None:
+                seen_isbns.add(isbn)
+            to_insert.append((line_no, values))
+    if not to_insert:
+        return
+
+    try:
+        db.execute(_INSERT, [values for _, values in to_insert])
+        db.commit()
+        report.inserted += len(to_insert)
+    except IntegrityError:
+        # 검사 이후 다른 트랜잭션이 같은 ISBN 을 넣었거나 저자를 지운 경우: 이 청크만 한 행씩
+        db.rollback()
+        _insert_rows_one_by_one(db, to_insert, report)
+        db.commit()
+
+
+def import_books(
+    db: Session,
+    rows: Iterable[Tuple[int, Any]],
+    chunk_size: Optional[int] = None,
+) -> ImportReport:
+    """iter_rows() 결과를 청크 단위로 등록. 끝나면 검색 색인/도서 캐시 갱신."""
+    chunk_size = chunk_size or settings.BOOK_IMPORT_CHUNK_SIZE
+    report = ImportReport()
+    seen_isbns: Set[str] = set()
+    started = time.perf_counter()
+
+    chunk: List[Tuple[int, Any]] = []
+    for item in rows:
+        report.total += 1
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            _import_chunk(db, chunk, seen_isbns, report)
+            chunk = []
+    if chunk:
+        _import_chunk(db, chunk, seen_isbns, report)
+
+    report.elapsed_ms = (time.perf_counter() - started) * 1000
+    if report.inserted:
+        _after_import()
+    return report
+
+
+def _after_import() -> None:
+    # totalElements 캐시는 Session 이벤트(bulk insert)로 이미 무효화됨
+    search_index.mark_stale()   # 새 도서 id 를 모르니 색인은 백그라운드 재빌드
+    book_cache.clear()          # "없는 id" 로 잠깐 캐시된 항목이 새 도서일 수 있음
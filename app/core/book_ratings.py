@@ -0,0 +1,140 @@
+# app/core/book_ratings.py
+"""book 의 리뷰 별점 집계 컬럼 (review_count, rating_sum, rating_1~5, rating_avg).
+
+- 리뷰 작성 / 별점 수정 / soft delete 때 리뷰 쓰기와 같은 트랜잭션에서 UPDATE 1번으로 증감
+  (읽고-계산하고-쓰기가 아니라 SET col = col + delta 라서 동시 리뷰가 있어도 안 틀어짐)
+- 어긋났을 때(수동 SQL, 과거 데이터 등)는 review 테이블에서 다시 계산
+    python manage.py rebuild-ratings [--dry-run]
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, case, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.books import Book
+from app.models.review import Review
+
+STARS = (1, 2, 3, 4, 5)
+_STAR_COLUMNS = {star: getattr(Book, f"rating_{star}") for star in STARS}
+_AVG_STEP = Decimal("0.01")
+
+
+def _avg_expr(count_delta: int, sum_delta: int):
+    count = Book.review_count + count_delta
+    return case(
+        (count > 0, func.round((Book.rating_sum + sum_delta) * 1.0 / count, 2)),
+        else_=0,
+    )
+
+
+def apply_rating_change(
+    db: Session,
+    book_id: int,
+    added: Optional[int] = None,
+    removed: Optional[int] = None,
+) -> None:
+    """리뷰 작성(added) / 삭제(removed) / 별점 변경(둘 다)을 book 집계에 반영. 커밋은 호출한 쪽에서."""
+    if added == removed:
+        return
+    count_delta = (added is not None) - (removed is not None)
+    sum_delta = (added or 0) - (removed or 0)
+
+    # rating_avg 를 맨 앞에: MySQL 은 SET 을 왼쪽부터 적용하면서 앞에서 바뀐 값을 보고,
+    # 다른 DB 는 항상 이전 값을 봄 → 맨 앞이면 둘 다 "이전 값 + delta" 로 같은 결과
+    values = [(Book.rating_avg, _avg_expr(count_delta, sum_delta))]
+    if count_delta:
+        values.append((Book.review_count, Book.review_count + count_delta))
+    if sum_delta:
+        values.append((Book.rating_sum, Book.rating_sum + sum_delta))
+    if added is not None:
+        values.append((_STAR_COLUMNS[added], _STAR_COLUMNS[added] + 1))
+    if removed is not None:
+        values.append((_STAR_COLUMNS[removed], _STAR_COLUMNS[removed] - 1))
+
+    db.execute(
+        update(Book)
+        .where(Book.book_id == book_id)
+        .ordered_values(*values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+# ===== 재계산 =====
+def _expected(histogram: List[int]) -> Dict[str, object]:
+    count = sum(histogram)
+    total = sum(star * n for star, n in zip(STARS, histogram))
+    avg = (Decimal(total) / count).quantize(_AVG_STEP, ROUND_HALF_UP) if count else Decimal(0)
+    values = {"review_count": count, "rating_sum": total, "rating_avg": avg}
+    values.update({f"rating_{star}": n for star, n in zip(STARS, histogram)})
+    return values
+
+
+def rebuild_ratings(db: Session, batch_size: int = 1000, dry_run: bool = False) -> Tuple[int, int, int]:
+    """review 테이블 기준으로 어긋난 book 집계만 고침. (확인한 도서 수, 어긋난 수, 고친 수)
+
+    book_id 순으로 batch_size 권씩: 현재 집계 + GROUP BY (book_id, rating) 1번 → 다른 것만 executemany.
+    UPDATE 는 읽은 시점의 값과 같을 때만 적용 (그 사이 리뷰가 달렸으면 건너뜀, 다음 실행에서 다시 확인).
+    """
+    table = Book.__table__
+    columns = ["review_count", "rating_sum", *(f"rating_{star}" for star in STARS)]
+    stmt = (
+        table.update()
+        .where(
+            and_(
+                table.c.book_id == bindparam("b_book_id"),
+                *(table.c[name] == bindparam(f"old_{name}") for name in columns),
+            )
+        )
+        .values({name: bindparam(f"new_{name}") for name in [*columns, "rating_avg"]})
+    )
+
+    checked = mismatched = fixed = 0
+    last_id = 0
+    while True:
+        books = db.execute(
+            select(Book.book_id, Book.rating_avg, *(getattr(Book, name) for name in columns))
+            .where(Book.book_id > last_id)
+            .order_by(Book.book_id)
+            .limit(batch_size)
+        ).all()
+        if not books:
+            break
+        last_id = books[-1].book_id
+        checked += len(books)
+
+        histograms: Dict[int, List[int]] = defaultdict(lambda: [0] * len(STARS))
+        for book_id, rating, n in db.execute(
+            select(Review.book_id, Review.rating, func.count())
+            .where(Review.book_id.in_([book.book_id for book in books]), Review.deleted_at.is_(None))
+            .group_by(Review.book_id, Review.rating)
+        ):
+            if rating in STARS:
+                histograms[book_id][rating - 1] = n
+
+        params = []
+        for book in books:
+            expected = _expected(histograms[book.book_id])
+            current = {name: getattr(book, name) for name in columns}
+            if current == {name: expected[name] for name in columns} and \
+                    Decimal(str(book.rating_avg)) == expected["rating_avg"]:
+                continue
+            params.append({
+                "b_book_id": book.book_id,
+                **{f"old_{name}": value for name, value in current.items()},
+                **{f"new_{name}": value for name, value in expected.items()},
+            })
+
+        mismatched += len(params)
+        if params and not dry_run:
+            rowcount = db.execute(stmt, params).rowcount
+            # executemany rowcount 를 못 주는 드라이버(-1)는 전부 적용된 것으로
+            fixed += rowcount if rowcount >= 0 else len(params)
+            db.commit()
+        else:
+            db.rollback()
+
+    return checked, mismatched, fixed
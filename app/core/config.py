@@ -6,13 +6,89 @@ class Settings(BaseSettings):
     VERSION: str = "0.1.0"
 
     DATABASE_URL: str          # .env에 반드시 있어야 함
+    # 비워두면 DATABASE_URL 에서 드라이버만 바꿔서 사용 (pymysql→aiomysql, sqlite→aiosqlite)
+    ASYNC_DATABASE_URL: str = ""
+    # 읽기 전용 replica URL 목록 (콤마 구분). 비우면 모든 읽기를 primary 로
+    DATABASE_REPLICA_URLS: str = ""
+    # 커넥션 풀 (SQLite 는 SQLAlchemy 기본 풀 사용)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30          # 커넥션 대기 최대(초)
+    DB_POOL_RECYCLE: int = 1800        # MySQL wait_timeout 보다 짧게
+    DB_POOL_PRE_PING: bool = True      # idle 후 끊긴 커넥션 자동 교체
     JWT_SECRET: str            # 이것도 .env 필수
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # refresh token 지문(HMAC) 키. 비워두면 JWT_SECRET 사용
+    TOKEN_FINGERPRINT_SECRET: str = ""
+    # 유저당 살아있는 refresh token 최대 개수 (초과 시 오래된 것부터 revoke). 0 이면 무제한
+    MAX_SESSIONS_PER_USER: int = 10
+    # 만료/revoke 된 user_token 정리 주기(초). 0 이면 주기 작업 끔 (manage.py compact-tokens 로 수동 실행)
+    TOKEN_COMPACTION_INTERVAL_SEC: int = 3600
+    TOKEN_COMPACTION_BATCH_SIZE: int = 1000
+
+    # get_current_user 유저 캐시 (sub -> User 스냅샷, password 제외). 0 이면 비활성화
+    # 같은 워커의 변경은 커밋 직후 무효화, 다른 워커의 차단/권한 변경은 최대 TTL 초 늦게 반영
+    PRINCIPAL_CACHE_TTL_SEC: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # 검증 끝난 JWT payload 캐시 (sha256(token) -> payload, exp 까지 유지). 0 이면 비활성화
+    JWT_DECODE_CACHE_MAX_SIZE: int = 10000
+
+    # bcrypt 전용 스레드풀. WORKERS + MAX_PENDING 은 AnyIO 스레드풀(40)보다 충분히 작게
+    # 가득 차면 대기하지 않고 503 SERVER_BUSY
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 12
+    # bcrypt cost (2^N). `python manage.py calibrate-password` 로 장비별 값 산정
+    PASSWORD_HASH_ROUNDS: int = 12
 
     ENV: str = "local"
 
+    # 응답 헤더에 요청별 SQL 수/DB 시간 노출 (X-DB-Queries, X-DB-Time-ms)
+    QUERY_STATS_HEADERS: bool = True
+
+    # 느린 쿼리 로그 (GET /api/v1/admin/slow-queries). 0 이면 비활성화
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_LOG_SIZE: int = 100       # 최근 N 건만 메모리에 보관
+    SLOW_QUERY_EXPLAIN: bool = True      # SELECT 는 같은 커넥션에서 EXPLAIN 도 같이 저장
+
+    # 도서 키워드 검색 백엔드: like(기존 ILIKE) | mysql(FULLTEXT) | memory(프로세스 내 역색인, 워커별)
+    # memory 는 다른 워커에서 만든 도서가 재빌드 전까지 검색에 안 나오므로 opt-in
+    SEARCH_BACKEND: str = "like"
+    # memory: 다른 워커에서 바뀐 내용을 따라잡기 위한 백그라운드 재빌드 주기(초). 0 이면 재빌드 안 함
+    SEARCH_INDEX_MAX_AGE_SEC: int = 600
+    # relevance 가 아닌 정렬/커서 모드에서 IN (...) 으로 넘길 최대 매칭 수 (넘으면 LIKE 로 대체)
+    SEARCH_MAX_FILTER_IDS: int = 10000
+
+    # 목록 totalElements(COUNT) 캐시. 같은 프로세스의 쓰기는 커밋 즉시 무효화, 다른 워커의 쓰기는 TTL 후 반영
+    COUNT_CACHE_TTL_SEC: int = 30
+    COUNT_CACHE_MAX_SIZE: int = 10000
+
+    # 도서 단건 read-through 캐시 (get_book, 리뷰/장바구니/위시리스트/주문의 도서 확인). 0 이면 끔
+    BOOK_CACHE_TTL_SEC: int = 60
+    BOOK_CACHE_MAX_SIZE: int = 10000
+
+    # GET /books?ids=, /authors?ids= 한 번에 받을 수 있는 최대 id 수
+    BATCH_GET_MAX_IDS: int = 100
+
+    # 도서 일괄 등록 (POST /books/import, manage.py import-books)
+    BOOK_IMPORT_CHUNK_SIZE: int = 5000      # 청크(검증 + IN 조회 + executemany + 커밋) 단위 행 수
+    BOOK_IMPORT_MAX_ERRORS: int = 1000      # 리포트에 남길 실패 행 수 (failed 카운트는 전부 셈)
+
+    # 관리자 export 스트리밍: DB 에서 한 번에 가져오는 행 수 (= 응답 한 조각)
+    EXPORT_YIELD_PER: int = 1000
+
+    # 도서 목록 facets=true 집계
+    FACET_PRICE_BANDS: str = "10000,20000,30000,50000"   # 가격대 경계 (콤마 구분, 오름차순)
+    FACET_AUTHOR_LIMIT: int = 20                         # 저자 facet 은 도서 수 상위 N 명만
+
+    # 리뷰/댓글 like_count: atomic(요청마다 UPDATE +1/-1) | write_behind(워커 메모리에 모아서 주기적으로 일괄 반영)
+    LIKE_COUNTER_MODE: str = "atomic"
+    LIKE_COUNTER_FLUSH_INTERVAL_SEC: float = 1.0
+    LIKE_COUNTER_RECONCILE_INTERVAL_SEC: int = 3600   # write_behind 모드의 자동 reconcile 주기. 0 이면 끔
+    LIKE_COUNTER_RECONCILE_BATCH_SIZE: int = 1000
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,202 @@
+# app/core/count_cache.py
+"""목록 API 의 totalElements(COUNT) 캐시.
+
+- 키: COUNT 문을 컴파일한 SQL + 바인딩 값 (= 정규화된 필터) + 관련 테이블들의 세대 번호
+- 무효화: Session 이벤트로 테이블에 쓰기가 커밋되면 그 테이블의 세대를 올림
+  (ORM flush 의 new/dirty/deleted + session.execute(update/delete/insert) bulk 문)
+  세대가 바뀐 키는 다시 조회되지 않고 TTL/LRU 로 자연히 빠짐
+- 다른 워커 프로세스의 쓰기는 COUNT_CACHE_TTL_SEC 만큼 늦게 반영될 수 있음
+- replica 세션에서 센 값은 키를 따로 둠 (X-Read-Consistency: strong 등 primary 읽기에는 안 섞임).
+  replica 값은 복제 지연 + TTL 만큼 늦을 수 있음
+
+count 모드
+    exact  : 정확한 COUNT (캐시 사용)
+    approx : 필터 없는 전체 목록이면 테이블 통계(MySQL information_schema.TABLES.TABLE_ROWS,
+             SQLite sqlite_stat1) 사용. 필터가 있거나 통계가 없으면 exact 로
+    none   : COUNT 안 함 (totalElements/totalPages = null)
+"""
+from __future__ import annotations
+
+import threading
+from enum import Enum
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Select, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.db import is_replica_session
+
+settings = get_settings()
+
+
+class CountMode(str, Enum):
+    exact = "exact"
+    approx = "approx"
+    none = "none"
+
+
+count_cache = TTLCache(
+    max_size=settings.COUNT_CACHE_MAX_SIZE,
+    ttl=settings.COUNT_CACHE_TTL_SEC,
+)
+
+_generations: Dict[str, int] = {}
+_generations_lock = threading.Lock()
+
+
+def bump_tables(tables: Iterable[str]) -> None:
+    """테이블에 쓰기가 생겼음을 알림 (이벤트로 안 잡히는 raw SQL 쓰기 후에 직접 호출)."""
+    with _generations_lock:
+        for table in tables:
+            _generations[table] = _generations.get(table, 0) + 1
+
+
+def _generation_of(tables: Sequence[str]) -> Tuple[int, ...]:
+    with _generations_lock:
+        return tuple(_generations.get(table, 0) for table in tables)
+
+
+# ===== Session 이벤트 (모든 Session / AsyncSession.sync_session 에 적용) =====
+_PENDING_KEY = "count_cache_tables"
+
+
+def _pending(session: Session) -> Set[str]:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, flush_context) -> None:
+    pending = _pending(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            pending.add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_tables(orm_execute_state) -> None:
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, "table", None)
+        name = getattr(table, "name", None)
+        if name:
+            _pending(orm_execute_state.session).add(name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    tables = session.info.pop(_PENDING_KEY, None)
+    if tables:
+        bump_tables(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ===== 조회 =====
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
+
+
+def _cache_key(db: Session, stmt: Select, tables: Sequence[str], mode: CountMode) -> Hashable:
+    compiled = stmt.compile()
+    params = tuple(sorted((name, _hashable(value)) for name, value in compiled.params.items()))
+    source = "replica" if is_replica_session(db) else "primary"
+    return (source, mode.value, tuple(tables), _generation_of(tables), str(compiled), params)
+
+
+def _table_estimate(db: Session, table: str) -> Optional[int]:
+    dialect = db.get_bind().dialect.name
+    if dialect in ("mysql", "mariadb"):
+        value = db.execute(
+            text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+            ),
+            {"table": table},
+        ).scalar()
+        return int(value) if value is not None else None
+    if dialect == "sqlite":
+        # ANALYZE 를 한 번이라도 돌려야 sqlite_stat1 이 생김
+        if db.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        ).scalar() is None:
+            return None
+        stat = db.execute(
+            text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1"), {"table": table}
+        ).scalar()
+        return int(stat.split()[0]) if stat else None
+    return None
+
+
+def count_rows(
+    db: Session,
+    stmt: Select,
+    tables: Sequence[str],
+    mode: CountMode = CountMode.exact,
+) -> Tuple[Optional[int], bool]:
+    """(total, exact 여부). stmt 는 select(func.count())... 형태의 COUNT 문.
+
+    tables 는 COUNT 결과에 영향을 주는 테이블들 (첫 번째가 approx 추정 대상).
+    """
+    if mode is CountMode.none:
+        return None, False
+
+    if mode is CountMode.approx and stmt.whereclause is None:
+        key = _cache_key(db, stmt, tables[:1], mode)
+        estimate = count_cache.get(key)
+        if estimate is None:
+            estimate = _table_estimate(db, tables[0])
+            if estimate is not None:
+                count_cache.set(key, estimate)
+        if estimate is not None:
+            return estimate, False
+
+    key = _cache_key(db, stmt, tables, CountMode.exact)
+    total = count_cache.get(key)
+    if total is None:
+        total = db.execute(stmt).scalar() or 0
+        # 조회하는 사이 커밋된 쓰기가 있으면 세대가 바뀌어 이 키는 다시 안 쓰임
+        count_cache.set(key, total)
+    return total, True
+
+
+async def acount_rows(
+    db: AsyncSession,
+    stmt: Select,
+    tables: Sequence[str],
+    mode: CountMode = CountMode.exact,
+) -> Tuple[Optional[int], bool]:
+    """count_rows 의 AsyncSession 버전."""
+    if mode is CountMode.none:
+        return None, False
+    return await db.run_sync(count_rows, stmt, tables, mode)
+
+
+def cached_rows(db: Session, stmt: Select, tables: Sequence[str]) -> List[Tuple[Any, ...]]:
+    """COUNT 가 아닌 집계 SELECT(여러 행, 예: facet GROUP BY) 결과를 같은 키/세대 방식으로 캐시."""
+    key = _cache_key(db, stmt, tables, CountMode.exact)
+    rows = count_cache.get(key)
+    if rows is None:
+        rows = [tuple(row) for row in db.execute(stmt)]
+        count_cache.set(key, rows)
+    return rows
+
+
+async def acached_rows(db: AsyncSession, stmt: Select, tables: Sequence[str]) -> List[Tuple[Any, ...]]:
+    """cached_rows 의 AsyncSession 버전."""
+    return await db.run_sync(cached_rows, stmt, tables)
+
+
+def total_pages(total: Optional[int], size: int) -> Optional[int]:
+    if total is None:
+        return None
+    return (total + size - 1) // size if size else 0
@@ -39,6 +39,7 @@ class ErrorCode(str, Enum):
     # 500+
     INTERNAL_ERROR = "INTERNAL_ERROR"
     DB_UNAVAILABLE = "DB_UNAVAILABLE"
+    SERVER_BUSY = "SERVER_BUSY"
 
 
 @dataclass(frozen=True)
@@ -70,6 +71,7 @@ ERROR_SPECS: Dict[ErrorCode, ErrorSpec] = {
 
     ErrorCode.INTERNAL_ERROR: ErrorSpec(500, "internal server error"),
     ErrorCode.DB_UNAVAILABLE: ErrorSpec(503, "db unavailable"),
+    ErrorCode.SERVER_BUSY: ErrorSpec(503, "server busy, retry later"),
 }
 
 
@@ -0,0 +1,56 @@
+# app/core/etag.py
+"""조건부 GET (ETag / If-None-Match).
+
+ETag 는 응답 스키마로 직렬화한 본문 전체의 해시 (바이트 단위 비교는 아니라서 weak ETag, W/"...").
+updated_at 만으로 만들면 MySQL DATETIME 이 초 단위라 같은 초 안의 두 번째 수정이나
+updated_at 을 안 건드리는 Core UPDATE(별점 집계, like_count 등)를 놓쳐서 304 가 실제 변경을 가림.
+본문은 어차피 읽어야 하지만(도서는 캐시 스냅샷) If-None-Match 가 같으면 응답 직렬화/전송은 생략.
+"""
+from __future__ import annotations
+
+import hashlib
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+CACHE_CONTROL = "private, no-cache"   # 브라우저/앱은 저장하되 매번 재검증, 공유 캐시는 저장 안 함
+
+
+def _part(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def make_body_etag(kind: str, body: BaseModel | Sequence[BaseModel], *extra: Any) -> str:
+    """응답 본문(스키마 객체 또는 목록) 전체를 해시한 weak ETag. extra 는 page/size 같은 조회 조건."""
+    digest = hashlib.sha1(kind.encode("utf-8"))
+    for part in extra:
+        digest.update(b"\x1f" + _part(part).encode("utf-8"))
+    for item in [body] if isinstance(body, BaseModel) else body:
+        digest.update(b"\x1e" + item.model_dump_json().encode("utf-8"))
+    return f'W/"{digest.hexdigest()[:20]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 비교 (weak 비교: W/ 접두어 무시)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == wanted for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -0,0 +1,80 @@
+# app/core/fields.py
+"""목록 API 의 fields= (sparse fieldset).
+
+    GET /api/v1/books?fields=book_id,title,price
+    GET /api/v1/books?fields=book_id,title,author     # 관계는 요청했을 때만 JOIN
+
+- 허용 필드는 응답 스키마(BookRead 등)의 필드 + 관계 이름. 그 밖의 이름은 400 INVALID_REQUEST
+- SELECT 는 load_only(요청 필드 + PK + 정렬컬럼) 로 줄이고, 안 읽은 컬럼에 접근하면
+  lazy load(행마다 SELECT) 대신 바로 에러가 나도록 raiseload
+- 응답 item 은 요청 필드(+ PK) 만 담은 dict
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy.orm import joinedload, load_only
+
+from app.core.error_codes import ErrorCode, raise_http
+
+
+@dataclass(frozen=True)
+class FieldSet:
+    model: Any
+    columns: Tuple[str, ...]                       # 응답에 넣을 컬럼 (PK 포함)
+    relations: Tuple[Tuple[str, Type[BaseModel]], ...]   # (관계 이름, 직렬화 스키마)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return (*self.columns, *(name for name, _ in self.relations))
+
+    def options(self, *extra_columns) -> List[Any]:
+        """query.options(*fieldset.options(sort_col)) 로 사용. extra_columns 는 응답엔 없어도 읽어야 하는 컬럼."""
+        keys = dict.fromkeys((*self.columns, *(col.key for col in extra_columns)))
+        opts: List[Any] = [load_only(*(getattr(self.model, key) for key in keys), raiseload=True)]
+        opts += [joinedload(getattr(self.model, name)) for name, _ in self.relations]
+        return opts
+
+    def dump(self, obj: Any) -> Dict[str, Any]:
+        item = {name: getattr(obj, name) for name in self.columns}
+        for name, schema in self.relations:
+            related = getattr(obj, name)
+            item[name] = schema.model_validate(related).model_dump() if related is not None else None
+        return item
+
+
+def parse_fields(
+    raw: Optional[str],
+    model: Any,
+    schema: Type[BaseModel],
+    *,
+    pk: str,
+    relations: Optional[Dict[str, Type[BaseModel]]] = None,
+) -> Optional[FieldSet]:
+    """fields 쿼리 파라미터 파싱. 없거나 빈 값이면 None (= 엔드포인트 기본 응답)."""
+    if raw is None or not raw.strip():
+        return None
+
+    relations = relations or {}
+    allowed = [*schema.model_fields, *relations]
+    requested = [name.strip() for name in raw.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise_http(
+            ErrorCode.INVALID_REQUEST,
+            message="unknown fields",
+            details={"unknown": unknown, "allowed": allowed},
+        )
+
+    columns = tuple(dict.fromkeys([pk, *(name for name in requested if name not in relations)]))
+    rels = tuple((name, relations[name]) for name in dict.fromkeys(requested) if name in relations)
+    return FieldSet(model=model, columns=columns, relations=rels)
+
+
+def dump_page(items: Sequence[Any], fieldset: Optional[FieldSet]) -> Sequence[Any]:
+    """fields 가 없으면 그대로(ORM 객체), 있으면 요청 필드만 담은 dict 목록."""
+    if fieldset is None:
+        return items
+    return [fieldset.dump(item) for item in items]
@@ -0,0 +1,96 @@
+# app/core/hash_executor.py
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutorSaturated(RuntimeError):
+    """실행 중 + 대기 중 작업이 상한에 도달해서 새 작업을 받지 않음."""
+
+
+class BoundedExecutor:
+    """bcrypt 처럼 무거운 CPU 작업 전용 스레드풀.
+
+    - max_workers 개까지 동시에 실행, max_pending 개까지 대기열에 쌓음
+    - 그 이상이 들어오면 기다리지 않고 ExecutorSaturated 를 바로 던짐
+      → 로그인 폭주 때도 AnyIO 공용 스레드풀(40개)을 다 잡아먹지 않음
+    - async 핸들러는 arun() 으로 이벤트 루프에서 기다림 (기다리는 동안 AnyIO 스레드를 잡지 않음)
+    - bcrypt 는 해싱 중 GIL 을 놓기 때문에 스레드로도 코어 수만큼 병렬 처리됨
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, name: str = "bounded"):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=name,
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_pending)
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """자리가 있으면 전용 풀에 넣고 Future 를 돌려줌. 없으면 ExecutorSaturated."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ExecutorSaturated("executor queue is full")
+
+        with self._lock:
+            self._admitted += 1
+
+        try:
+            future = self._executor.submit(self._call, fn, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        # 실행 전에 취소된 작업(arun 을 기다리던 요청이 끊김)도 자리를 돌려받도록 완료 콜백에서 반납
+        future.add_done_callback(self._on_done)
+        return future
+
+    def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """동기 호출용 (manage.py, seed 등). 호출 스레드는 완료까지 대기."""
+        return self.submit(fn, *args, **kwargs).result()
+
+    async def arun(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """async 핸들러용. 결과를 이벤트 루프에서 기다림."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def _call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _on_done(self, future: Future) -> None:
+        if not future.cancelled():
+            with self._lock:
+                self.completed += 1
+        self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._admitted -= 1
+        self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "maxWorkers": self.max_workers,
+                "maxPending": self.max_pending,
+                "running": self._running,
+                "queued": self._admitted - self._running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,316 @@
+# app/core/like_counters.py
+"""리뷰/댓글 like_count 증감.
+
+LIKE_COUNTER_MODE
+    atomic       : 좋아요 행 INSERT/DELETE 와 같은 트랜잭션에서 UPDATE ... SET like_count = like_count + :d
+                   (Python 쪽 읽고-더하고-쓰기가 아니라서 동시 좋아요가 유실되지 않음)
+    write_behind : 커밋된 delta 를 프로세스 메모리에 모아 두고 LIKE_COUNTER_FLUSH_INTERVAL_SEC 마다
+                   (id 별로 합친 뒤) executemany UPDATE 1번으로 반영. 인기 리뷰에 좋아요가 몰려도
+                   요청마다 같은 행을 잠그지 않음. 대신 like_count 는 최대 flush 주기만큼 늦게 보이고,
+                   워커가 비정상 종료하면 버퍼에 남은 delta 는 유실될 수 있음 → reconcile 로 복구
+                   (LIKE_COUNTER_RECONCILE_INTERVAL_SEC 마다 워커에서 자동으로도 돎)
+
+    python manage.py reconcile-likes [--dry-run]   # review_like / comment_like 기준으로 다시 계산
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, case, event, func, select, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.models.review import Comment, CommentLike, Review, ReviewLike
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+REVIEW = "review"
+COMMENT = "comment"
+
+# kind -> (테이블, PK 컬럼, like 테이블, like 테이블의 FK 컬럼)
+_TARGETS = {
+    REVIEW: (Review.__table__, Review.__table__.c.review_id, ReviewLike.__table__, ReviewLike.__table__.c.review_id),
+    COMMENT: (Comment.__table__, Comment.__table__.c.comment_id, CommentLike.__table__, CommentLike.__table__.c.comment_id),
+}
+
+
+def _plus(column, delta):
+    # 기존 max(0, count - 1) 과 같이 0 아래로는 안 내려감
+    return case((column + delta < 0, 0), else_=column + delta)
+
+
+class LikeCounterBuffer:
+    """write_behind 모드의 (kind, id) -> 누적 delta. 여러 스레드(요청)에서 동시에 씀."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._deltas: Dict[Tuple[str, int], int] = defaultdict(int)
+        self.flushed_rows = 0
+        self.flushes = 0
+        self.errors = 0
+
+    def add(self, kind: str, target_id: int, delta: int) -> None:
+        with self._lock:
+            self._deltas[(kind, target_id)] += delta
+
+    def pending(self, kind: str, target_id: int) -> int:
+        with self._lock:
+            return self._deltas.get((kind, target_id), 0)
+
+    def drain(self) -> Dict[Tuple[str, int], int]:
+        with self._lock:
+            deltas, self._deltas = self._deltas, defaultdict(int)
+        return {key: delta for key, delta in deltas.items() if delta}
+
+    def restore(self, deltas: Dict[Tuple[str, int], int]) -> None:
+        """flush 실패 시 다음 주기에 다시 시도하도록 되돌림."""
+        with self._lock:
+            for key, delta in deltas.items():
+                self._deltas[key] += delta
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            pending = len(self._deltas)
+        return {
+            "mode": settings.LIKE_COUNTER_MODE,
+            "pendingTargets": pending,
+            "flushes": self.flushes,
+            "flushedRows": self.flushed_rows,
+            "flushErrors": self.errors,
+        }
+
+
+like_buffer = LikeCounterBuffer()
+
+
+def _write_behind() -> bool:
+    return settings.LIKE_COUNTER_MODE == "write_behind"
+
+
+# ===== 요청 경로 =====
+_PENDING_KEY = "like_counter_deltas"
+
+
+def change_like_count(db: Session, kind: str, target_id: int, delta: int) -> None:
+    """좋아요 행 INSERT/DELETE 와 같은 트랜잭션에서 호출. 커밋은 호출한 쪽에서.
+
+    write_behind 면 여기선 기록만 해 두고, 커밋이 성공했을 때 버퍼로 넘김 (롤백되면 버림).
+    """
+    if _write_behind():
+        db.info.setdefault(_PENDING_KEY, []).append((kind, target_id, delta))
+        return
+    table, pk, _, _ = _TARGETS[kind]
+    db.execute(update(table).where(pk == target_id).values(like_count=_plus(table.c.like_count, delta)))
+
+
+def current_like_count(db: Session, kind: str, target_id: int) -> int:
+    """응답용 like_count. write_behind 면 아직 flush 안 된 이 워커의 delta(+ 이 트랜잭션 것)까지 더한 값."""
+    table, pk, _, _ = _TARGETS[kind]
+    count = db.scalar(select(table.c.like_count).where(pk == target_id)) or 0
+    if _write_behind():
+        staged = sum(
+            delta for k, i, delta in db.info.get(_PENDING_KEY, ()) if k == kind and i == target_id
+        )
+        count = max(0, count + like_buffer.pending(kind, target_id) + staged)
+    return count
+
+
+@event.listens_for(Session, "after_commit")
+def _hand_over_on_commit(session: Session) -> None:
+    for kind, target_id, delta in session.info.pop(_PENDING_KEY, ()):
+        like_buffer.add(kind, target_id, delta)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ===== write_behind flush =====
+def flush_like_counts(session_factory) -> int:
+    """버퍼의 delta 를 kind 별 executemany UPDATE 1번씩으로 반영. 반영한 대상 수를 돌려줌."""
+    deltas = like_buffer.drain()
+    if not deltas:
+        return 0
+
+    by_kind: Dict[str, list] = defaultdict(list)
+    # id 순으로 → 동시에 flush 하는 다른 워커와 잠그는 순서가 같아서 데드락 안 남
+    for (kind, target_id), delta in sorted(deltas.items()):
+        by_kind[kind].append({"b_id": target_id, "b_delta": delta})
+
+    db = session_factory()
+    try:
+        for kind, params in by_kind.items():
+            table, pk, _, _ = _TARGETS[kind]
+            db.execute(
+                update(table)
+                .where(pk == bindparam("b_id"))
+                .values(like_count=_plus(table.c.like_count, bindparam("b_delta"))),
+                params,
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        like_buffer.restore(deltas)
+        like_buffer.errors += 1
+        raise
+    finally:
+        db.close()
+
+    like_buffer.flushes += 1
+    like_buffer.flushed_rows += len(deltas)
+    return len(deltas)
+
+
+async def run_like_flush_forever(session_factory, interval_sec: float) -> None:
+    """앱 lifespan 에서 띄우는 주기 작업. 취소되면(종료 시) 남은 delta 를 한 번 더 flush 하고 끝."""
+    try:
+        while True:
+            await asyncio.sleep(interval_sec)
+            try:
+                await run_in_threadpool(flush_like_counts, session_factory)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("like counter flush failed")
+    finally:
+        try:
+            flush_like_counts(session_factory)
+        except Exception:
+            logger.exception("like counter final flush failed")
+
+
+# ===== 재계산 =====
+def _mismatches(db: Session, kind: str, rows) -> Dict[int, Tuple[int, int]]:
+    """(id, like_count) 행들 중 like 테이블 기준 수와 다른 것만: id -> (like_count, 실제 수)."""
+    like_fk = _TARGETS[kind][3]
+    actual = dict(
+        db.execute(
+            select(like_fk, func.count())
+            .where(like_fk.in_([target_id for target_id, _ in rows]))
+            .group_by(like_fk)
+        ).all()
+    )
+    return {
+        target_id: (count, actual.get(target_id, 0))
+        for target_id, count in rows
+        if count != actual.get(target_id, 0)
+    }
+
+
+def _fix(db: Session, kind: str, found: Dict[int, Tuple[int, int]]) -> int:
+    # 읽은 값 그대로일 때만 UPDATE (그 사이 좋아요가 바뀌었으면 건너뜀 → 다시 실행하면 수렴)
+    table, pk, _, _ = _TARGETS[kind]
+    stmt = (
+        table.update()
+        .where(and_(pk == bindparam("b_id"), table.c.like_count == bindparam("b_old")))
+        .values(like_count=bindparam("b_new"))
+    )
+    params = [{"b_id": target_id, "b_old": old, "b_new": new} for target_id, (old, new) in found.items()]
+    rowcount = db.execute(stmt, params).rowcount
+    db.commit()
+    return rowcount if rowcount >= 0 else len(params)
+
+
+def reconcile_like_counts(
+    db: Session,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+    session_factory=None,
+    settle_sec: Optional[float] = None,
+) -> Dict[str, Tuple[int, int, int]]:
+    """review_like / comment_like 기준으로 어긋난 like_count 만 고침.
+
+    kind 별 (확인한 수, 어긋난 수, 고친 수). PK 순으로 batch_size 개씩.
+
+    write_behind 모드에선 like 행은 커밋됐는데 delta 는 아직 워커 버퍼에 있을 수 있음. 그 상태에서
+    실제 수로 덮어쓰면 나중에 flush 가 같은 delta 를 한 번 더 더함 → 그래서
+      1) session_factory 를 주면 이 프로세스의 버퍼부터 flush
+      2) 어긋난 대상은 바로 고치지 않고 settle_sec(기본 flush 주기 x 2) 뒤에 다시 읽어서
+         like_count 와 실제 수가 둘 다 그대로인 것만 고침. 다른 워커 버퍼에 있던 delta 는
+         그 사이 flush 돼서 like_count 가 바뀌므로 건너뜀 (비정상 종료로 유실된 delta 만 남음)
+    """
+    if _write_behind():
+        if session_factory is not None and not dry_run:
+            flush_like_counts(session_factory)
+        if settle_sec is None:
+            settle_sec = settings.LIKE_COUNTER_FLUSH_INTERVAL_SEC * 2
+    else:
+        settle_sec = 0
+
+    result = {}
+    pending: Dict[str, Dict[int, Tuple[int, int]]] = {}
+    for kind, (table, pk, _, _) in _TARGETS.items():
+        checked = mismatched = fixed = 0
+        last_id = 0
+        while True:
+            rows = db.execute(
+                select(pk, table.c.like_count).where(pk > last_id).order_by(pk).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            checked += len(rows)
+
+            found = _mismatches(db, kind, rows)
+            mismatched += len(found)
+            if found and not dry_run and not settle_sec:
+                fixed += _fix(db, kind, found)
+            else:
+                pending.setdefault(kind, {}).update(found)
+                db.rollback()
+        result[kind] = (checked, mismatched, fixed)
+
+    if dry_run or not settle_sec or not any(pending.values()):
+        return result
+
+    time.sleep(settle_sec)
+    for kind, found in pending.items():
+        table, pk, _, _ = _TARGETS[kind]
+        target_ids = sorted(found)
+        fixed = 0
+        for start in range(0, len(target_ids), batch_size):
+            rows = db.execute(
+                select(pk, table.c.like_count).where(pk.in_(target_ids[start:start + batch_size]))
+            ).all()
+            stable = {
+                target_id: counts
+                for target_id, counts in _mismatches(db, kind, rows).items()
+                if counts == found[target_id]
+            }
+            if stable:
+                fixed += _fix(db, kind, stable)
+            else:
+                db.rollback()
+        checked, mismatched, _ = result[kind]
+        result[kind] = (checked, mismatched, fixed)
+    return result
+
+
+async def run_like_reconcile_forever(session_factory, interval_sec: float, batch_size: int) -> None:
+    """앱 lifespan 에서 띄우는 주기 작업 (write_behind 모드). 취소되면 조용히 종료."""
+    def _once() -> Dict[str, Tuple[int, int, int]]:
+        db = session_factory()
+        try:
+            return reconcile_like_counts(db, batch_size=batch_size, session_factory=session_factory)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.sleep(interval_sec)
+        try:
+            result = await run_in_threadpool(_once)
+            fixed = {kind: counts[2] for kind, counts in result.items() if counts[2]}
+            if fixed:
+                logger.info(f"like_count reconcile: fixed {fixed}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("like_count reconcile failed")
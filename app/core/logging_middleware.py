@@ -4,18 +4,29 @@ import logging
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 
+from app.core.config import get_settings
+from app.core.query_stats import begin_request
+
 logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         start = time.time()
+        # 이 요청 동안 실행된 SQL 문 수 / DB 시간 (engine 이벤트에서 채움)
+        stats = begin_request(request.method, request.url.path)
 
         response = await call_next(request)
 
         process_ms = (time.time() - start) * 1000
         logger.info(
             f"{request.client.host} {request.method} {request.url.path} "
-            f"-> {response.status_code} ({process_ms:.2f}ms)"
+            f"-> {response.status_code} ({process_ms:.2f}ms) "
+            f"db={stats.count}q/{stats.total_ms:.2f}ms"
         )
 
+        if settings.QUERY_STATS_HEADERS:
+            response.headers["X-DB-Queries"] = str(stats.count)
+            response.headers["X-DB-Time-ms"] = f"{stats.total_ms:.2f}"
+
         return response
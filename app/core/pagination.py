@@ -0,0 +1,183 @@
+# app/core/pagination.py
+"""keyset(cursor) 페이지네이션 공통 유틸.
+
+커서는 base64url(JSON) 로 감싼 불투명 문자열:
+    {"s": "created_at,desc", "v": <마지막 행의 정렬값>, "id": <마지막 행의 PK>, "b": 이전 페이지 여부}
+
+정렬 컬럼 + PK 로 (col, id) < (:v, :id) 조건을 걸기 때문에
+(col, id) 복합 인덱스가 있으면 페이지 깊이에 상관없이 인덱스 range scan 한 번으로 끝남.
+:v 는 정렬 컬럼과 같은 타입으로 bind (같은 정렬값끼리 정확히 같다고 비교돼야 PK 로 넘어감).
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, Select, String, literal, tuple_
+from sqlalchemy.types import TypeDecorator
+
+from app.core.error_codes import ErrorCode, raise_http
+
+
+@dataclass(frozen=True)
+class Cursor:
+    sort: str
+    value: Any
+    last_id: Any
+    backward: bool = False
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(raw: Any) -> Any:
+    if isinstance(raw, dict):
+        if "dt" in raw:
+            return datetime.fromisoformat(raw["dt"])
+        if "d" in raw:
+            return date.fromisoformat(raw["d"])
+        if "dec" in raw:
+            return Decimal(raw["dec"])
+    return raw
+
+
+def encode_cursor(sort: str, value: Any, last_id: Any, backward: bool = False) -> str:
+    body = {"s": sort, "v": _encode_value(value), "id": last_id, "b": backward}
+    raw = json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str, sort: str) -> Cursor:
+    """잘못된 커서 / 다른 정렬로 만든 커서는 400 INVALID_REQUEST."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        body = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor = Cursor(
+            sort=body["s"],
+            value=_decode_value(body["v"]),
+            last_id=body["id"],
+            backward=bool(body.get("b", False)),
+        )
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeError):
+        raise_http(ErrorCode.INVALID_REQUEST, message="invalid cursor", details={"cursor": token})
+
+    if cursor.sort != sort:
+        raise_http(
+            ErrorCode.INVALID_REQUEST,
+            message="cursor was issued for a different sort",
+            details={"cursor_sort": cursor.sort, "sort": sort},
+        )
+    return cursor
+
+
+class _KeysetDateTime(TypeDecorator):
+    """커서의 datetime 을 컬럼에 저장된 형식 그대로 bind.
+
+    SQLite 는 DATETIME 을 문자열로 비교하는데 server_default(CURRENT_TIMESTAMP) 로 들어간 값은
+    'YYYY-MM-DD HH:MM:SS' (초 단위) 이고 SQLAlchemy 기본 bind 는 '....SS.000000' 이라
+    같은 시각이 서로 다르게 비교됨 → 같은 초에 만든 행들이 PK 비교까지 못 가고 페이지가 끝나지 않음.
+    MySQL 등은 DATETIME 으로 비교하므로 원래 타입 그대로.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime(timezone=self.impl.timezone))
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name == "sqlite" and isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S")
+        return value
+
+
+def _bound_value(sort_col, value: Any):
+    col_type = sort_col.type
+    if isinstance(col_type, DateTime):
+        return literal(value, _KeysetDateTime(timezone=col_type.timezone))
+    return literal(value, col_type)
+
+
+def keyset_order(
+    query: Select,
+    sort_col,
+    id_col,
+    descending: bool,
+    cursor: Optional[Cursor],
+) -> Select:
+    """정렬 + 커서 조건만 (limit 없음). export 처럼 커서 이후를 끝까지 읽을 때도 사용."""
+    backward = cursor is not None and cursor.backward
+    # 이전 페이지는 정렬을 뒤집어서 읽고 build_keyset_page 에서 다시 뒤집음
+    reverse = descending != backward
+
+    if cursor is not None:
+        key = tuple_(sort_col, id_col)
+        bound = tuple_(_bound_value(sort_col, cursor.value), literal(cursor.last_id, id_col.type))
+        query = query.where(key < bound if reverse else key > bound)
+
+    if reverse:
+        return query.order_by(sort_col.desc(), id_col.desc())
+    return query.order_by(sort_col.asc(), id_col.asc())
+
+
+def apply_keyset(
+    query: Select,
+    sort_col,
+    id_col,
+    descending: bool,
+    size: int,
+    cursor: Optional[Cursor],
+) -> Select:
+    """정렬/커서 조건/limit(size + 1) 적용. 한 건 더 읽어서 다음 페이지 존재 여부를 판단."""
+    return keyset_order(query, sort_col, id_col, descending, cursor).limit(size + 1)
+
+
+def build_keyset_page(
+    rows: Sequence[Any],
+    sort: str,
+    sort_attr: str,
+    id_attr: str,
+    size: int,
+    cursor: Optional[Cursor],
+) -> Tuple[List[Any], Optional[str], Optional[str]]:
+    """apply_keyset 결과로 (content, nextCursor, prevCursor) 계산."""
+    items = list(rows)
+    has_more = len(items) > size
+    items = items[:size]
+
+    backward = cursor is not None and cursor.backward
+    if backward:
+        items.reverse()
+        has_next = True                 # 다음 페이지에서 넘어왔으므로 항상 존재
+        has_prev = has_more
+    else:
+        has_next = has_more
+        has_prev = cursor is not None   # 첫 페이지가 아니면 이전 페이지 존재
+
+    if not items:
+        return items, None, None
+
+    first, last = items[0], items[-1]
+    next_cursor = (
+        encode_cursor(sort, getattr(last, sort_attr), getattr(last, id_attr))
+        if has_next else None
+    )
+    prev_cursor = (
+        encode_cursor(sort, getattr(first, sort_attr), getattr(first, id_attr), backward=True)
+        if has_prev else None
+    )
+    return items, next_cursor, prev_cursor
@@ -0,0 +1,55 @@
+# app/core/password_calibration.py
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Dict, List
+
+from passlib.context import CryptContext
+
+# bcrypt 가 허용하는 cost 범위 중 실사용 구간
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+
+_SAMPLE_PASSWORD = "calibration-P@ssw0rd!"
+
+
+def measure_hash_ms(rounds: int, samples: int = 5) -> float:
+    """현재 장비에서 bcrypt_sha256(rounds) 해시 1회 소요시간(ms, 중앙값)."""
+    ctx = CryptContext(schemes=["bcrypt_sha256"], bcrypt_sha256__rounds=rounds)
+    ctx.hash(_SAMPLE_PASSWORD)  # 첫 호출(backend 로딩) 은 측정에서 제외
+    timings: List[float] = []
+    for _ in range(max(1, samples)):
+        start = time.perf_counter()
+        ctx.hash(_SAMPLE_PASSWORD)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_rounds(
+    target_ms: float,
+    *,
+    min_rounds: int = MIN_ROUNDS,
+    max_rounds: int = MAX_ROUNDS,
+    samples: int = 5,
+) -> Dict[str, object]:
+    """target_ms 안에 들어오는 가장 큰 cost 를 고름.
+
+    cost 가 1 오를 때마다 시간이 2배가 되므로, 예산을 넘는 순간 측정을 멈춤.
+    가장 낮은 cost 도 예산을 넘으면 min_rounds 를 추천함.
+    """
+    measured: Dict[int, float] = {}
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        ms = measure_hash_ms(rounds, samples=samples)
+        measured[rounds] = ms
+        if ms > target_ms:
+            break
+        chosen = rounds
+
+    return {
+        "target_ms": target_ms,
+        "rounds": chosen,
+        "hash_ms": measured.get(chosen),
+        "measured": measured,
+    }
@@ -0,0 +1,93 @@
+# app/core/pool_metrics.py
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+# 커넥션 대기시간 히스토그램 구간 상한(ms). 마지막 구간은 그 이상 전부
+WAIT_BUCKETS_MS: List[float] = [1, 5, 10, 50, 100, 500, 1000, 5000]
+
+
+class WaitHistogram:
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def observe(self, ms: float) -> None:
+        idx = bisect.bisect_left(self.bounds, ms)
+        with self._lock:
+            self.counts[idx] += 1
+            self.total_ms += ms
+            if ms > self.max_ms:
+                self.max_ms = ms
+
+    def timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            count = sum(self.counts)
+            buckets = {f"le_{b:g}ms": c for b, c in zip(self.bounds, self.counts)}
+            buckets["gt_%gms" % self.bounds[-1]] = self.counts[-1]
+            return {
+                "count": count,
+                "avgMs": round(self.total_ms / count, 3) if count else 0.0,
+                "maxMs": round(self.max_ms, 3),
+                "timeouts": self.timeouts,
+                "buckets": buckets,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """checkout 시 커넥션을 얻기까지 기다린 시간을 기록하는 QueuePool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = WaitHistogram(WAIT_BUCKETS_MS)
+
+    def recreate(self):
+        # dispose()/fork 후 재생성돼도 히스토그램은 이어서 사용
+        new_pool = super().recreate()
+        new_pool.wait_histogram = self.wait_histogram
+        return new_pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_histogram.timeout()
+            raise
+        self.wait_histogram.observe((time.perf_counter() - start) * 1000)
+        return conn
+
+
+def pool_stats(pool: Pool) -> Dict[str, Any]:
+    """풀 종류에 상관없이 현재 상태를 dict 로."""
+    stats: Dict[str, Any] = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checkedOut": pool.checkedout(),
+            "checkedIn": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),
+            "maxOverflow": pool._max_overflow,
+            "timeoutSec": pool.timeout(),
+        })
+    else:
+        stats["status"] = pool.status()
+
+    histogram = getattr(pool, "wait_histogram", None)
+    if histogram is not None:
+        stats["checkoutWait"] = histogram.snapshot()
+    return stats
@@ -0,0 +1,115 @@
+# app/core/query_stats.py
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    """요청 1건 동안 실행된 SQL 문 수와 DB 시간."""
+    method: str = ""
+    path: str = ""
+    count: int = 0
+    total_ms: float = 0.0
+
+
+@dataclass
+class QueryRecorder:
+    """assert_max_queries 에서 쓰는 기록기 (실행된 SQL 문을 그대로 모음)."""
+    statements: List[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+# LoggingMiddleware 가 요청마다 새 QueryStats 를 넣어줌.
+# call_next / run_in_threadpool / AsyncSession 모두 context 를 복사해 가므로 같은 객체를 갱신하게 됨
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# 테스트용 전역 기록기 (TestClient 는 앱을 다른 스레드에서 돌려서 contextvar 로는 못 잡음)
+_recorders: List[QueryRecorder] = []
+_recorders_lock = threading.Lock()
+
+# SQL 1건 실행이 끝날 때마다 호출되는 콜백 (slow query log 등)
+# fn(conn, cursor, statement, parameters, context, executemany, elapsed_ms)
+StatementObserver = Callable[..., None]
+_observers: List[StatementObserver] = []
+
+
+def add_statement_observer(fn: StatementObserver) -> None:
+    if fn not in _observers:
+        _observers.append(fn)
+
+
+def begin_request(method: str, path: str) -> QueryStats:
+    stats = QueryStats(method=method, path=path)
+    _current.set(stats)
+    return stats
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진(동기 엔진 또는 AsyncEngine.sync_engine)에 SQL 카운트 이벤트를 붙임."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000 if starts else 0.0
+
+        stats = _current.get()
+        if stats is not None:
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+
+        if _recorders:
+            with _recorders_lock:
+                for recorder in _recorders:
+                    recorder.statements.append(statement)
+
+        for observer in _observers:
+            observer(conn, cursor, statement, parameters, context, executemany, elapsed_ms)
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    """블록 안에서 (어느 스레드에서든) 실행된 SQL 문을 모음."""
+    recorder = QueryRecorder()
+    with _recorders_lock:
+        _recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        with _recorders_lock:
+            _recorders.remove(recorder)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryRecorder]:
+    """pytest 헬퍼: 엔드포인트의 SQL 예산을 넘으면 실패 (N+1 회귀 방지).
+
+        with assert_max_queries(3):
+            client.get("/api/v1/books", headers=auth)
+    """
+    with record_queries() as recorder:
+        yield recorder
+    if recorder.count > max_queries:
+        listing = "\n".join(f"  {i + 1}. {sql}" for i, sql in enumerate(recorder.statements))
+        raise AssertionError(
+            f"expected at most {max_queries} queries, got {recorder.count}:\n{listing}"
+        )
@@ -0,0 +1,636 @@
+# app/core/search.py
+"""도서 키워드 검색.
+
+SEARCH_BACKEND
+    like   : 기존 ILIKE '%kw%' (전체 스캔). 기본값
+    mysql  : book(title, description) FULLTEXT 인덱스 + MATCH ... AGAINST
+    memory : 프로세스 내 역색인(BM25). 앱 시작 시 백그라운드로 만들고 이후 create/update/delete 로 증분 갱신
+             첫 빌드가 끝나기 전엔 like 로 응답. 워커마다 따로 가지므로 다른 워커에서 만든 도서는
+             SEARCH_INDEX_MAX_AGE_SEC 후 재빌드 때까지 검색에 안 나옴 → 워커 1개이거나 지연을 감수할 때만
+
+memory 역색인 구조
+    base  : term -> array('q') [book_id << 8 | tf]  (한 번에 만든 읽기 전용 세그먼트)
+    delta : 빌드 이후 저장된 문서들의 term -> tf (작은 쓰기용 세그먼트)
+    shadowed : base 쪽 posting 을 무시해야 하는 book_id (수정/삭제된 문서)
+    delta 가 커지면 base 로 합침(compact). 다른 워커 프로세스의 변경은 SEARCH_INDEX_MAX_AGE_SEC 마다
+    백그라운드 재빌드로 따라잡음.
+"""
+from __future__ import annotations
+
+import heapq
+import html
+import itertools
+import logging
+import math
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.fields import FieldSet
+from app.models.books import Book
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+TITLE_WEIGHT = 3          # 제목에 나온 단어는 본문보다 3배 가중
+MAX_TF = 0xFF             # posting 하위 8bit 에 tf 저장
+MAX_PREFIX_EXPANSION = 64 # 마지막 단어 prefix 확장 최대 개수 (df 큰 순)
+COMPACT_THRESHOLD = 10000 # delta + shadowed 가 이만큼 쌓이면 base 로 합침
+RESULT_CACHE_DEPTH = 1000 # 질의별 상위 N 건까지 결과 캐시 (page * size 가 이 안이면 캐시 사용)
+
+Row = Tuple[int, Optional[str], Optional[str]]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _term_freqs(title: Optional[str], description: Optional[str]) -> Dict[str, int]:
+    tf: Dict[str, int] = {}
+    for term in tokenize(title):
+        tf[term] = tf.get(term, 0) + TITLE_WEIGHT
+    for term in tokenize(description):
+        tf[term] = tf.get(term, 0) + 1
+    return tf
+
+
+class _IndexData:
+    """역색인 한 벌. SearchIndex 가 재빌드할 때 통째로 교체함 (락은 SearchIndex 쪽)."""
+
+    def __init__(self):
+        self.base: Dict[str, array] = {}
+        self.delta: Dict[int, Dict[str, int]] = {}
+        self.delta_terms: Dict[str, Set[int]] = {}
+        self.shadowed: Set[int] = set()
+        self.doc_len: Dict[int, int] = {}
+        self.total_len = 0
+        self._vocab: Optional[List[str]] = None
+
+    # ----- 쓰기 -----
+    def add_base(self, doc_id: int, title: Optional[str], description: Optional[str]) -> None:
+        """빌드 전용: 처음 보는 문서를 base 에 바로 추가."""
+        tf = _term_freqs(title, description)
+        length = sum(tf.values())
+        self.doc_len[doc_id] = length
+        self.total_len += length
+        packed_id = doc_id << 8
+        base = self.base
+        for term, count in tf.items():
+            postings = base.get(term)
+            if postings is None:
+                postings = base[term] = array("q")
+            postings.append(packed_id | min(count, MAX_TF))
+
+    def upsert(self, doc_id: int, title: Optional[str], description: Optional[str]) -> None:
+        self.remove(doc_id)
+        tf = _term_freqs(title, description)
+        length = sum(tf.values())
+        self.delta[doc_id] = tf
+        for term in tf:
+            if term not in self.delta_terms and term not in self.base:
+                self._vocab = None
+            self.delta_terms.setdefault(term, set()).add(doc_id)
+        self.doc_len[doc_id] = length
+        self.total_len += length
+
+    def remove(self, doc_id: int) -> None:
+        length = self.doc_len.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_len -= length
+        self.shadowed.add(doc_id)
+        old = self.delta.pop(doc_id, None)
+        if old:
+            for term in old:
+                docs = self.delta_terms.get(term)
+                if docs is not None:
+                    docs.discard(doc_id)
+                    if not docs:
+                        del self.delta_terms[term]
+
+    def pending_changes(self) -> int:
+        return len(self.delta) + len(self.shadowed)
+
+    def compact(self) -> None:
+        """shadowed posting 제거 + delta 를 base 로 합침."""
+        shadowed = self.shadowed
+        if shadowed:
+            for term in list(self.base):
+                kept = array("q", (p for p in self.base[term] if (p >> 8) not in shadowed))
+                if kept:
+                    self.base[term] = kept
+                else:
+                    del self.base[term]
+        for doc_id, tf in self.delta.items():
+            packed_id = doc_id << 8
+            for term, count in tf.items():
+                self.base.setdefault(term, array("q")).append(packed_id | min(count, MAX_TF))
+        self.delta.clear()
+        self.delta_terms.clear()
+        self.shadowed = set()
+        self._vocab = None
+
+    # ----- 읽기 -----
+    def vocab(self) -> List[str]:
+        if self._vocab is None:
+            self._vocab = sorted(self.base.keys() | self.delta_terms.keys())
+        return self._vocab
+
+    def df(self, term: str) -> int:
+        postings = self.base.get(term)
+        return (len(postings) if postings is not None else 0) + len(self.delta_terms.get(term, ()))
+
+    def expand_prefix(self, prefix: str) -> List[str]:
+        vocab = self.vocab()
+        start = bisect_left(vocab, prefix)
+        matches = []
+        for term in vocab[start:start + MAX_PREFIX_EXPANSION * 32]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        if len(matches) > MAX_PREFIX_EXPANSION:
+            matches = heapq.nlargest(MAX_PREFIX_EXPANSION, matches, key=self.df)
+        return matches
+
+    def iter_term_scores(
+        self, term: str, k1: float, b: float, candidates: Optional[Dict[int, float]] = None
+    ) -> Iterator[Tuple[float, int]]:
+        """term 하나의 (BM25 점수, book_id). candidates 가 있으면 그 문서들만."""
+        n_docs = len(self.doc_len)
+        df = self.df(term)
+        if not n_docs or not df:
+            return
+        idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        avgdl = self.total_len / n_docs or 1.0
+        doc_len = self.doc_len
+        shadowed = self.shadowed
+        norm_a = k1 * (1 - b)
+        norm_b = k1 * b / avgdl
+        scale = idf * (k1 + 1)
+
+        postings = self.base.get(term)
+        if postings is not None:
+            for packed in postings:
+                doc_id = packed >> 8
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                if doc_id in shadowed:
+                    continue
+                tf = packed & MAX_TF
+                yield scale * tf / (tf + norm_a + norm_b * doc_len[doc_id]), doc_id
+
+        for doc_id in self.delta_terms.get(term, ()):
+            if candidates is not None and doc_id not in candidates:
+                continue
+            tf = self.delta[doc_id][term]
+            yield scale * tf / (tf + norm_a + norm_b * doc_len[doc_id]), doc_id
+
+
+class SearchIndex:
+    def __init__(self, max_age_sec: float = 0, k1: float = 1.2, b: float = 0.75):
+        self.max_age_sec = max_age_sec
+        self.k1 = k1
+        self.b = b
+        self._data: Optional[_IndexData] = None
+        self._lock = threading.RLock()          # _data 읽기/쓰기
+        self._build_lock = threading.RLock()    # 빌드는 한 번에 하나만
+        self._pending: Optional[List[Tuple[str, int, Optional[str], Optional[str]]]] = None
+        self._built_at = 0.0
+        self._stale = False
+        self._background: Optional[threading.Thread] = None
+        self.builds = 0
+        self.last_build_ms = 0.0
+        # 색인이 바뀔 때마다 올라감 -> 결과 캐시 키에 포함
+        self._version = 0
+        self._results = TTLCache(max_size=256, ttl=60)
+
+    # ----- 빌드 -----
+    def build(self, rows: Iterable[Row]) -> None:
+        """rows 로 새 역색인을 만들어 교체. 빌드 중 들어온 변경은 교체 직후 다시 적용."""
+        with self._build_lock:
+            with self._lock:
+                self._pending = []
+            start = time.perf_counter()
+            try:
+                data = _IndexData()
+                for doc_id, title, description in rows:
+                    data.add_base(doc_id, title, description)
+            except BaseException:
+                with self._lock:
+                    self._pending = None
+                raise
+            with self._lock:
+                for op, doc_id, title, description in self._pending:
+                    if op == "upsert":
+                        data.upsert(doc_id, title, description)
+                    else:
+                        data.remove(doc_id)
+                self._pending = None
+                self._data = data
+                self._version += 1
+                self._built_at = time.monotonic()
+                self._stale = False
+            self.builds += 1
+            self.last_build_ms = (time.perf_counter() - start) * 1000
+            logger.info(
+                f"search index built: {len(data.doc_len)} docs, {len(data.base)} terms "
+                f"in {self.last_build_ms:.0f}ms"
+            )
+
+    def ensure_ready(self, load_rows: Callable[[], Iterable[Row]]) -> bool:
+        """색인을 바로 쓸 수 있으면 True. 요청 안에서는 빌드하지 않음.
+
+        아직 없거나(첫 빌드 전) 오래됐거나 stale 이면 백그라운드 (재)빌드를 걸어 둠.
+        첫 빌드가 끝나기 전엔 False → 호출한 쪽은 LIKE 경로로 응답.
+        """
+        expired = self.max_age_sec > 0 and time.monotonic() - self._built_at > self.max_age_sec
+        if self._data is None or self._stale or expired:
+            self._start_background_build(load_rows)
+        return self._data is not None
+
+    def _start_background_build(self, load_rows: Callable[[], Iterable[Row]]) -> None:
+        with self._lock:
+            if self._background is not None and self._background.is_alive():
+                return
+            self._background = threading.Thread(
+                target=self._rebuild_quietly, args=(load_rows,), name="search-index-rebuild", daemon=True
+            )
+            self._background.start()
+
+    def _rebuild_quietly(self, load_rows: Callable[[], Iterable[Row]]) -> None:
+        try:
+            self.build(load_rows())
+        except Exception:
+            logger.exception("search index rebuild failed")
+
+    def mark_stale(self) -> None:
+        """대량 변경(import 등) 후 호출: 다음 검색 때 백그라운드로 다시 만듦."""
+        self._stale = True
+
+    # ----- 증분 갱신 -----
+    def upsert(self, doc_id: int, title: Optional[str], description: Optional[str]) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(("upsert", doc_id, title, description))
+            if self._data is not None:
+                self._data.upsert(doc_id, title, description)
+                self._version += 1
+                self._maybe_compact()
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(("remove", doc_id, None, None))
+            if self._data is not None:
+                self._data.remove(doc_id)
+                self._version += 1
+                self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self._data.pending_changes() >= COMPACT_THRESHOLD:
+            self._data.compact()
+
+    # ----- 검색 -----
+    def _group_scores(
+        self, data: _IndexData, group: List[str], candidates: Optional[Dict[int, float]]
+    ) -> Dict[int, float]:
+        """prefix 확장 그룹: 문서마다 그룹 내 최고 점수 (+ 앞 그룹들 누적 점수)."""
+        scores: Dict[int, float] = {}
+        for term in group:
+            for score, doc_id in data.iter_term_scores(term, self.k1, self.b, candidates):
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        if candidates is not None:
+            scores = {doc_id: candidates[doc_id] + score for doc_id, score in scores.items()}
+        return scores
+
+    def _matches(self, query: str, allowed: Optional[Set[int]] = None) -> Iterator[Tuple[float, int]]:
+        """모든 단어를 포함(AND)하는 문서의 (BM25 점수, book_id). 마지막 단어는 prefix 로도 매칭.
+
+        allowed 가 있으면 그 book_id 들 안에서만. lazy 하게 계산하므로 다 읽을 때까지 self._lock 을 잡고 있어야 함.
+        """
+        terms = tokenize(query)
+        data = self._data
+        if not terms or data is None:
+            return iter(())
+
+        groups: List[List[str]] = [[term] for term in dict.fromkeys(terms[:-1])]
+        last = terms[-1]
+        groups.append(list(dict.fromkeys([last] + data.expand_prefix(last))))
+        # df 작은 그룹부터 교집합을 좁혀 감
+        groups.sort(key=lambda group: sum(data.df(term) for term in group))
+
+        scores: Optional[Dict[int, float]] = None
+        if allowed is not None:
+            scores = dict.fromkeys(allowed, 0.0)
+        for group in groups[:-1]:
+            scores = self._group_scores(data, group, scores)
+            if not scores:
+                return iter(())
+
+        final = groups[-1]
+        if len(final) > 1:
+            return ((score, doc_id) for doc_id, score in self._group_scores(data, final, scores).items())
+        # 단어 하나짜리 마지막 그룹은 dict 없이 바로 흘려보냄 (흔한 단어 1개 질의가 제일 많음)
+        matches = data.iter_term_scores(final[0], self.k1, self.b, scores)
+        if scores is None:
+            return matches
+        return ((scores[doc_id] + score, doc_id) for score, doc_id in matches)
+
+    def search(
+        self, query: str, offset: int, limit: int, allowed: Optional[Set[int]] = None
+    ) -> Tuple[int, List[Tuple[int, float]]]:
+        """(전체 매칭 수, [(book_id, score)] 해당 페이지) — 점수 내림차순, 동점이면 book_id 내림차순.
+
+        allowed 가 있으면 그 book_id 들 중에서만 (필터를 통과한 도서 후보).
+        앞쪽 RESULT_CACHE_DEPTH 건은 (색인 버전, 질의) 별로 캐시해서 다음 페이지 요청은 재계산 안 함.
+        """
+        depth = offset + limit
+        cacheable = allowed is None and depth <= RESULT_CACHE_DEPTH
+        key = (self._version, query)
+        if cacheable:
+            cached = self._results.get(key)
+            if cached is not None:
+                total, top = cached
+                return total, top[offset:depth]
+
+        counter = itertools.count()
+        with self._lock:
+            key = (self._version, query)
+            # zip 이 counter 를 한 칸씩 당기므로 끝나고 next(counter) == 매칭 수
+            top = heapq.nlargest(
+                RESULT_CACHE_DEPTH if cacheable else depth,
+                (item for item, _ in zip(self._matches(query, allowed), counter)),
+            )
+        total = next(counter)
+        ranked = [(doc_id, score) for score, doc_id in top]
+        if cacheable:
+            self._results.set(key, (total, ranked))
+        return total, ranked[offset:depth]
+
+    def match_ids(self, query: str, max_ids: int) -> Optional[List[int]]:
+        """매칭되는 book_id 목록. max_ids 를 넘으면 None (IN 절로 넘기기엔 너무 큼)."""
+        ids: List[int] = []
+        with self._lock:
+            for _, doc_id in self._matches(query):
+                if len(ids) >= max_ids:
+                    return None
+                ids.append(doc_id)
+        return ids
+
+    def stats(self) -> Dict[str, object]:
+        data = self._data
+        if data is None:
+            building = self._background is not None and self._background.is_alive()
+            return {"built": False, "building": building, "builds": self.builds}
+        return {
+            "built": True,
+            "docs": len(data.doc_len),
+            "terms": len(data.base) + len(data.delta_terms.keys() - data.base.keys()),
+            "deltaDocs": len(data.delta),
+            "shadowedDocs": len(data.shadowed),
+            "ageSec": round(time.monotonic() - self._built_at, 1),
+            "stale": self._stale,
+            "builds": self.builds,
+            "lastBuildMs": round(self.last_build_ms, 1),
+            "resultCache": self._results.stats(),
+        }
+
+
+search_index = SearchIndex(max_age_sec=settings.SEARCH_INDEX_MAX_AGE_SEC)
+
+
+# ===== highlight =====
+def highlight(text: Optional[str], query: str, width: Optional[int] = 160) -> Optional[str]:
+    """매칭 단어를 <em> 으로 감싼 스니펫 (HTML 이스케이프됨). 매칭이 없으면 None. width=None 이면 전체."""
+    if not text:
+        return None
+    terms = tokenize(query)
+    if not terms:
+        return None
+    exact = set(terms[:-1])
+    prefix = terms[-1]
+
+    spans = []
+    for match in _TOKEN_RE.finditer(text):
+        word = match.group().lower()
+        if word in exact or word.startswith(prefix):
+            spans.append(match.span())
+    if not spans:
+        return None
+
+    # 첫 매칭 앞쪽 약간을 포함해 width 글자 창을 자름
+    if width is None:
+        start, end = 0, len(text)
+    else:
+        start = max(0, spans[0][0] - width // 4)
+        end = min(len(text), start + width)
+    parts = ["…" if start > 0 else ""]
+    cursor = start
+    for span_start, span_end in spans:
+        if span_start < start or span_end > end:
+            continue
+        parts.append(html.escape(text[cursor:span_start]))
+        parts.append(f"<em>{html.escape(text[span_start:span_end])}</em>")
+        cursor = span_end
+    parts.append(html.escape(text[cursor:end]))
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts)
+
+
+def highlight_book(book: Book, query: str) -> Dict[str, Optional[str]]:
+    # fields= 로 안 읽은(deferred) 컬럼은 건너뜀 (접근하면 raiseload 에러)
+    loaded = sa_inspect(book).dict
+    result: Dict[str, Optional[str]] = {}
+    if "title" in loaded:
+        result["title"] = highlight(loaded["title"], query, width=None)
+    if "description" in loaded:
+        result["description"] = highlight(loaded["description"], query)
+    return result
+
+
+# ===== backend 연결 =====
+def _load_books_from(session_factory) -> Callable[[], Iterable[Row]]:
+    def load_rows() -> Iterable[Row]:
+        db = session_factory()
+        try:
+            result = db.execute(
+                select(Book.book_id, Book.title, Book.description)
+                .execution_options(yield_per=5000)
+            )
+            for book_id, title, description in result:
+                yield book_id, title, description
+        finally:
+            db.close()
+    return load_rows
+
+
+def _memory_ready() -> bool:
+    """memory 색인을 지금 쓸 수 있는지. 없으면 백그라운드 빌드만 걸고 False (요청은 LIKE 로)."""
+    from app.db import SessionLocal  # app.db ↔ 모델 순환 import 방지
+
+    return search_index.ensure_ready(_load_books_from(SessionLocal))
+
+
+def warm_up_search_index() -> None:
+    """앱 시작 시 호출: memory 백엔드면 첫 요청 전에 백그라운드로 색인을 만들기 시작."""
+    if settings.SEARCH_BACKEND == "memory":
+        _memory_ready()
+
+
+def _mysql_boolean_query(keyword: str) -> str:
+    terms = tokenize(keyword)
+    return " ".join(f"+{term}" for term in terms[:-1]) + f" +{terms[-1]}*" if terms else ""
+
+
+def _like_filter(keyword: str):
+    like = f"%{keyword}%"
+    return (Book.title.ilike(like)) | (Book.description.ilike(like))
+
+
+async def keyword_filter(keyword: str):
+    """정렬이 relevance 가 아닐 때 쓰는 WHERE 조건 (페이지/커서 모드 공용)."""
+    backend = settings.SEARCH_BACKEND
+    if backend == "mysql" and tokenize(keyword):
+        from sqlalchemy.dialects.mysql import match
+
+        return match(Book.title, Book.description, against=_mysql_boolean_query(keyword)).in_boolean_mode()
+    if backend == "memory" and tokenize(keyword) and _memory_ready():
+        ids = await run_in_threadpool(search_index.match_ids, keyword, settings.SEARCH_MAX_FILTER_IDS)
+        if ids is not None:
+            return Book.book_id.in_(ids)
+        # 매칭이 너무 많으면 IN 대신 기존 LIKE 로 (이 경우엔 어차피 거의 전체 범위)
+    return _like_filter(keyword)
+
+
+async def _memory_ranked(
+    db: AsyncSession, keyword: str, page: int, size: int, filters: Sequence
+) -> Optional[Tuple[int, List[Tuple[int, float]]]]:
+    """memory 색인으로 (전체 수, 해당 페이지 [(book_id, score)]). 정확히 못 구하면 None."""
+    if not filters:
+        return await run_in_threadpool(search_index.search, keyword, page * size, size)
+
+    # 색인은 필터 컬럼을 모름
+    cap = settings.SEARCH_MAX_FILTER_IDS
+    matched, ranked = await run_in_threadpool(search_index.search, keyword, 0, cap)
+    if matched <= cap:
+        # 매칭 전부를 IN 으로 넘겨 필터를 통과하는 것만 남김 (쿼리 1번)
+        passed = set(
+            (await db.scalars(
+                select(Book.book_id).where(Book.book_id.in_([i for i, _ in ranked]), *filters)
+            )).all()
+        ) if ranked else set()
+        ranked = [(i, score) for i, score in ranked if i in passed]
+        return len(ranked), ranked[page * size:(page + 1) * size]
+
+    # 매칭이 너무 많으면 반대로: 필터를 통과하는 도서가 cap 이하일 때 그 id 들 안에서만 점수 계산
+    allowed = (await db.scalars(select(Book.book_id).where(*filters).limit(cap + 1))).all()
+    if len(allowed) > cap:
+        return None
+    return await run_in_threadpool(search_index.search, keyword, page * size, size, set(allowed))
+
+
+async def relevance_page(
+    db: AsyncSession,
+    keyword: str,
+    page: int,
+    size: int,
+    options: Sequence = (),
+    filters: Sequence = (),
+) -> Tuple[Sequence[Book], int, Dict[int, float]]:
+    """sort=relevance: (해당 페이지 Book 들, 전체 매칭 수, book_id -> score).
+
+    options 는 load_only 등 로더 옵션, filters 는 가격/저자 등 추가 WHERE 조건.
+    memory 색인이 아직 없거나, 필터가 있는데 매칭 수와 필터 통과 수가 둘 다 SEARCH_MAX_FILTER_IDS 를
+    넘으면 (색인으로는 정확한 total 을 못 냄) 아래 like 경로로 응답.
+    """
+    backend = settings.SEARCH_BACKEND
+    if backend == "memory" and tokenize(keyword) and _memory_ready():
+        ranked = await _memory_ranked(db, keyword, page, size, filters)
+        if ranked is not None:
+            total, ranked = ranked
+            if not ranked:
+                return [], total, {}
+            books = {
+                book.book_id: book
+                for book in (await db.scalars(
+                    select(Book).options(*options).where(Book.book_id.in_([i for i, _ in ranked]))
+                )).all()
+            }
+            # 색인과 DB 사이에 막 삭제된 문서는 건너뜀
+            return [books[i] for i, _ in ranked if i in books], total, dict(ranked)
+
+    if backend == "mysql" and tokenize(keyword):
+        from sqlalchemy.dialects.mysql import match
+
+        condition = match(Book.title, Book.description, against=_mysql_boolean_query(keyword)).in_boolean_mode()
+        score = match(Book.title, Book.description, against=keyword).in_natural_language_mode()
+        total = await db.scalar(select(func.count()).select_from(Book).where(condition, *filters))
+        rows = (
+            await db.execute(
+                select(Book, score.label("score"))
+                .options(*options)
+                .where(condition, *filters)
+                .order_by(score.desc(), Book.book_id.desc())
+                .offset(page * size)
+                .limit(size)
+            )
+        ).all()
+        return [book for book, _ in rows], total, {book.book_id: float(s) for book, s in rows}
+
+    # like: 점수 없이 최신순
+    condition = _like_filter(keyword)
+    total = await db.scalar(select(func.count()).select_from(Book).where(condition, *filters))
+    books = (
+        await db.scalars(
+            select(Book).options(*options).where(condition, *filters)
+            .order_by(Book.created_at.desc()).offset(page * size).limit(size)
+        )
+    ).all()
+    return books, total, {}
+
+
+def search_content(
+    books: Sequence[Book],
+    keyword: str,
+    scores: Optional[Dict[int, float]] = None,
+    fieldset: Optional[FieldSet] = None,
+) -> List[dict]:
+    """목록 content 에 highlight(와 relevance 점수)를 붙임. fieldset 이 있으면 요청 필드만."""
+    content = []
+    for book in books:
+        item = fieldset.dump(book) if fieldset is not None else jsonable_encoder(book)
+        if scores is not None:
+            score = scores.get(book.book_id)
+            item["score"] = round(score, 4) if score is not None else None
+        item["highlight"] = highlight_book(book, keyword)
+        content.append(item)
+    return content
+
+
+def index_book(book: Book) -> None:
+    """create/update 커밋 후 호출."""
+    if settings.SEARCH_BACKEND == "memory":
+        search_index.upsert(book.book_id, book.title, book.description)
+
+
+def unindex_book(book_id: int) -> None:
+    """delete 커밋 후 호출."""
+    if settings.SEARCH_BACKEND == "memory":
+        search_index.remove(book_id)
@@ -1,6 +1,10 @@
 # app/core/security.py
+import hashlib
+import hmac
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -8,8 +12,12 @@ from passlib.context import CryptContext
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.error_codes import ErrorCode, raise_http
+from app.core.hash_executor import BoundedExecutor, ExecutorSaturated
 
 from app.db import get_db
 from app.models.users import User
@@ -19,18 +27,73 @@ settings = get_settings()
 pwd_context = CryptContext(
     schemes=["bcrypt_sha256", "bcrypt"],  # 기존 bcrypt 해시도 검증되게 유지
     deprecated="auto",
+    # cost 가 설정값과 다른 해시는 needs_update → 로그인 때 재해시
+    bcrypt_sha256__rounds=settings.PASSWORD_HASH_ROUNDS,
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
 )
 
+# bcrypt 해시/검증 전용 풀 (공용 스레드풀과 분리)
+password_executor = BoundedExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    name="pwhash",
+)
+
+# sub(user_id) -> User 컬럼 스냅샷
+principal_cache = TTLCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SEC,
+)
+
+# sha256(token) -> 검증된 payload. 항목별 TTL = 토큰 exp 까지 남은 시간
+decoded_token_cache = TTLCache(max_size=settings.JWT_DECODE_CACHE_MAX_SIZE)
+
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/api/v1/auth/login"   # 로그인 엔드포인트 경로
 )
 # ===== 비밀번호 해시 / 검증 =====
+# 동기 버전은 manage.py / seed 용. API 핸들러는 a* 버전을 await (AnyIO 스레드를 잡고 기다리지 않음)
+def _run_password_task(fn, *args):
+    try:
+        return password_executor.run(fn, *args)
+    except ExecutorSaturated:
+        raise_http(ErrorCode.SERVER_BUSY)
+
+
+async def _arun_password_task(fn, *args):
+    try:
+        return await password_executor.arun(fn, *args)
+    except ExecutorSaturated:
+        raise_http(ErrorCode.SERVER_BUSY)
+
+
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return _run_password_task(pwd_context.hash, password)
+
+
+async def ahash_password(password: str) -> str:
+    return await _arun_password_task(pwd_context.hash, password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _run_password_task(pwd_context.verify, plain_password, hashed_password)
+
+
+def verify_and_rehash_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """검증 + (scheme/cost 가 현재 설정과 다르면) 새 해시를 같이 돌려줌."""
+    return _run_password_task(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
+async def averify_and_rehash_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    return await _arun_password_task(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
 
 
 # ===== JWT 토큰 생성/검증 =====
@@ -56,19 +119,41 @@ def create_access_token(data: Dict[str, Any]) -> str:
 
 
 def create_refresh_token(data: Dict[str, Any]) -> str:
+    # jti: 같은 초에 발급돼도 토큰(=지문)이 겹치지 않도록
     return _create_token(
-        data,
+        {**data, "jti": uuid.uuid4().hex},
         timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
     )
 
 
+def token_fingerprint(token: str) -> str:
+    """refresh token 의 HMAC-SHA256 지문 (user_token 조회 키)."""
+    key = (settings.TOKEN_FINGERPRINT_SECRET or settings.JWT_SECRET).encode()
+    return hmac.new(key, token.encode(), hashlib.sha256).hexdigest()
+
+
 def decode_token(token: str) -> Dict[str, Any]:
-    """유효하지 않은 토큰이면 JWTError 발생."""
+    """유효하지 않은 토큰이면 JWTError 발생.
+
+    서명 검증까지 끝난 payload 는 토큰 digest 기준으로 exp 까지 캐시해서
+    같은 토큰이 반복해서 들어오면 jwt.decode 를 다시 하지 않음.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    cached = decoded_token_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
     payload = jwt.decode(
         token,
         settings.JWT_SECRET,
         algorithms=[settings.JWT_ALGORITHM],
     )
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        remaining = exp - time.time()
+        if remaining > 0:
+            decoded_token_cache.set(key, dict(payload), ttl=remaining)
     return payload
 
 def get_current_user(
@@ -83,21 +168,53 @@ def get_current_user(
     )
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
+        payload = decode_token(token)
         token_data = TokenPayload(**payload)
     except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.user_id == token_data.sub).first()
+    user = _load_principal(db, token_data.sub)
     if user is None:
         raise credentials_exception
 
     return user
 
+
+# 캐시에 안 넣는 컬럼 (비밀번호 해시는 메모리에 오래 들고 있지 않음. 필요하면 접근할 때 SELECT)
+_PRINCIPAL_EXCLUDED = {"password"}
+
+
+def _principal_snapshot(user: User) -> Dict[str, Any]:
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in sa_inspect(User).column_attrs
+        if attr.key not in _PRINCIPAL_EXCLUDED
+    }
+
+
+def _load_principal(db: Session, sub: str) -> User | None:
+    """캐시에 스냅샷이 있으면 DB 를 안 거치고 그대로 씀 (인증된 요청마다 나가던 user SELECT 제거).
+
+    status/role 등을 바꾸는 곳은 커밋 뒤 invalidate_principal() 을 부르므로 같은 워커에서는 바로 반영.
+    다른 워커의 캐시는 무효화가 안 닿으므로 최대 PRINCIPAL_CACHE_TTL_SEC 동안 이전 값 (차단/권한 회수 지연 상한).
+    """
+    snapshot = principal_cache.get(sub)
+    if snapshot is not None:
+        cached = User(**snapshot)
+        make_transient_to_detached(cached)
+        return db.merge(cached, load=False)
+
+    user = db.query(User).filter(User.user_id == sub).first()
+    if user is not None:
+        principal_cache.set(sub, _principal_snapshot(user))
+    return user
+
+
+def invalidate_principal(user_id: int | str) -> None:
+    """유저 row 가 바뀌면 커밋 뒤에 호출 (이 워커의 다음 요청부터 DB 에서 새로 읽음)."""
+    principal_cache.invalidate(str(user_id))
+
+
 def get_current_admin(current_user: User = Depends(get_current_user),
 ) -> User:
 
@@ -0,0 +1,99 @@
+# app/core/slow_query_log.py
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.core.query_stats import current_stats
+
+logger = logging.getLogger("uvicorn.error")
+
+_MAX_SQL_CHARS = 4000
+
+
+def _param_shape(parameters: Any) -> Any:
+    """바인딩 값은 빼고 타입만 남김 (개인정보/토큰이 로그에 남지 않도록)."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _explain_prefix(dialect_name: str) -> Optional[str]:
+    if dialect_name == "sqlite":
+        return "EXPLAIN QUERY PLAN "
+    if dialect_name in ("mysql", "mariadb", "postgresql"):
+        return "EXPLAIN "
+    return None
+
+
+class SlowQueryLog:
+    """임계값을 넘은 SQL 을 최근 max_entries 개까지 보관하는 링 버퍼."""
+
+    def __init__(self, threshold_ms: float, max_entries: int = 100, explain: bool = True):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self._entries: deque = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    # query_stats.add_statement_observer 로 등록되는 콜백
+    def observe(self, conn, cursor, statement, parameters, context, executemany, elapsed_ms) -> None:
+        if elapsed_ms < self.threshold_ms:
+            return
+
+        stats = current_stats()
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "durationMs": round(elapsed_ms, 3),
+            "route": f"{stats.method} {stats.path}" if stats else None,
+            "sql": statement[:_MAX_SQL_CHARS],
+            "paramShape": (
+                {"executemany": len(parameters), "row": _param_shape(parameters[0])}
+                if executemany and parameters
+                else _param_shape(parameters)
+            ),
+            "explain": None,
+        }
+
+        if self.explain and not executemany:
+            entry["explain"] = self._explain(conn, statement, parameters, context)
+
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(
+            f"slow query {elapsed_ms:.1f}ms on {entry['route']}: {statement[:200]}"
+        )
+
+    def _explain(self, conn, statement, parameters, context) -> Optional[List[Any]]:
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return None
+        # 서버사이드 커서로 읽는 중이면 같은 커넥션에서 다른 쿼리를 못 돌림
+        if context is not None and context.execution_options.get("stream_results"):
+            return None
+
+        prefix = _explain_prefix(conn.dialect.name)
+        if prefix is None:
+            return None
+
+        # 같은 DBAPI 커넥션에서 새 커서로 실행 (SQLAlchemy 이벤트는 다시 안 탐)
+        try:
+            explain_cursor = conn.connection.cursor()
+            try:
+                explain_cursor.execute(prefix + statement, parameters)
+                return [list(row) for row in explain_cursor.fetchall()]
+            finally:
+                explain_cursor.close()
+        except Exception as exc:  # EXPLAIN 실패가 본 요청을 깨면 안 됨
+            return [f"EXPLAIN failed: {exc.__class__.__name__}: {exc}"]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,110 @@
+# app/core/token_maintenance.py
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.models.users import UserToken
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def enforce_session_cap(db: Session, user_id: int, max_sessions: int) -> int:
+    """살아있는 refresh token 이 max_sessions 개를 넘으면 오래된 것부터 revoke.
+
+    commit 은 호출한 쪽에서. revoke 한 개수를 돌려줌.
+    """
+    if max_sessions <= 0:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    stale_ids = db.scalars(
+        select(UserToken.user_token_id)
+        .where(
+            UserToken.user_id == user_id,
+            UserToken.revoked_at.is_(None),
+            UserToken.expires_at > now,
+        )
+        .order_by(UserToken.user_token_id.desc())
+        .offset(max_sessions)
+    ).all()
+    if not stale_ids:
+        return 0
+
+    db.execute(
+        update(UserToken)
+        .where(UserToken.user_token_id.in_(stale_ids))
+        .values(revoked_at=now)
+    )
+    return len(stale_ids)
+
+
+def compact_user_tokens(
+    db: Session,
+    *,
+    batch_size: int = 1000,
+    max_batches: Optional[int] = None,
+) -> int:
+    """만료됐거나 revoke 된 user_token row 를 batch_size 단위로 삭제.
+
+    배치마다 commit 해서 락을 짧게 유지함. 삭제한 row 수를 돌려줌.
+    """
+    now = datetime.now(timezone.utc)
+    # 인덱스(ix_user_token_expires_at / ix_user_token_revoked_at)를 각각 타도록 조건을 나눠서 처리
+    conditions = (
+        UserToken.expires_at <= now,
+        UserToken.revoked_at.is_not(None),
+    )
+
+    deleted = 0
+    batches = 0
+    for condition in conditions:
+        while max_batches is None or batches < max_batches:
+            ids = db.scalars(
+                select(UserToken.user_token_id).where(condition).limit(batch_size)
+            ).all()
+            if not ids:
+                break
+
+            db.execute(
+                delete(UserToken)
+                .where(UserToken.user_token_id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            deleted += len(ids)
+            batches += 1
+
+            if len(ids) < batch_size:
+                break
+
+    return deleted
+
+
+async def run_token_compaction_forever(
+    session_factory, interval_sec: int, batch_size: int
+) -> None:
+    """앱 lifespan 에서 띄우는 주기 작업. 취소되면 조용히 종료."""
+    def _once() -> int:
+        db = session_factory()
+        try:
+            return compact_user_tokens(db, batch_size=batch_size)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.sleep(interval_sec)
+        try:
+            deleted = await run_in_threadpool(_once)
+            if deleted:
+                logger.info(f"user_token compaction: deleted {deleted} rows")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("user_token compaction failed")
@@ -1,16 +1,57 @@
 # app/db.py
+import itertools
+from functools import lru_cache
+from typing import List, Tuple
+
+from fastapi import Request
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.core.config import get_settings
+from app.core.pool_metrics import InstrumentedQueuePool
+from app.core.query_stats import add_statement_observer, instrument_engine
+from app.core.slow_query_log import SlowQueryLog
 
 settings = get_settings()
 
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    max_entries=settings.SLOW_QUERY_LOG_SIZE,
+    explain=settings.SLOW_QUERY_EXPLAIN,
+)
+if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    # instrument_engine 이 붙은 모든 엔진(primary/replica/async)에 적용
+    add_statement_observer(slow_query_log.observe)
+
+
+def _pool_kwargs(url: str) -> dict:
+    # SQLite(로컬/테스트)는 파일/메모리 여부에 따라 풀 종류가 달라서 기본값 유지
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
 engine = create_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
+    **_pool_kwargs(settings.DATABASE_URL),
 )
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -29,6 +70,138 @@ def get_db():
         db.close()
 
 
+# ===== read replica =====
+# 안전한 읽기 전용 핸들러만 get_read_db / get_async_read_db 를 사용.
+# 쓰기와 read-your-writes 가 필요한 경로는 계속 get_db(primary).
+def _split_urls(value: str) -> List[str]:
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+replica_engines = [
+    create_engine(url, echo=False, future=True, **_pool_kwargs(url))
+    for url in _split_urls(settings.DATABASE_REPLICA_URLS)
+]
+
+for replica in replica_engines:
+    instrument_engine(replica)
+
+# replica 세션은 info 에 표시 → 캐시들이 replica 에서 읽은 값을 primary 값과 섞지 않도록 (is_replica_session)
+REPLICA_INFO_KEY = "replica"
+
+_replica_sessionmakers = [
+    sessionmaker(autocommit=False, autoflush=False, bind=replica, info={REPLICA_INFO_KEY: True})
+    for replica in replica_engines
+]
+_replica_rr = itertools.count()
+
+
+def is_replica_session(db) -> bool:
+    """Session / AsyncSession 이 replica 에 붙어 있는지."""
+    return bool(db.info.get(REPLICA_INFO_KEY))
+
+
+def wants_primary(request: Request) -> bool:
+    """클라이언트가 방금 쓴 데이터를 바로 읽어야 할 때: X-Read-Consistency: strong"""
+    return request.headers.get("x-read-consistency", "").lower() == "strong"
+
+
+def read_session_factory(request: Request):
+    """replica 가 있으면 round-robin 으로 하나 (X-Read-Consistency: strong 이면 primary)."""
+    if _replica_sessionmakers and not wants_primary(request):
+        return _replica_sessionmakers[next(_replica_rr) % len(_replica_sessionmakers)]
+    return SessionLocal
+
+
+def get_read_db(request: Request):
+    db = read_session_factory(request)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ===== async (AsyncSession) =====
+_ASYNC_DRIVERS = {
+    "mysql+pymysql://": "mysql+aiomysql://",
+    "mysql://": "mysql+aiomysql://",
+    "sqlite+pysqlite://": "sqlite+aiosqlite://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
+
+
+def to_async_url(url: str) -> str:
+    for sync_prefix, async_prefix in _ASYNC_DRIVERS.items():
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+def _async_pool_kwargs(url: str) -> dict:
+    kwargs = _pool_kwargs(url)
+    # async 엔진은 AsyncAdaptedQueuePool 을 써야 해서 poolclass 는 빼고 크기 설정만 전달
+    kwargs.pop("poolclass", None)
+    return kwargs
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    # async 드라이버(aiomysql/aiosqlite)는 처음 쓸 때 로딩 (alembic/seed 는 필요 없음)
+    url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    return _create_instrumented_async_engine(url)
+
+
+def _create_instrumented_async_engine(url: str) -> AsyncEngine:
+    async_engine = create_async_engine(url, echo=False, **_async_pool_kwargs(url))
+    instrument_engine(async_engine.sync_engine)
+    return async_engine
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+@lru_cache
+def get_async_replica_sessionmakers() -> Tuple[async_sessionmaker[AsyncSession], ...]:
+    return tuple(
+        async_sessionmaker(
+            bind=_create_instrumented_async_engine(to_async_url(url)),
+            autoflush=False,
+            expire_on_commit=False,
+            info={REPLICA_INFO_KEY: True},
+        )
+        for url in _split_urls(settings.DATABASE_REPLICA_URLS)
+    )
+
+
+async def get_async_read_db(request: Request):
+    replicas = get_async_replica_sessionmakers()
+    if replicas and not wants_primary(request):
+        factory = replicas[next(_replica_rr) % len(replicas)]
+    else:
+        factory = get_async_sessionmaker()
+    async with factory() as db:
+        yield db
+
+
+async def dispose_async_engines() -> None:
+    """종료 시 async 풀 커넥션 정리. 만들어진 엔진만 (aiosqlite 는 커넥션마다 스레드라 안 닫으면 프로세스가 안 끝남)."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_async_replica_sessionmakers.cache_info().currsize:
+        for factory in get_async_replica_sessionmakers():
+            await factory.kw["bind"].dispose()
+
+
 def init_db():
     # 모델들을 로딩해서 Base.metadata에 등록
     import app.models  # noqa: F401
@@ -10,6 +10,7 @@ from app.api.cart import router as cart_router
 from app.api.orders import router as orders_router
 from app.api.errors import router as test_router
 from app.api.health import router as health_router
+from app.api.admin import router as admin_router
 from app.core.rate_limit_middleware import RateLimitMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -20,14 +21,55 @@ from app.core.error_handlers import (
     validation_exception_handler,
     unhandled_exception_handler,
 )
+from app.core.token_maintenance import run_token_compaction_forever
+from app.core.like_counters import run_like_flush_forever, run_like_reconcile_forever
+from app.core.search import warm_up_search_index
+from app.db import SessionLocal, dispose_async_engines
+from contextlib import asynccontextmanager
+import asyncio
 import os
 
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # memory 검색 색인은 백그라운드 스레드에서 (다 만들어지기 전 검색은 LIKE 로 응답)
+    warm_up_search_index()
+
+    # 주기 작업들 (워커 프로세스마다 하나씩 돎)
+    tasks = []
+    if settings.TOKEN_COMPACTION_INTERVAL_SEC > 0:
+        tasks.append(asyncio.create_task(run_token_compaction_forever(
+            SessionLocal,
+            settings.TOKEN_COMPACTION_INTERVAL_SEC,
+            settings.TOKEN_COMPACTION_BATCH_SIZE,
+        )))
+    if settings.LIKE_COUNTER_MODE == "write_behind":
+        tasks.append(asyncio.create_task(run_like_flush_forever(
+            SessionLocal,
+            settings.LIKE_COUNTER_FLUSH_INTERVAL_SEC,
+        )))
+        if settings.LIKE_COUNTER_RECONCILE_INTERVAL_SEC > 0:
+            tasks.append(asyncio.create_task(run_like_reconcile_forever(
+                SessionLocal,
+                settings.LIKE_COUNTER_RECONCILE_INTERVAL_SEC,
+                settings.LIKE_COUNTER_RECONCILE_BATCH_SIZE,
+            )))
+
+    yield
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await dispose_async_engines()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -54,6 +96,7 @@ app.include_router(cart_router)
 app.include_router(orders_router)
 app.include_router(test_router)
 app.include_router(health_router)
+app.include_router(admin_router)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(Exception, unhandled_exception_handler)
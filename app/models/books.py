@@ -1,5 +1,5 @@
 # app/models/books.py
-from sqlalchemy import Column, BigInteger, String, Text, Date, DateTime,UniqueConstraint,Index, ForeignKey,Integer
+from sqlalchemy import Column, BigInteger, String, Text, Date, DateTime,UniqueConstraint,Index, ForeignKey,Integer, Numeric
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -21,13 +21,41 @@ class Book(Base):
 
     favorites = relationship("Favorite", back_populates="book")
     author_id = Column(BigInteger, ForeignKey("authors.author_id"), nullable=False)
+
+    # 리뷰 별점 집계 (review 작성/별점 수정/삭제 때 같은 트랜잭션에서 증감, app/core/book_ratings.py)
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_5 = Column(Integer, nullable=False, default=0, server_default="0")
+    # sort=rating 용. 리뷰가 없으면 0 (NULL 이면 keyset 비교가 안 돼서)
+    rating_avg = Column(Numeric(3, 2), nullable=False, default=0, server_default="0")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    # 나중에 Author 모델 만들면 여기에 관계 연결
-    author = relationship("Author", back_populates="books", lazy="joined")
+    # 목록마다 authors JOIN 이 붙지 않게 기본은 lazy="select". 필요한 곳에서만 joinedload
+    author = relationship("Author", back_populates="books", lazy="select")
+
+    __table_args__ = (
+        # 목록 keyset 페이지네이션용: (정렬컬럼, book_id) 로 range scan
+        Index("ix_book_created_at_id", "created_at", "book_id"),
+        Index("ix_book_title_id", "title", "book_id"),
+        Index("ix_book_price_id", "price", "book_id"),
+        # 조건부 GET(ETag) 용 버전 인덱스: 행을 읽지 않고 updated_at 만 확인
+        Index("ix_book_version", "book_id", "updated_at"),
+        Index("ix_book_author_version", "author_id", "book_id", "updated_at"),
+        # 목록 필터(author_id / status / 가격 범위 / 출간일) + 정렬, facet GROUP BY 용
+        Index("ix_book_author_created_at", "author_id", "created_at", "book_id"),
+        Index("ix_book_status_created_at", "status", "created_at", "book_id"),
+        Index("ix_book_status_price", "status", "price", "book_id"),
+        Index("ix_book_published_date", "published_date", "book_id"),
+        Index("ix_book_rating_avg_id", "rating_avg", "book_id"),
+    )
 
 class Author(Base):
     __tablename__ = "authors"
@@ -35,6 +63,9 @@ class Author(Base):
     author_id = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(100), nullable=False)
     profile = Column(Text, nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
 
     # Book 쪽과 양방향 관계
     books = relationship("Book", back_populates="author")
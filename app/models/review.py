@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from sqlalchemy import (
     BigInteger, SmallInteger, Integer, Text, DateTime,
-    ForeignKey, UniqueConstraint, func
+    ForeignKey, UniqueConstraint, Index, func
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.db import Base
@@ -11,6 +11,11 @@ from app.db import Base
 
 class Review(Base):
     __tablename__ = "review"
+    __table_args__ = (
+        # 도서별 리뷰 목록: book_id = ? AND deleted_at IS NULL + (정렬컬럼, review_id) keyset 을 인덱스만으로
+        Index("ix_review_book_alive_created", "book_id", "deleted_at", "created_at", "review_id"),
+        Index("ix_review_book_alive_likes", "book_id", "deleted_at", "like_count", "review_id"),
+    )
 
     review_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("user.user_id"), nullable=False, index=True)
@@ -24,9 +29,9 @@ class Review(Base):
     updated_at: Mapped["DateTime"] = mapped_column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     deleted_at: Mapped["DateTime | None"] = mapped_column(DateTime, nullable=True)
 
-    # 관계
-    user = relationship("User", lazy="joined")      # 네 User 모델 클래스명에 맞춰
-    book = relationship("Book", lazy="joined")      # 네 Book 모델 클래스명에 맞춰
+    # 관계. 응답(ReviewOut)에 안 나가므로 기본은 필요할 때만 로드 (목록은 raiseload, 작성자는 expand=user 로 따로 조회)
+    user = relationship("User", lazy="select")
+    book = relationship("Book", lazy="select")
     likes = relationship("ReviewLike", back_populates="review", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="review", cascade="all, delete-orphan")
 
@@ -43,12 +48,16 @@ class ReviewLike(Base):
 
     created_at: Mapped["DateTime"] = mapped_column(DateTime, nullable=False, server_default=func.now())
 
-    user = relationship("User", lazy="joined")
+    user = relationship("User", lazy="select")
     review = relationship("Review", back_populates="likes")
 
 
 class Comment(Base):
     __tablename__ = "comment"
+    __table_args__ = (
+        Index("ix_comment_review_alive_created", "review_id", "deleted_at", "created_at", "comment_id"),
+        Index("ix_comment_review_alive_likes", "review_id", "deleted_at", "like_count", "comment_id"),
+    )
 
     comment_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("user.user_id"), nullable=False, index=True)
@@ -62,7 +71,7 @@ class Comment(Base):
     updated_at: Mapped["DateTime"] = mapped_column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     deleted_at: Mapped["DateTime | None"] = mapped_column(DateTime, nullable=True)
 
-    user = relationship("User", lazy="joined")
+    user = relationship("User", lazy="select")
     review = relationship("Review", back_populates="comments")
     likes = relationship("CommentLike", back_populates="comment_obj", cascade="all, delete-orphan")
 
@@ -79,6 +88,6 @@ class CommentLike(Base):
 
     created_at: Mapped["DateTime"] = mapped_column(DateTime, nullable=False, server_default=func.now())
 
-    user = relationship("User", lazy="joined")
+    user = relationship("User", lazy="select")
     # Comment.comment 이랑 이름 충돌 피하려고 comment_obj
     comment_obj = relationship("Comment", back_populates="likes")
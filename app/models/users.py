@@ -74,8 +74,10 @@ class UserToken(Base):
         ForeignKey("user.user_id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
     )
-    # ↓ VARCHAR(255)에 맞추기
-    refresh_token_hash = Column(String(255), nullable=False)
+    # ↓ VARCHAR(255)에 맞추기 (구버전 bcrypt 해시, 신규 발급분은 NULL)
+    refresh_token_hash = Column(String(255), nullable=True)
+    # HMAC-SHA256(refresh token) hex. 인덱스 한 번으로 토큰 row 조회
+    refresh_token_fingerprint = Column(String(64), nullable=True)
     expires_at = Column(DateTime, nullable=False)
     revoked_at = Column(DateTime, nullable=True)
 
@@ -87,7 +89,14 @@ class UserToken(Base):
     user = relationship("User", back_populates="tokens")
 
     __table_args__ = (
-        Index("ix_user_token_user_id", "user_id"),
+        # (user_id, revoked_at, expires_at): 유저별 live 세션 조회 (세션 상한)
+        Index("ix_user_token_user_live", "user_id", "revoked_at", "expires_at"),
+        # compaction 배치 삭제용
+        Index("ix_user_token_expires_at", "expires_at"),
+        Index("ix_user_token_revoked_at", "revoked_at"),
+        Index(
+            "ux_user_token_fingerprint", "refresh_token_fingerprint", unique=True
+        ),
         UniqueConstraint(
             "user_id", "refresh_token_hash", name="uq_user_token_user_refresh"
         ),
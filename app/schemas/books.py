@@ -39,6 +39,15 @@ class BookUpdatePartial(BaseModel):
 class BookRead(BookBase):
     """조회용 스키마"""
     book_id: int
+    # 별점 요약 (리뷰 작성/수정/삭제 시 갱신되는 집계 컬럼)
+    review_count: int = 0
+    rating_sum: int = 0
+    rating_avg: float = 0
+    rating_1: int = 0
+    rating_2: int = 0
+    rating_3: int = 0
+    rating_4: int = 0
+    rating_5: int = 0
     created_at: datetime
     updated_at: datetime
 
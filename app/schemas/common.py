@@ -3,40 +3,53 @@
 from app.schemas.authors import AuthorRead
 from app.schemas.users import UserRead
 from app.schemas.favorites import FavoriteRead
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import Annotated, Any, Dict, List, Optional, Union
 from app.schemas.orders import OrderRead
 
 class UserListPage(BaseModel):
-    content: List[UserRead]
+    # fields= 를 주면 요청 필드만 담은 dict (dict 는 그대로, ORM 객체는 UserRead 로)
+    content: List[Annotated[Union[Dict[str, Any], UserRead], Field(union_mode="left_to_right")]]
     page: int
     size: int
-    totalElements: int
-    totalPages: int
+    totalElements: Optional[int]
+    totalPages: Optional[int]
+    totalExact: bool = True     # False 면 totalElements 는 추정치(count=approx) 또는 생략(count=none)
     sort: str
 
 
 class AuthorListPage(BaseModel):
-    content: List[AuthorRead]
+    # fields= 를 주면 요청 필드만 담은 dict (dict 는 그대로, ORM 객체는 AuthorRead 로)
+    content: List[Annotated[Union[Dict[str, Any], AuthorRead], Field(union_mode="left_to_right")]]
     page: int
     size: int
-    totalElements: int
-    totalPages: int
+    totalElements: Optional[int]
+    totalPages: Optional[int]
+    totalExact: bool = True     # False 면 totalElements 는 추정치(count=approx) 또는 생략(count=none)
     sort: str
 
 
+
+class AuthorBatch(BaseModel):
+    """GET /authors?ids=... : 요청 순서대로, 없는 id 자리는 null"""
+    content: List[Optional[Annotated[Union[Dict[str, Any], AuthorRead], Field(union_mode="left_to_right")]]]
+    missing: List[int]
+
+
 class OrderListPage(BaseModel):
     content: List[OrderRead]
     page: int
     size: int
-    totalElements: int
-    totalPages: int
+    totalElements: Optional[int]
+    totalPages: Optional[int]
+    totalExact: bool = True     # False 면 totalElements 는 추정치(count=approx) 또는 생략(count=none)
     sort: str
 
 class FavoriteListPage(BaseModel):
     content: List[FavoriteRead]
     page: int
     size: int
-    totalElements: int
-    totalPages: int
+    totalElements: Optional[int]
+    totalPages: Optional[int]
+    totalExact: bool = True     # False 면 totalElements 는 추정치(count=approx) 또는 생략(count=none)
     sort: str
\ No newline at end of file
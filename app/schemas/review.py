@@ -1,7 +1,7 @@
 # app/schemas/review.py
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 
 class ReviewCreate(BaseModel):
@@ -14,6 +14,15 @@ class ReviewUpdate(BaseModel):
     rating: Optional[int] = Field(default=None, ge=1, le=5)
 
 
+class UserSummary(BaseModel):
+    """expand=user 로 붙는 작성자 요약"""
+    user_id: int
+    name: str
+
+    class Config:
+        from_attributes = True
+
+
 class ReviewOut(BaseModel):
     review_id: int
     user_id: int
@@ -23,6 +32,8 @@ class ReviewOut(BaseModel):
     like_count: int
     created_at: datetime
     updated_at: datetime
+    # expand=user 일 때만 채움 (리뷰/댓글 작성자. ORM 관계 이름(user)과 달라야 응답 변환 때 lazy load 안 함)
+    author: Optional[UserSummary] = None
 
     class Config:
         from_attributes = True
@@ -44,20 +55,32 @@ class CommentOut(BaseModel):
     like_count: int
     created_at: datetime
     updated_at: datetime
+    # expand=user 일 때만 채움 (리뷰/댓글 작성자. ORM 관계 이름(user)과 달라야 응답 변환 때 lazy load 안 함)
+    author: Optional[UserSummary] = None
 
     class Config:
         from_attributes = True
 
 
 class PageMeta(BaseModel):
-    page: int
+    page: Optional[int] = None          # offset 모드에서만
     size: int
-    total: int
+    total: Optional[int] = None         # 댓글 커서 모드는 COUNT 안 함
+    sort: Optional[str] = None
+    nextCursor: Optional[str] = None    # cursor 모드에서만
+    prevCursor: Optional[str] = None
+
+
+class RatingSummary(BaseModel):
+    review_count: int
+    rating_avg: float
+    histogram: Dict[int, int]   # 별점(1~5) -> 리뷰 수
 
 
 class ReviewListResponse(BaseModel):
     content: List[ReviewOut]
     meta: PageMeta
+    rating: Optional[RatingSummary] = None
 
 
 class CommentListResponse(BaseModel):
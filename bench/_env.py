@@ -0,0 +1,7 @@
+# bench/_env.py
+# 벤치마크는 .env 없이도 돌 수 있게 최소 환경변수만 채워 둠 (이미 있으면 그대로 사용)
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./bench.db")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+os.environ.setdefault("TESTING", "1")
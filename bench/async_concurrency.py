@@ -0,0 +1,119 @@
+"""고정 워커 스레드 수에서 sync(def + Session) vs async(async def + AsyncSession) 동시성 비교.
+
+    python -m bench.async_concurrency --threads 4 --concurrency 64 --requests 2000 --latency-ms 5
+
+SQLite 는 쿼리가 너무 빨라서 DB 왕복 지연이 안 보이므로, 커넥션마다 sleep_ms() SQL 함수를
+등록해서 쿼리 1회당 --latency-ms 만큼 DB 쪽에서 대기하게 함 (MySQL 네트워크 왕복 흉내).
+- sync : AnyIO 스레드풀(--threads 개) 에서 요청 전체가 실행 → 동시 처리 수 = 스레드 수
+- async: 이벤트 루프에서 실행, DB 대기 중엔 스레드를 잡지 않음 → 동시 처리 수 = 커넥션 풀 크기
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from bench import _env  # noqa: F401
+
+import anyio
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db import Base, SessionLocal, engine, get_async_db, get_async_engine, get_db
+from app.models.books import Author, Book
+
+
+def _install_sleep_fn(target_engine, latency_ms: float) -> None:
+    def sleep_ms(ms):
+        time.sleep(ms / 1000)
+        return 0
+
+    @event.listens_for(target_engine, "connect")
+    def _on_connect(dbapi_connection, _record):
+        dbapi_connection.create_function("sleep_ms", 1, sleep_ms)
+
+
+def _seed(n_books: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if db.scalar(select(func.count()).select_from(Book)) >= n_books:
+            return
+        # BigInteger PK 는 SQLite 에서 자동증가가 안 돼서 id 를 직접 지정
+        author = Author(author_id=1, name="bench", profile="bench")
+        db.add(author)
+        db.flush()
+        db.add_all(
+            Book(book_id=i, title=f"Book {i}", price=1000, stock=1, status="active",
+                 author_id=author.author_id)
+            for i in range(1, n_books + 1)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _build_app(latency_ms: float) -> FastAPI:
+    bench_app = FastAPI()
+
+    @bench_app.get("/sync/{book_id}")
+    def sync_get(book_id: int, db: Session = Depends(get_db)):
+        book = db.scalar(select(Book).where(Book.book_id == book_id, func.sleep_ms(latency_ms) == 0))
+        return {"book_id": book.book_id, "title": book.title}
+
+    @bench_app.get("/async/{book_id}")
+    async def async_get(book_id: int, db: AsyncSession = Depends(get_async_db)):
+        book = await db.scalar(select(Book).where(Book.book_id == book_id, func.sleep_ms(latency_ms) == 0))
+        return {"book_id": book.book_id, "title": book.title}
+
+    return bench_app
+
+
+async def _drive(client: httpx.AsyncClient, prefix: str, total: int, concurrency: int, n_books: int):
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with sem:
+            r = await client.get(f"/{prefix}/{i % n_books + 1}")
+            r.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return time.perf_counter() - start
+
+
+async def main_async(args) -> None:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+    transport = httpx.ASGITransport(app=_build_app(args.latency_ms))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for prefix in ("sync", "async"):
+            await _drive(client, prefix, min(50, args.requests), args.concurrency, args.books)  # warm-up
+            elapsed = await _drive(client, prefix, args.requests, args.concurrency, args.books)
+            print(f"{prefix:<6} threads={args.threads} concurrency={args.concurrency} "
+                  f"{args.requests} req in {elapsed:6.2f}s -> {args.requests / elapsed:8.1f} req/s")
+    # aiosqlite 커넥션 스레드가 남아 있으면 프로세스가 안 끝남
+    await get_async_engine().dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=4, help="AnyIO 워커 스레드 수 (고정)")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--books", type=int, default=1000)
+    args = parser.parse_args()
+
+    if not os.environ["DATABASE_URL"].startswith("sqlite"):
+        raise SystemExit("이 벤치마크는 SQLite 전용 (sleep_ms 함수 등록)")
+
+    _install_sleep_fn(engine, args.latency_ms)
+    _install_sleep_fn(get_async_engine().sync_engine, args.latency_ms)
+    _seed(args.books)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
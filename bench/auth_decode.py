@@ -0,0 +1,47 @@
+"""JWT decode 캐시 유무에 따른 요청당 인증 오버헤드 비교.
+
+    python -m bench.auth_decode --iterations 20000
+
+- no-cache : 매 요청 jwt.decode + TokenPayload 생성 (기존 동작)
+- cache    : decode_token (sha256 digest 로 캐시 조회) + TokenPayload 생성
+"""
+import argparse
+import time
+
+from bench import _env  # noqa: F401
+from jose import jwt
+
+from app.core.config import get_settings
+from app.core.security import create_access_token, decode_token, decoded_token_cache
+from app.schemas.auth import TokenPayload
+
+
+def _run(label: str, fn, token: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        TokenPayload(**fn(token))
+    elapsed = time.perf_counter() - start
+    per_req_us = elapsed / iterations * 1e6
+    print(f"{label:<10} {iterations:>8} req  {elapsed:8.3f}s  {per_req_us:8.2f} us/req")
+    return per_req_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    token = create_access_token({"sub": "1", "role": "user"})
+
+    def raw_decode(t: str):
+        return jwt.decode(t, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+
+    decoded_token_cache.clear()
+    base = _run("no-cache", raw_decode, token, args.iterations)
+    cached = _run("cache", decode_token, token, args.iterations)
+    print(f"speedup    x{base / cached:.1f}  cache={decoded_token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
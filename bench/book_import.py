@@ -0,0 +1,130 @@
+"""도서 일괄 등록 처리량: import_books(청크 executemany) vs 기존 방식(행마다 저자 조회 + INSERT + 커밋).
+
+    python -m bench.book_import --rows 200000 --format csv
+
+- 임시 SQLite 파일 DB 에 저자 1000 명 + (--existing 건) 도서를 미리 넣고
+- 합성 CSV/NDJSON (--rows 행, ISBN 중복 --dup-ratio, 없는 저자 --bad-author-ratio) 를 메모리에서 생성
+- import     : iter_rows + import_books (rows/sec, inserted/failed)
+- per-row    : 같은 데이터 앞 --baseline-rows 행을 create_book 처럼 한 건씩 (rows/sec)
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import tempfile
+import time
+
+from bench import _env  # noqa: F401
+from sqlalchemy import BigInteger, create_engine, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from app.core.book_import import import_books, iter_rows
+from app.db import Base
+from app.models.books import Author, Book
+
+FIELDS = ["title", "description", "isbn", "price", "stock", "status", "published_date", "author_id"]
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite 는 INTEGER PRIMARY KEY 일 때만 rowid 자동 증가 → 벤치 DB 에서만 치환
+    return "INTEGER"
+
+
+def _rows(n: int, dup_ratio: float, bad_author_ratio: float, seed: int):
+    rng = random.Random(seed)
+    for i in range(n):
+        isbn = f"978{rng.randrange(i + 1):010d}" if rng.random() < dup_ratio else f"979{i:010d}"
+        author_id = 99999 if rng.random() < bad_author_ratio else rng.randint(1, 1000)
+        yield {
+            "title": f"imported book {i}",
+            "description": "lorem ipsum dolor sit amet " * 4,
+            "isbn": isbn,
+            "price": rng.randint(5000, 50000),
+            "stock": rng.randint(0, 100),
+            "status": "active",
+            "published_date": f"20{rng.randint(10, 24)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+            "author_id": author_id,
+        }
+
+
+def _payload(rows, fmt: str) -> bytes:
+    buffer = io.StringIO()
+    if fmt == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            buffer.write(json.dumps(row) + "\n")
+    return buffer.getvalue().encode("utf-8")
+
+
+def _fresh_db(path: str, existing: int):
+    if os.path.exists(path):
+        os.remove(path)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[Author.__table__, Book.__table__])
+    with engine.begin() as conn:
+        conn.execute(Author.__table__.insert(), [{"author_id": i, "name": f"author {i}"} for i in range(1, 1001)])
+        if existing:
+            conn.execute(
+                Book.__table__.insert(),
+                [
+                    {"title": f"existing {i}", "isbn": f"978{i:010d}", "price": 1000, "stock": 1, "author_id": 1}
+                    for i in range(existing)
+                ],
+            )
+    return engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--existing", type=int, default=10_000, help="미리 넣어 둘 도서 수 (ISBN 충돌 대상)")
+    parser.add_argument("--dup-ratio", type=float, default=0.01)
+    parser.add_argument("--bad-author-ratio", type=float, default=0.005)
+    parser.add_argument("--baseline-rows", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = list(_rows(args.rows, args.dup_ratio, args.bad_author_ratio, args.seed))
+    payload = _payload(rows, args.format)
+    print(f"payload {args.format} {len(payload) / 1024 / 1024:.1f}MB, {args.rows} rows")
+
+    path = os.path.join(tempfile.gettempdir(), "bench_book_import.db")
+
+    engine = _fresh_db(path, args.existing)
+    with Session(engine) as db:
+        start = time.perf_counter()
+        report = import_books(db, iter_rows(io.BytesIO(payload), args.format), chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+    print(f"import    {args.rows / elapsed:>10,.0f} rows/s  {elapsed:6.2f}s  "
+          f"inserted={report.inserted} failed={report.failed}")
+    engine.dispose()
+
+    engine = _fresh_db(path, args.existing)
+    sample = rows[: args.baseline_rows]
+    with Session(engine) as db:
+        start = time.perf_counter()
+        for row in sample:
+            if db.scalar(select(Author).where(Author.author_id == row["author_id"])) is None:
+                continue
+            db.add(Book(**{**row, "published_date": None}))
+            try:
+                db.commit()
+            except Exception:
+                db.rollback()
+        elapsed = time.perf_counter() - start
+    print(f"per-row   {len(sample) / elapsed:>10,.0f} rows/s  {elapsed:6.2f}s  ({len(sample)} rows)")
+    engine.dispose()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
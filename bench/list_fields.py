@@ -0,0 +1,110 @@
+"""도서 목록 1페이지: 기존(authors JOIN + 전체 컬럼) vs 기본(JOIN 없음) vs fields= (load_only).
+
+    python -m bench.list_fields --books 20000 --size 20 --description-bytes 2000
+
+- SQLite(:memory:) 에 도서 N 건(description 은 --description-bytes 길이) + 저자(profile 포함) 생성
+- 각 방식마다 1페이지(ORDER BY created_at DESC LIMIT size) 를 --repeat 번
+  read-ms  : 쿼리 실행 + ORM 객체 생성
+  db-bytes : DB 에서 읽은 컬럼 값 크기 합 (같은 SQL 을 드라이버로 직접 실행해서 계산)
+  ser-ms   : 응답 content 직렬화(jsonable_encoder + json.dumps)
+  resp     : 응답 content JSON 크기
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from bench import _env  # noqa: F401
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.fields import dump_page, parse_fields
+from app.db import Base
+from app.models.books import Author, Book
+from app.schemas.authors import AuthorRead
+from app.schemas.books import BookRead
+
+
+def _seed(engine, books: int, description_bytes: int) -> None:
+    Base.metadata.create_all(engine, tables=[Author.__table__, Book.__table__])
+    now = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(
+            Author.__table__.insert(),
+            [{"author_id": i, "name": f"author {i}", "profile": "p" * 1000} for i in range(1, 101)],
+        )
+        conn.execute(
+            Book.__table__.insert(),
+            [
+                {
+                    "book_id": i,
+                    "title": f"book title {i}",
+                    "description": ("lorem ipsum " * (description_bytes // 12 + 1))[:description_bytes],
+                    "isbn": f"isbn-{i}",
+                    "price": 10000 + i % 500,
+                    "stock": i % 30,
+                    "status": "active",
+                    "author_id": i % 100 + 1,
+                    "created_at": now + timedelta(seconds=i),
+                    "updated_at": now + timedelta(seconds=i),
+                }
+                for i in range(1, books + 1)
+            ],
+        )
+
+
+def _db_bytes(session: Session, stmt) -> int:
+    # ORM 과 같은 SQL 을 드라이버 커서로 실행해서 실제로 넘어온 값 크기를 셈
+    compiled = stmt.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.execute(str(compiled))
+        return sum(len(str(value)) for row in cursor.fetchall() for value in row if value is not None)
+    finally:
+        cursor.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=20_000)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--description-bytes", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    _seed(engine, args.books, args.description_bytes)
+
+    def page(*options):
+        return select(Book).options(*options).order_by(Book.created_at.desc()).limit(args.size)
+
+    scenarios = []
+    scenarios.append(("before: joined author", page(joinedload(Book.author)), None))
+    scenarios.append(("default: no author", page(), None))
+    for raw in ("book_id,title,price", "title,price,author"):
+        fieldset = parse_fields(raw, Book, BookRead, pk="book_id", relations={"author": AuthorRead})
+        scenarios.append((f"fields={raw}", page(*fieldset.options(Book.created_at)), fieldset))
+
+    for label, stmt, fieldset in scenarios:
+        reads, sers = [], []
+        body = b""
+        for _ in range(args.repeat):
+            with Session(engine) as session:
+                start = time.perf_counter()
+                items = session.scalars(stmt).all()
+                reads.append((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                body = json.dumps(jsonable_encoder(dump_page(items, fieldset))).encode("utf-8")
+                sers.append((time.perf_counter() - start) * 1000)
+
+        with Session(engine) as session:
+            db_bytes = _db_bytes(session, stmt)
+        print(f"{label:<28} read-ms p50={statistics.median(reads):6.3f}  db-bytes={db_bytes:>8}  "
+              f"ser-ms p50={statistics.median(sers):6.3f}  resp={len(body):>7}B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""bcrypt cost 별 코어당 로그인 처리량.
+
+    python -m bench.login_throughput --min-rounds 10 --max-rounds 13 --seconds 2
+
+로그인 1회 = 비밀번호 검증 1회(bcrypt_sha256) 로 보고,
+- 1 스레드로 돌린 logins/sec → 코어당 처리량
+- --threads 개 스레드로 돌린 logins/sec → 장비 전체 처리량 (bcrypt 는 GIL 을 놓음)
+을 cost 별로 출력함.
+"""
+import argparse
+import os
+import threading
+import time
+
+from passlib.context import CryptContext
+
+PASSWORD = "P@ssw0rd!"
+
+
+def _throughput(ctx: CryptContext, hashed: str, threads: int, seconds: float) -> float:
+    done = [0] * threads
+    deadline = time.perf_counter() + seconds
+
+    def worker(idx: int) -> None:
+        while time.perf_counter() < deadline:
+            ctx.verify(PASSWORD, hashed)
+            done[idx] += 1
+
+    start = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return sum(done) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=13)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{'rounds':>6} {'verify ms':>10} {'logins/s/core':>14} {f'logins/s x{args.threads}':>16}")
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        ctx = CryptContext(schemes=["bcrypt_sha256"], bcrypt_sha256__rounds=rounds)
+        hashed = ctx.hash(PASSWORD)
+        per_core = _throughput(ctx, hashed, 1, args.seconds)
+        total = _throughput(ctx, hashed, args.threads, args.seconds)
+        print(f"{rounds:>6} {1000 / per_core:>10.1f} {per_core:>14.1f} {total:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
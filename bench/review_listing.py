@@ -0,0 +1,125 @@
+"""리뷰 목록 1페이지: 기존(user/book/authors joined eager) vs 기본(관계 로드 안 함) vs expand=user(IN 쿼리 1번 추가).
+
+    python -m bench.review_listing --reviews 20000 --size 20 --profile-bytes 1000
+
+- SQLite(:memory:) 에 유저/저자/도서(profile, description 은 --profile-bytes 길이) + 도서 1권에 리뷰 N 건
+- 각 방식마다 1페이지(WHERE book_id ORDER BY created_at DESC LIMIT size) 를 --repeat 번
+  read-ms  : 쿼리 실행 + ORM 객체 생성 + ReviewOut 변환 (expand=user 는 작성자 조회 포함)
+  cols     : SELECT 컬럼 수 (행 폭)
+  db-bytes : DB 에서 읽은 컬럼 값 크기 합 (같은 SQL 을 드라이버로 직접 실행해서 계산)
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from bench import _env  # noqa: F401
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, joinedload, raiseload
+
+from app.db import Base
+from app.models.books import Author, Book
+from app.models.review import Review
+from app.models.users import User
+from app.schemas.review import ReviewOut, UserSummary
+
+
+def _seed(engine, reviews: int, profile_bytes: int) -> None:
+    tables = [User.__table__, Author.__table__, Book.__table__, Review.__table__]
+    Base.metadata.create_all(engine, tables=tables)
+    blob = ("lorem ipsum " * (profile_bytes // 12 + 1))[:profile_bytes]
+    now = datetime(2025, 1, 1)
+    users = min(reviews, 1000)
+    with engine.begin() as conn:
+        conn.execute(
+            User.__table__.insert(),
+            [
+                {"user_id": i, "email": f"user{i}@example.com", "password": "x" * 60, "name": f"user {i}",
+                 "role": "user", "status": "active", "is_korean": True, "profile": blob}
+                for i in range(1, users + 1)
+            ],
+        )
+        conn.execute(Author.__table__.insert(), [{"author_id": 1, "name": "author", "profile": blob}])
+        conn.execute(
+            Book.__table__.insert(),
+            [{"book_id": 1, "title": "book", "description": blob, "price": 10000, "stock": 1, "author_id": 1}],
+        )
+        conn.execute(
+            Review.__table__.insert(),
+            [
+                {"review_id": i, "user_id": i % users + 1, "book_id": 1, "content": "good book " * 10,
+                 "rating": i % 5 + 1, "like_count": 0,
+                 "created_at": now + timedelta(seconds=i), "updated_at": now + timedelta(seconds=i)}
+                for i in range(1, reviews + 1)
+            ],
+        )
+
+
+def _db_width(session: Session, stmt):
+    """(SELECT 컬럼 수, 읽은 값 크기 합). ORM 과 같은 SQL 을 드라이버 커서로 실행해서 계산."""
+    compiled = stmt.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.execute(str(compiled))
+        size = sum(len(str(value)) for row in cursor.fetchall() for value in row if value is not None)
+        return len(cursor.description), size
+    finally:
+        cursor.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reviews", type=int, default=20_000)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--profile-bytes", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    _seed(engine, args.reviews, args.profile_bytes)
+
+    def page(*options):
+        return (
+            select(Review).options(*options)
+            .where(Review.book_id == 1, Review.deleted_at.is_(None))
+            .order_by(Review.created_at.desc())
+            .limit(args.size)
+        )
+
+    # 기존 모델: Review.user / Review.book 이 lazy="joined" 였고 Book.author 도 joined
+    before = page(joinedload(Review.user), joinedload(Review.book).joinedload(Book.author))
+    default = page(raiseload("*"))
+
+    def run(session, stmt, expand):
+        rows = session.scalars(stmt).unique().all()
+        content = [ReviewOut.model_validate(row) for row in rows]
+        if expand:
+            names = dict(session.execute(
+                select(User.user_id, User.name).where(User.user_id.in_({row.user_id for row in rows}))
+            ).all())
+            for item in content:
+                item.author = UserSummary(user_id=item.user_id, name=names[item.user_id])
+        return content
+
+    for label, stmt, expand in (
+        ("before: joined user/book/author", before, False),
+        ("default: no relations", default, False),
+        ("expand=user", default, True),
+    ):
+        reads = []
+        for _ in range(args.repeat):
+            with Session(engine) as session:
+                start = time.perf_counter()
+                run(session, stmt, expand)
+                reads.append((time.perf_counter() - start) * 1000)
+
+        with Session(engine) as session:
+            cols, db_bytes = _db_width(session, stmt)
+            if expand:
+                db_bytes += _db_width(session, select(User.user_id, User.name).limit(args.size))[1]
+        print(f"{label:<34} read-ms p50={statistics.median(reads):6.3f}  "
+              f"cols={cols:>3}  db-bytes={db_bytes:>8}")
+
+
+if __name__ == "__main__":
+    main()
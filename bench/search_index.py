@@ -0,0 +1,128 @@
+"""도서 키워드 검색: memory 역색인 vs 기존 LIKE 스캔.
+
+    python -m bench.search_index --docs 1000000
+
+- 합성 도서 N 건 (Zipf 분포 단어로 제목 3~6 단어 + 설명 10~30 단어) 생성
+- memory : SearchIndex 빌드 시간/메모리, 희귀/보통/흔한 단어, 2단어 AND, prefix 질의 지연
+           (결과 캐시를 비운 계산 시간 + 캐시된 다음 페이지 조회 시간)
+- like   : 같은 데이터를 SQLite(:memory:) 에 넣고 title/description LIKE '%kw%' + COUNT (기존 list_books 방식)
+"""
+import argparse
+import random
+import resource
+import sqlite3
+import statistics
+import time
+
+from bench import _env  # noqa: F401
+
+from app.core.search import SearchIndex
+
+
+def _vocabulary(size: int, rng: random.Random):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(3, 9))))
+    return sorted(words)
+
+
+def _documents(n: int, vocab, seed: int):
+    rng = random.Random(seed)
+    # Zipf 비슷하게: 앞쪽 단어일수록 자주 등장
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    cum = list(_accumulate(weights))
+    for doc_id in range(1, n + 1):
+        title = " ".join(rng.choices(vocab, cum_weights=cum, k=rng.randint(3, 6)))
+        description = " ".join(rng.choices(vocab, cum_weights=cum, k=rng.randint(10, 30)))
+        yield doc_id, title, description
+
+
+def _accumulate(values):
+    total = 0.0
+    for value in values:
+        total += value
+        yield total
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _timed(fn, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(samples), max(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--vocab", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-like", action="store_true", help="SQLite LIKE 비교 생략")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    vocab = _vocabulary(args.vocab, random.Random(args.seed))
+    queries = {
+        "rare": vocab[-1],
+        "medium": vocab[len(vocab) // 50],
+        "common": vocab[0],
+        "two-terms": f"{vocab[3]} {vocab[len(vocab) // 100]}",
+        "prefix": vocab[len(vocab) // 10][:3],
+    }
+
+    rss_before = _rss_mb()
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.build(_documents(args.docs, vocab, args.seed))
+    build_s = time.perf_counter() - start
+    stats = index.stats()
+    print(f"memory build  {stats['docs']:>9} docs  {stats['terms']:>7} terms  "
+          f"{build_s:7.1f}s  maxrss +{_rss_mb() - rss_before:.0f}MB")
+
+    for label, query in queries.items():
+        def cold():
+            index._results.clear()  # 결과 캐시 없이 매번 계산
+            return index.search(query, 0, 20)
+
+        (total, _), p50, worst = _timed(cold, args.repeat)
+        _, cached, _ = _timed(lambda: index.search(query, 20, 20), args.repeat)
+        print(f"memory {label:<10} {query!r:<22} hits={total:>8}  p50={p50:8.2f}ms  "
+              f"max={worst:8.2f}ms  cached-page2={cached:6.3f}ms")
+
+    start = time.perf_counter()
+    for doc_id in range(1, 1001):
+        index.upsert(doc_id, f"updated {vocab[5]}", "changed description")
+    print(f"memory upsert 1000 docs  {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    if args.no_like:
+        return
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE book (book_id INTEGER PRIMARY KEY, title TEXT, description TEXT)")
+    conn.executemany("INSERT INTO book VALUES (?, ?, ?)", _documents(args.docs, vocab, args.seed))
+    conn.commit()
+    for label, query in queries.items():
+        like = f"%{query}%"
+
+        def run_like():
+            total = conn.execute(
+                "SELECT COUNT(*) FROM book WHERE title LIKE ? OR description LIKE ?", (like, like)
+            ).fetchone()[0]
+            conn.execute(
+                "SELECT * FROM book WHERE title LIKE ? OR description LIKE ? LIMIT 20", (like, like)
+            ).fetchall()
+            return total
+
+        total, p50, worst = _timed(run_like, max(1, args.repeat // 2))
+        print(f"like   {label:<10} {query!r:<22} hits={total:>8}  p50={p50:8.2f}ms  max={worst:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# manage.py
+"""운영용 CLI.
+
+    python manage.py calibrate-password --target-ms 250
+    python manage.py compact-tokens --batch-size 1000
+    python manage.py import-books catalog.csv
+    python manage.py rebuild-ratings --dry-run
+    python manage.py reconcile-likes --dry-run
+"""
+import argparse
+
+
+def cmd_calibrate_password(args):
+    from app.core.password_calibration import calibrate_rounds
+
+    result = calibrate_rounds(
+        args.target_ms,
+        min_rounds=args.min_rounds,
+        max_rounds=args.max_rounds,
+        samples=args.samples,
+    )
+    for rounds, ms in result["measured"].items():
+        print(f"rounds={rounds:<3} hash={ms:8.1f}ms")
+    print(f"\n추천 설정 (목표 {args.target_ms}ms 이내):")
+    print(f"PASSWORD_HASH_ROUNDS={result['rounds']}")
+
+
+def cmd_compact_tokens(args):
+    from app.db import SessionLocal
+    from app.core.token_maintenance import compact_user_tokens
+
+    db = SessionLocal()
+    try:
+        deleted = compact_user_tokens(
+            db, batch_size=args.batch_size, max_batches=args.max_batches
+        )
+    finally:
+        db.close()
+    print(f"deleted user_token rows: {deleted}")
+
+
+def cmd_import_books(args):
+    import json
+
+    from app.core.book_import import detect_format, import_books, iter_rows
+    from app.db import SessionLocal
+
+    fmt = args.format or detect_format(None, args.path)
+    if fmt is None:
+        raise SystemExit("형식을 알 수 없음: --format csv|ndjson 지정")
+
+    db = SessionLocal()
+    try:
+        with open(args.path, "rb") as fileobj:
+            report = import_books(db, iter_rows(fileobj, fmt), chunk_size=args.chunk_size)
+    finally:
+        db.close()
+
+    result = report.to_dict()
+    rate = report.total / (report.elapsed_ms / 1000) if report.elapsed_ms else 0.0
+    print(f"total={result['total']} inserted={result['inserted']} failed={result['failed']} "
+          f"elapsed={result['elapsedMs']}ms ({rate:,.0f} rows/s)")
+    for error in result["errors"][: args.show_errors]:
+        print(json.dumps(error, ensure_ascii=False))
+    if result["errorsTruncated"] or result["failed"] > args.show_errors:
+        print(f"... 실패 {result['failed']}건 중 {min(args.show_errors, len(result['errors']))}건만 표시")
+
+
+def cmd_rebuild_ratings(args):
+    from app.core.book_ratings import rebuild_ratings
+    from app.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        checked, mismatched, fixed = rebuild_ratings(db, batch_size=args.batch_size, dry_run=args.dry_run)
+    finally:
+        db.close()
+    print(f"checked books: {checked}, mismatched: {mismatched}, fixed: {fixed}")
+    if mismatched > fixed and not args.dry_run:
+        print("일부는 확인하는 사이 리뷰가 바뀌어 건너뜀 → 다시 실행")
+
+
+def cmd_reconcile_likes(args):
+    from app.core.like_counters import reconcile_like_counts
+    from app.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        result = reconcile_like_counts(db, batch_size=args.batch_size, dry_run=args.dry_run)
+    finally:
+        db.close()
+    for kind, (checked, mismatched, fixed) in result.items():
+        print(f"{kind}: checked {checked}, mismatched {mismatched}, fixed {fixed}")
+    if any(mismatched > fixed for _, mismatched, fixed in result.values()) and not args.dry_run:
+        print("일부는 확인하는 사이 좋아요가 바뀌었거나 아직 flush 전이라 건너뜀 → 다시 실행")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="manage.py")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("calibrate-password", help="이 장비 기준 bcrypt cost 산정")
+    p.add_argument("--target-ms", type=float, default=250.0, help="해시 1회 목표 지연(ms)")
+    p.add_argument("--min-rounds", type=int, default=10)
+    p.add_argument("--max-rounds", type=int, default=16)
+    p.add_argument("--samples", type=int, default=5)
+    p.set_defaults(func=cmd_calibrate_password)
+
+    p = sub.add_parser("compact-tokens", help="만료/revoke 된 user_token 배치 삭제")
+    p.add_argument("--batch-size", type=int, default=1000)
+    p.add_argument("--max-batches", type=int, default=None)
+    p.set_defaults(func=cmd_compact_tokens)
+
+    p = sub.add_parser("import-books", help="CSV/NDJSON 파일로 도서 일괄 등록")
+    p.add_argument("path", help="*.csv | *.ndjson | *.jsonl")
+    p.add_argument("--format", choices=["csv", "ndjson"], default=None, help="확장자로 판단 못 할 때 지정")
+    p.add_argument("--chunk-size", type=int, default=None, help="기본 BOOK_IMPORT_CHUNK_SIZE")
+    p.add_argument("--show-errors", type=int, default=20)
+    p.set_defaults(func=cmd_import_books)
+
+    p = sub.add_parser("rebuild-ratings", help="review 테이블 기준으로 book 별점 집계 재계산/복구")
+    p.add_argument("--batch-size", type=int, default=1000)
+    p.add_argument("--dry-run", action="store_true", help="어긋난 도서 수만 세고 고치지 않음")
+    p.set_defaults(func=cmd_rebuild_ratings)
+
+    p = sub.add_parser("reconcile-likes", help="review_like/comment_like 기준으로 like_count 재계산/복구")
+    p.add_argument("--batch-size", type=int, default=1000)
+    p.add_argument("--dry-run", action="store_true", help="어긋난 수만 세고 고치지 않음")
+    p.set_defaults(func=cmd_reconcile_likes)
+
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
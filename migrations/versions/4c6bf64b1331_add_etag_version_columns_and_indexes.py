@@ -0,0 +1,37 @@
+"""add etag version columns and indexes
+
+Revision ID: 4c6bf64b1331
+Revises: ce7ca69c9a5a
+Create Date: 2026-10-17 11:32:05.127764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c6bf64b1331'
+down_revision: Union[str, Sequence[str], None] = 'ce7ca69c9a5a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 마이그레이션 시각으로 채워짐 (SQLite 는 ADD COLUMN 에 CURRENT_TIMESTAMP 기본값이 안 돼서 batch)
+    with op.batch_alter_table('authors') as batch_op:
+        batch_op.add_column(
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True)
+        )
+    op.create_index('ix_book_version', 'book', ['book_id', 'updated_at'], unique=False)
+    op.create_index('ix_book_author_version', 'book', ['author_id', 'book_id', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_book_author_version', table_name='book')
+    op.drop_index('ix_book_version', table_name='book')
+    with op.batch_alter_table('authors') as batch_op:
+        batch_op.drop_column('updated_at')
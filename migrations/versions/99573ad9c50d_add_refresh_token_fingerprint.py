@@ -0,0 +1,54 @@
+"""add refresh token fingerprint to user_token
+
+Revision ID: 99573ad9c50d
+Revises: 24c5fdbbba23
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '99573ad9c50d'
+down_revision: Union[str, Sequence[str], None] = '24c5fdbbba23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'user_token',
+        sa.Column('refresh_token_fingerprint', sa.String(length=64), nullable=True),
+    )
+    op.create_index(
+        'ux_user_token_fingerprint', 'user_token', ['refresh_token_fingerprint'], unique=True
+    )
+    op.alter_column(
+        'user_token', 'refresh_token_hash',
+        existing_type=sa.String(length=255),
+        nullable=True,
+    )
+
+    # 기존 row 는 bcrypt 해시만 있어서 지문을 역산할 수 없음 → 살아있는 토큰은 revoke
+    # (해당 유저들은 다시 로그인해야 함)
+    op.execute(
+        "UPDATE user_token SET revoked_at = CURRENT_TIMESTAMP "
+        "WHERE refresh_token_fingerprint IS NULL AND revoked_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 지문만 있는 row 는 예전 방식으로 검증할 수 없으므로 삭제
+    op.execute("DELETE FROM user_token WHERE refresh_token_hash IS NULL")
+    op.alter_column(
+        'user_token', 'refresh_token_hash',
+        existing_type=sa.String(length=255),
+        nullable=False,
+    )
+    op.drop_index('ux_user_token_fingerprint', table_name='user_token')
+    op.drop_column('user_token', 'refresh_token_fingerprint')
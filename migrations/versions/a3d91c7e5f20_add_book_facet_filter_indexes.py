@@ -0,0 +1,36 @@
+"""add book facet filter indexes
+
+Revision ID: a3d91c7e5f20
+Revises: 4c6bf64b1331
+Create Date: 2026-10-17 14:08:41.503917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d91c7e5f20'
+down_revision: Union[str, Sequence[str], None] = '4c6bf64b1331'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 필터 컬럼을 앞에, 목록 정렬 컬럼 + book_id 를 뒤에 → 필터 + keyset 정렬이 인덱스 range scan
+    op.create_index('ix_book_author_created_at', 'book', ['author_id', 'created_at', 'book_id'], unique=False)
+    op.create_index('ix_book_status_created_at', 'book', ['status', 'created_at', 'book_id'], unique=False)
+    # status + 가격 범위 필터, 가격대 facet(GROUP BY 가격대)을 인덱스만으로 계산
+    op.create_index('ix_book_status_price', 'book', ['status', 'price', 'book_id'], unique=False)
+    op.create_index('ix_book_published_date', 'book', ['published_date', 'book_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_book_published_date', table_name='book')
+    op.drop_index('ix_book_status_price', table_name='book')
+    op.drop_index('ix_book_status_created_at', table_name='book')
+    op.drop_index('ix_book_author_created_at', table_name='book')
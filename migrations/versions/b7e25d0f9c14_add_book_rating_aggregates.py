@@ -0,0 +1,53 @@
+"""add book rating aggregates
+
+Revision ID: b7e25d0f9c14
+Revises: a3d91c7e5f20
+Create Date: 2026-10-17 16:21:09.338412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e25d0f9c14'
+down_revision: Union[str, Sequence[str], None] = 'a3d91c7e5f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNT_COLUMNS = ['review_count', 'rating_sum', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('book') as batch_op:
+        for name in _COUNT_COLUMNS:
+            batch_op.add_column(sa.Column(name, sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('rating_avg', sa.Numeric(3, 2), server_default='0', nullable=False))
+    op.create_index('ix_book_rating_avg_id', 'book', ['rating_avg', 'book_id'], unique=False)
+
+    # 기존 리뷰로 채움 (이후 어긋나면 python manage.py rebuild-ratings)
+    # review 테이블은 마이그레이션이 아니라 create_all 로 생기는 환경이 있어서 있을 때만
+    if not sa.inspect(op.get_bind()).has_table('review'):
+        return
+    alive = "FROM review r WHERE r.book_id = book.book_id AND r.deleted_at IS NULL"
+    op.execute(
+        "UPDATE book SET "
+        f"review_count = (SELECT COUNT(*) {alive}), "
+        f"rating_sum = (SELECT COALESCE(SUM(r.rating), 0) {alive}), "
+        + ", ".join(f"rating_{star} = (SELECT COUNT(*) {alive} AND r.rating = {star})" for star in range(1, 6))
+    )
+    op.execute(
+        "UPDATE book SET rating_avg = ROUND(rating_sum * 1.0 / review_count, 2) WHERE review_count > 0"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_book_rating_avg_id', table_name='book')
+    with op.batch_alter_table('book') as batch_op:
+        batch_op.drop_column('rating_avg')
+        for name in reversed(_COUNT_COLUMNS):
+            batch_op.drop_column(name)
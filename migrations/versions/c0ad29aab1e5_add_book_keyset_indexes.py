@@ -0,0 +1,33 @@
+"""add book keyset indexes
+
+Revision ID: c0ad29aab1e5
+Revises: f2304631de13
+Create Date: 2026-10-17 10:21:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0ad29aab1e5'
+down_revision: Union[str, Sequence[str], None] = 'f2304631de13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /books?cursor= 의 정렬 키마다 (정렬컬럼, book_id) 복합 인덱스
+    op.create_index('ix_book_created_at_id', 'book', ['created_at', 'book_id'], unique=False)
+    op.create_index('ix_book_title_id', 'book', ['title', 'book_id'], unique=False)
+    op.create_index('ix_book_price_id', 'book', ['price', 'book_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_book_price_id', table_name='book')
+    op.drop_index('ix_book_title_id', table_name='book')
+    op.drop_index('ix_book_created_at_id', table_name='book')
@@ -0,0 +1,43 @@
+"""add review comment listing indexes
+
+Revision ID: c1f4a8e2d357
+Revises: b7e25d0f9c14
+Create Date: 2026-10-17 18:47:52.904166
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1f4a8e2d357'
+down_revision: Union[str, Sequence[str], None] = 'b7e25d0f9c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (부모 id, deleted_at, 정렬컬럼, PK): 살아있는 행 필터 + 정렬 + keyset 조건이 인덱스 range scan 한 번
+_INDEXES = [
+    ('review', 'ix_review_book_alive_created', ['book_id', 'deleted_at', 'created_at', 'review_id']),
+    ('review', 'ix_review_book_alive_likes', ['book_id', 'deleted_at', 'like_count', 'review_id']),
+    ('comment', 'ix_comment_review_alive_created', ['review_id', 'deleted_at', 'created_at', 'comment_id']),
+    ('comment', 'ix_comment_review_alive_likes', ['review_id', 'deleted_at', 'like_count', 'comment_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # review/comment 는 create_all 로 생기는 환경이 있음 → 테이블이 있을 때만 (없으면 create_all 이 모델 인덱스까지 만듦)
+    inspector = sa.inspect(op.get_bind())
+    for table, name, columns in _INDEXES:
+        if inspector.has_table(table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table, name, _ in reversed(_INDEXES):
+        if inspector.has_table(table) and name in {index['name'] for index in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,37 @@
+"""add book fulltext index
+
+Revision ID: ce7ca69c9a5a
+Revises: c0ad29aab1e5
+Create Date: 2026-10-17 10:48:12.904455
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ce7ca69c9a5a'
+down_revision: Union[str, Sequence[str], None] = 'c0ad29aab1e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SEARCH_BACKEND=mysql 용. SQLite 등에는 FULLTEXT 가 없어서 건너뜀 (memory/like 백엔드 사용)
+    # 모델 __table_args__ 에는 넣지 않음: create_all 시 SQLite 에 일반 (title, description) 인덱스가 생겨버림
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.create_index(
+        'ft_book_title_description', 'book',
+        ['title', 'description'], unique=False, mysql_prefix='FULLTEXT',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.drop_index('ft_book_title_description', table_name='book')
@@ -0,0 +1,38 @@
+"""add user_token compaction indexes
+
+Revision ID: f2304631de13
+Revises: 99573ad9c50d
+Create Date: 2026-10-17 10:03:27.551870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2304631de13'
+down_revision: Union[str, Sequence[str], None] = '99573ad9c50d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 복합 인덱스가 user_id 로 시작하므로 FK 용 단일 인덱스를 대신함
+    op.create_index(
+        'ix_user_token_user_live', 'user_token',
+        ['user_id', 'revoked_at', 'expires_at'], unique=False,
+    )
+    op.drop_index('ix_user_token_user_id', table_name='user_token')
+    op.create_index('ix_user_token_expires_at', 'user_token', ['expires_at'], unique=False)
+    op.create_index('ix_user_token_revoked_at', 'user_token', ['revoked_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_token_revoked_at', table_name='user_token')
+    op.drop_index('ix_user_token_expires_at', table_name='user_token')
+    op.create_index('ix_user_token_user_id', 'user_token', ['user_id'], unique=False)
+    op.drop_index('ix_user_token_user_live', table_name='user_token')
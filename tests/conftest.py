@@ -0,0 +1,152 @@
+# tests/conftest.py
+"""pytest 공용 fixture.
+
+- DB 는 임시 디렉터리의 SQLite 파일 2개: primary.db(DATABASE_URL) / replica.db(DATABASE_REPLICA_URLS)
+  async 경로는 같은 파일을 aiosqlite 로 엶 (ASYNC_DATABASE_URL 비움 → 드라이버만 교체)
+- replica 는 자동으로 따라오지 않음. 복제가 끝난 상태가 필요하면 replicate() 로 primary 를 통째로 복사
+- 설정은 app import 시점에 읽히므로 환경변수는 이 파일 맨 위에서 먼저 넣음
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+
+_TMP_DIR = tempfile.mkdtemp(prefix="bookstore-tests-")
+PRIMARY_PATH = os.path.join(_TMP_DIR, "primary.db")
+REPLICA_PATH = os.path.join(_TMP_DIR, "replica.db")
+
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{PRIMARY_PATH}",
+    "ASYNC_DATABASE_URL": "",
+    "DATABASE_REPLICA_URLS": f"sqlite:///{REPLICA_PATH}",
+    "JWT_SECRET": "test-secret",
+    "TESTING": "1",
+    "TOKEN_COMPACTION_INTERVAL_SEC": "0",
+    "PASSWORD_HASH_ROUNDS": "4",
+    "SLOW_QUERY_THRESHOLD_MS": "0",
+    "SEARCH_INDEX_MAX_AGE_SEC": "0",
+})
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import BigInteger  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+
+
+# 모델 PK 가 BigInteger 라서 SQLite 에선 INTEGER PRIMARY KEY(rowid 자동 증가)가 안 됨 → 테스트 DB 에서만 INTEGER 로
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    return "INTEGER"
+
+
+from app.main import app  # noqa: E402  (라우터 import 로 review 모델까지 전부 등록됨)
+from app.db import Base, SessionLocal, dispose_async_engines, engine, replica_engines  # noqa: E402
+from app.core.book_cache import book_cache  # noqa: E402
+from app.core.count_cache import count_cache  # noqa: E402
+from app.core.security import create_access_token, principal_cache  # noqa: E402
+from app.models.books import Author, Book  # noqa: E402
+from app.models.users import User  # noqa: E402
+
+Base.metadata.create_all(engine)
+for _replica in replica_engines:
+    Base.metadata.create_all(_replica)
+
+
+def _truncate(bind) -> None:
+    with bind.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+def pytest_sessionfinish(session, exitstatus):
+    asyncio.run(dispose_async_engines())
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """테스트마다 두 DB 를 비우고 프로세스 내 캐시도 비움."""
+    _truncate(engine)
+    for replica in replica_engines:
+        _truncate(replica)
+    book_cache.clear()
+    count_cache.clear()
+    principal_cache.clear()
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def replicate():
+    """primary 의 현재 내용을 replica 로 복사 (= 복제 지연이 따라잡힌 상태)."""
+    def _replicate() -> None:
+        source = engine.raw_connection()
+        try:
+            for replica in replica_engines:
+                target = replica.raw_connection()
+                try:
+                    source.driver_connection.backup(target.driver_connection)
+                finally:
+                    target.close()
+        finally:
+            source.close()
+    return _replicate
+
+
+def auth_headers(user: User) -> dict:
+    token = create_access_token({"sub": str(user.user_id), "role": user.role})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def user(db):
+    account = User(email="user@example.com", password="x", name="user", role="user", status="active")
+    db.add(account)
+    db.commit()
+    return account
+
+
+@pytest.fixture
+def admin(db):
+    account = User(email="admin@example.com", password="x", name="admin", role="admin", status="active")
+    db.add(account)
+    db.commit()
+    return account
+
+
+@pytest.fixture
+def author(db):
+    row = Author(name="author")
+    db.add(row)
+    db.commit()
+    return row
+
+
+def make_books(db, author: Author, count: int, **values) -> list:
+    books = [
+        Book(
+            title=values.get("title", f"book {i}"),
+            description=values.get("description", f"description {i}"),
+            price=values.get("price", 10000 + i),
+            stock=values.get("stock", 5),
+            author_id=author.author_id,
+        )
+        for i in range(count)
+    ]
+    db.add_all(books)
+    db.commit()
+    return books
@@ -0,0 +1,46 @@
+# tests/test_async_session.py
+"""AsyncSession 경로 (aiosqlite): 엔진 URL 변환, 세션 팩토리, async 핸들러."""
+import asyncio
+
+from sqlalchemy import func, select
+
+from app.db import get_async_engine, get_async_sessionmaker, to_async_url
+from app.models.books import Book
+from tests.conftest import auth_headers, make_books
+
+
+def test_to_async_url_swaps_driver():
+    assert to_async_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert to_async_url("sqlite+pysqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+    assert to_async_url("mysql+pymysql://u:p@h/db") == "mysql+aiomysql://u:p@h/db"
+    assert to_async_url("postgresql+asyncpg://h/db") == "postgresql+asyncpg://h/db"
+
+
+def test_async_engine_uses_aiosqlite():
+    assert get_async_engine().url.drivername == "sqlite+aiosqlite"
+
+
+def test_async_session_reads_rows_written_by_sync_session(db, author):
+    make_books(db, author, 3)
+
+    async def count_books():
+        async with get_async_sessionmaker()() as session:
+            return await session.scalar(select(func.count()).select_from(Book))
+
+    assert asyncio.run(count_books()) == 3
+
+
+def test_async_list_and_detail_endpoints(client, db, user, author, replicate):
+    books = make_books(db, author, 3)
+    replicate()
+
+    page = client.get("/api/v1/books", params={"size": 2}, headers=auth_headers(user))
+    assert page.status_code == 200
+    payload = page.json()["payload"]
+    assert payload["totalElements"] == 3
+    assert len(payload["content"]) == 2
+
+    detail = client.get(f"/api/v1/books/{books[0].book_id}")
+    assert detail.status_code == 200
+    assert detail.json()["title"] == books[0].title
+    assert client.get("/api/v1/books/999999").status_code == 404
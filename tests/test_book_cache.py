@@ -0,0 +1,26 @@
+# tests/test_book_cache.py
+"""도서 read-through 캐시: miss 는 replica 세션으로 들어와도 primary 에서 채움."""
+from app.core.book_cache import book_cache
+from tests.conftest import auth_headers, make_books
+
+
+def test_lagging_replica_does_not_refill_cache_after_write(client, db, admin, author, replicate):
+    book = make_books(db, author, 1, title="old title")[0]
+    replicate()
+    url = f"/api/v1/books/{book.book_id}"
+    assert client.get(url).json()["title"] == "old title"
+
+    # 수정은 primary 에만 (replica 는 아직 옛 값)
+    assert client.patch(url, json={"title": "new title"}, headers=auth_headers(admin)).status_code == 200
+
+    assert client.get(url).json()["title"] == "new title"
+    assert book_cache.get(db, book.book_id).title == "new title"
+
+
+def test_batch_get_fills_from_primary(client, db, user, author):
+    books = make_books(db, author, 2)          # replica 에는 없음
+    ids = ",".join(str(book.book_id) for book in books)
+
+    payload = client.get("/api/v1/books", params={"ids": ids}, headers=auth_headers(user)).json()["payload"]
+    assert payload["missing"] == []
+    assert [item["book_id"] for item in payload["content"]] == [book.book_id for book in books]
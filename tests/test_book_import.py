@@ -0,0 +1,40 @@
+# tests/test_book_import.py
+"""일괄 등록: 검사 이후 경쟁으로 IntegrityError 가 난 청크의 행별 실패 사유."""
+import pytest
+
+from app.core.book_import import _DEFAULTS, ImportReport, _insert_rows_one_by_one
+from tests.conftest import make_books
+
+
+@pytest.fixture
+def foreign_keys(db):
+    # 테스트 SQLite 는 기본으로 FK 를 검사하지 않음 (MySQL InnoDB 와 맞춤)
+    db.commit()
+    db.connection().exec_driver_sql("PRAGMA foreign_keys=ON")
+    yield
+    db.rollback()
+    db.connection().exec_driver_sql("PRAGMA foreign_keys=OFF")
+
+
+def _row(author_id, isbn):
+    return {**_DEFAULTS, "title": "imported", "price": 1000, "author_id": author_id, "isbn": isbn}
+
+
+def test_one_by_one_reports_author_and_isbn_failures_separately(db, author, foreign_keys):
+    book = make_books(db, author, 1)[0]
+    book.isbn = "978-0000000001"
+    db.commit()
+
+    report = ImportReport()
+    _insert_rows_one_by_one(db, [
+        (1, _row(author.author_id, "978-0000000002")),
+        (2, _row(999999, "978-0000000003")),            # 검사 이후 저자가 지워진 경우
+        (3, _row(author.author_id, "978-0000000001")),  # 검사 이후 같은 ISBN 이 들어온 경우
+    ], report)
+    db.commit()
+
+    assert report.inserted == 1
+    assert [(error["row"], error["code"]) for error in report.errors] == [
+        (2, "INVALID_AUTHOR_ID"),
+        (3, "ISBN_CONFLICT"),
+    ]
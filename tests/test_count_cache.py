@@ -0,0 +1,43 @@
+# tests/test_count_cache.py
+"""목록 totalElements 캐시: 커밋 시 무효화, replica 값과 primary 값 분리."""
+from sqlalchemy import func, select
+
+from app.db import SessionLocal, get_read_db
+from app.core.count_cache import CountMode, count_rows
+from app.models.books import Book
+from tests.conftest import make_books
+
+COUNT_BOOKS = select(func.count()).select_from(Book)
+
+
+def _replica_session():
+    from starlette.requests import Request
+
+    return next(get_read_db(Request({"type": "http", "headers": []})))
+
+
+def test_commit_invalidates_cached_total(db, author):
+    make_books(db, author, 2)
+    assert count_rows(db, COUNT_BOOKS, ["book"]) == (2, True)
+
+    make_books(db, author, 1)
+    assert count_rows(db, COUNT_BOOKS, ["book"]) == (3, True)
+
+
+def test_replica_count_is_not_served_to_primary_reads(db, author):
+    make_books(db, author, 2)          # replica 에는 아직 복제 안 됨
+    replica = _replica_session()
+    try:
+        assert count_rows(replica, COUNT_BOOKS, ["book"]) == (0, True)
+    finally:
+        replica.close()
+
+    primary = SessionLocal()
+    try:
+        assert count_rows(primary, COUNT_BOOKS, ["book"]) == (2, True)
+    finally:
+        primary.close()
+
+
+def test_none_mode_skips_count(db):
+    assert count_rows(db, COUNT_BOOKS, ["book"], CountMode.none) == (None, False)
@@ -0,0 +1,79 @@
+# tests/test_etag.py
+"""ETag: 같은 초 안의 수정, updated_at 을 안 건드리는 변경도 새 ETag (본문 해시)."""
+from sqlalchemy import text, update
+
+from app.models.books import Author, Book
+from app.models.review import Review
+from tests.conftest import auth_headers, make_books
+
+SAME_SECOND = text("'2026-01-01 09:00:00'")   # 수정 전후 updated_at 이 같은 초인 상황 고정
+
+
+def test_book_etag_changes_on_every_write(client, db, admin, author):
+    book = make_books(db, author, 1)[0]
+    url = f"/api/v1/books/{book.book_id}"
+    headers = auth_headers(admin)
+
+    first = client.get(url).headers["etag"]
+    assert client.get(url, headers={"If-None-Match": first}).status_code == 304
+
+    # 같은 초 안에 두 번 수정해도 ETag 가 다름 (updated_at 은 초 단위일 수 있음)
+    assert client.patch(url, json={"stock": 1}, headers=headers).status_code == 200
+    second = client.get(url, headers={"If-None-Match": first})
+    assert second.status_code == 200
+    assert client.patch(url, json={"stock": 2}, headers=headers).status_code == 200
+    third = client.get(url, headers={"If-None-Match": second.headers["etag"]})
+    assert third.status_code == 200
+    assert third.json()["stock"] == 2
+
+
+def test_book_etag_changes_when_rating_aggregates_change(client, db, user, author):
+    book = make_books(db, author, 1)[0]
+    url = f"/api/v1/books/{book.book_id}"
+    before = client.get(url).headers["etag"]
+
+    response = client.post(f"{url}/reviews", json={"content": "good", "rating": 5}, headers=auth_headers(user))
+    assert response.status_code == 201
+
+    after = client.get(url, headers={"If-None-Match": before})
+    assert after.status_code == 200
+    assert after.json()["review_count"] == 1
+
+
+def _changed(client, url, etag, headers):
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    return response.status_code == 200 and response.headers["etag"] != etag
+
+
+def test_author_etags_change_within_same_second(client, db, user, author):
+    book = make_books(db, author, 1)[0]
+    db.execute(update(Author).values(updated_at=SAME_SECOND))
+    db.execute(update(Book).values(updated_at=SAME_SECOND))
+    db.commit()
+    headers = auth_headers(user)
+    detail_url = f"/api/v1/authors/{author.author_id}"
+    books_url = f"{detail_url}/books"
+    detail = client.get(detail_url, headers=headers).headers["etag"]
+    books = client.get(books_url, headers=headers).headers["etag"]
+    assert client.get(detail_url, headers={**headers, "If-None-Match": detail}).status_code == 304
+    assert client.get(books_url, headers={**headers, "If-None-Match": books}).status_code == 304
+
+    db.execute(update(Author).values(name="renamed", updated_at=SAME_SECOND))
+    db.execute(update(Book).where(Book.book_id == book.book_id).values(stock=99, updated_at=SAME_SECOND))
+    db.commit()
+    assert _changed(client, detail_url, detail, headers)
+    assert _changed(client, books_url, books, headers)
+
+
+def test_review_etag_changes_within_same_second(client, db, user, author):
+    book = make_books(db, author, 1)[0]
+    review = Review(user_id=user.user_id, book_id=book.book_id, content="good", rating=5, updated_at=SAME_SECOND)
+    db.add(review)
+    db.commit()
+    url = f"/api/v1/reviews/{review.review_id}"
+    etag = client.get(url).headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    db.execute(update(Review).values(content="changed my mind", updated_at=SAME_SECOND))
+    db.commit()
+    assert _changed(client, url, etag, {})
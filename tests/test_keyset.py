@@ -0,0 +1,114 @@
+# tests/test_keyset.py
+"""keyset 커서: 같은 created_at(초 단위 server_default) 인 행들도 PK 로 이어서 끝까지 한 번씩."""
+import json
+
+import pytest
+from sqlalchemy import text, update
+
+from app.models.books import Book
+from app.models.review import Comment, Review
+from app.models.users import User
+from tests.conftest import auth_headers, make_books
+
+TIED_AT = text("'2026-01-01 09:00:00'")     # CURRENT_TIMESTAMP 와 같은 초 단위 저장 형식
+
+
+def walk(client, url, params, page_of, headers=None, max_pages=50):
+    """nextCursor 를 따라 끝까지. 페이지마다 id 목록."""
+    pages, cursor = [], ""
+    for _ in range(max_pages):
+        body = client.get(url, params={**params, "cursor": cursor}, headers=headers).json()
+        content, meta = page_of(body)
+        pages.append(content)
+        cursor = meta["nextCursor"]
+        if cursor is None:
+            return pages
+    pytest.fail(f"cursor walk did not end after {max_pages} pages")
+
+
+@pytest.fixture
+def tied_books(db, author, replicate):
+    books = make_books(db, author, 10)
+    db.execute(update(Book).values(created_at=TIED_AT))
+    db.commit()
+    replicate()
+    return books
+
+
+@pytest.mark.parametrize("direction", ["desc", "asc"])
+def test_book_cursor_walk_with_tied_created_at(client, user, tied_books, direction):
+    pages = walk(
+        client, "/api/v1/books", {"sort": f"created_at,{direction}", "size": 3},
+        lambda body: ([item["book_id"] for item in body["payload"]["content"]], body["payload"]),
+        headers=auth_headers(user),
+    )
+    ids = [book_id for page in pages for book_id in page]
+    expected = sorted(book.book_id for book in tied_books)
+    assert ids == (expected[::-1] if direction == "desc" else expected)
+    assert len(pages) == 4
+
+
+@pytest.fixture
+def tied_reviews(db, author, replicate):
+    book = make_books(db, author, 1)[0]
+    users = [
+        User(email=f"reviewer{i}@example.com", password="x", name=f"reviewer {i}", role="user", status="active")
+        for i in range(30)
+    ]
+    db.add_all(users)
+    db.flush()
+    reviews = [Review(user_id=u.user_id, book_id=book.book_id, content="good", rating=5) for u in users]
+    db.add_all(reviews)
+    db.flush()
+    comments = [Comment(user_id=users[0].user_id, review_id=reviews[0].review_id, comment="me too") for _ in range(20)]
+    db.add_all(comments)
+    db.flush()
+    db.execute(update(Review).values(created_at=TIED_AT))
+    db.execute(update(Comment).values(created_at=TIED_AT))
+    db.commit()
+    replicate()
+    return book, reviews, comments
+
+
+def _content_and_meta(id_key):
+    return lambda body: ([item[id_key] for item in body["content"]], body["meta"])
+
+
+@pytest.mark.parametrize("sort", ["created_at,desc", "created_at,asc", "likes,desc"])
+def test_review_cursor_walk_with_tied_created_at(client, tied_reviews, sort):
+    book, reviews, _ = tied_reviews
+    pages = walk(
+        client, f"/api/v1/books/{book.book_id}/reviews", {"sort": sort, "size": 7}, _content_and_meta("review_id")
+    )
+    ids = [review_id for page in pages for review_id in page]
+    assert sorted(ids) == sorted(review.review_id for review in reviews)
+    assert len(ids) == len(set(ids))
+    assert len(pages) == 5
+
+
+@pytest.mark.parametrize("sort", ["created_at,asc", "created_at,desc"])
+def test_comment_cursor_walk_with_tied_created_at(client, tied_reviews, sort):
+    _, reviews, comments = tied_reviews
+    pages = walk(
+        client, f"/api/v1/reviews/{reviews[0].review_id}/comments", {"sort": sort, "size": 6},
+        _content_and_meta("comment_id"),
+    )
+    ids = [comment_id for page in pages for comment_id in page]
+    expected = sorted(comment.comment_id for comment in comments)
+    assert ids == (expected if sort.endswith("asc") else expected[::-1])
+    assert len(pages) == 4
+
+
+@pytest.mark.parametrize("direction", ["desc", "asc"])
+def test_export_resume_inside_tied_created_at(client, admin, tied_books, direction):
+    url = "/api/v1/admin/export/books"
+    params = {"sort": f"created_at,{direction}"}
+    headers = auth_headers(admin)
+
+    full = [json.loads(line) for line in client.get(url, params=params, headers=headers).text.splitlines()]
+    assert len(full) == len(tied_books)
+
+    # 4번째 행까지 받고 끊긴 것처럼 그 행의 _cursor 로 이어 받기
+    resumed = client.get(url, params={**params, "after": full[3]["_cursor"]}, headers=headers)
+    rest = [json.loads(line)["book_id"] for line in resumed.text.splitlines()]
+    assert rest == [row["book_id"] for row in full[4:]]
@@ -0,0 +1,58 @@
+# tests/test_like_counters.py
+"""like_count reconcile: write_behind 모드에서 아직 flush 안 된 delta 를 두 번 더하지 않음."""
+import pytest
+
+from app.core import like_counters
+from app.core.like_counters import REVIEW, flush_like_counts, like_buffer, reconcile_like_counts
+from app.db import SessionLocal
+from app.models.review import Review, ReviewLike
+from tests.conftest import make_books
+
+
+@pytest.fixture
+def write_behind(monkeypatch):
+    monkeypatch.setattr(like_counters.settings, "LIKE_COUNTER_MODE", "write_behind")
+    like_buffer.drain()
+    yield
+    like_buffer.drain()
+
+
+@pytest.fixture
+def liked_review(db, user, author):
+    # 좋아요 행은 커밋됐고 like_count 는 아직 0 (delta 가 버퍼에 있거나 유실된 상태)
+    book = make_books(db, author, 1)[0]
+    review = Review(user_id=user.user_id, book_id=book.book_id, content="good", rating=5, like_count=0)
+    db.add(review)
+    db.flush()
+    db.add(ReviewLike(user_id=user.user_id, review_id=review.review_id))
+    db.commit()
+    return review
+
+
+def _like_count(db, review):
+    db.expire_all()
+    return db.get(Review, review.review_id).like_count
+
+
+def test_pending_delta_of_other_worker_is_not_applied_twice(db, liked_review, write_behind, monkeypatch):
+    like_buffer.add(REVIEW, liked_review.review_id, 1)
+    # 기다리는 사이 delta 를 가진 워커가 flush
+    monkeypatch.setattr(like_counters.time, "sleep", lambda _: flush_like_counts(SessionLocal))
+
+    result = reconcile_like_counts(db, settle_sec=1)
+    assert result[REVIEW] == (1, 1, 0)
+    assert _like_count(db, liked_review) == 1
+
+
+def test_local_buffer_is_flushed_first(db, liked_review, write_behind):
+    like_buffer.add(REVIEW, liked_review.review_id, 1)
+
+    result = reconcile_like_counts(db, session_factory=SessionLocal, settle_sec=0.01)
+    assert result[REVIEW] == (1, 0, 0)
+    assert _like_count(db, liked_review) == 1
+
+
+def test_lost_delta_is_fixed_after_settle(db, liked_review, write_behind):
+    result = reconcile_like_counts(db, settle_sec=0.01)
+    assert result[REVIEW] == (1, 1, 1)
+    assert _like_count(db, liked_review) == 1
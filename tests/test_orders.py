@@ -0,0 +1,35 @@
+# tests/test_orders.py
+"""주문 생성: 아이템 스냅샷은 도서 캐시가 아니라 주문 시점의 DB 값."""
+from sqlalchemy import update
+
+from app.core.book_cache import book_cache
+from app.models.books import Book
+from tests.conftest import auth_headers, make_books
+
+
+def test_order_snapshot_reads_database_not_cache(client, db, user, author):
+    book = make_books(db, author, 1, title="old title")[0]
+    headers = auth_headers(user)
+    response = client.post("/api/v1/cart/items", json={"book_id": book.book_id, "quantity": 2}, headers=headers)
+    assert response.status_code == 201
+    assert book_cache.get(db, book.book_id).title == "old title"
+
+    # 다른 워커에서 수정돼서 이 워커의 캐시는 아직 옛 값
+    db.execute(update(Book).values(title="new title"))
+    db.commit()
+
+    order = client.post("/api/v1/orders", headers=headers)
+    assert order.status_code == 201
+    assert [(item["title"], item["quantity"]) for item in order.json()["items"]] == [("new title", 2)]
+
+
+def test_order_with_missing_book_leaves_no_order(client, db, user, author):
+    book = make_books(db, author, 1)[0]
+    headers = auth_headers(user)
+    client.post("/api/v1/cart/items", json={"book_id": book.book_id, "quantity": 1}, headers=headers)
+    db.delete(book)
+    db.commit()
+
+    response = client.post("/api/v1/orders", headers=headers)
+    assert response.status_code == 404
+    assert client.get("/api/v1/orders", headers=headers).json() == []
@@ -0,0 +1,24 @@
+# tests/test_principal_cache.py
+"""get_current_user 유저 캐시: hit 면 DB 안 거침, 같은 워커의 권한 변경은 커밋 직후 반영."""
+from app.core.query_stats import assert_max_queries
+from app.core.security import principal_cache
+from tests.conftest import auth_headers
+
+
+def test_cached_principal_skips_database(client, user):
+    headers = auth_headers(user)
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+    assert "password" not in principal_cache.get(str(user.user_id))
+
+    with assert_max_queries(0):
+        assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+
+
+def test_role_change_in_same_worker_is_seen_immediately(client, admin, user):
+    admin_headers = auth_headers(admin)
+    assert client.get("/health/metrics", headers=admin_headers).status_code == 200
+
+    # admin 이 자기 role 을 내림 → invalidate_principal 후 다음 요청은 DB 에서 새로 읽음
+    response = client.patch(f"/api/v1/users/{admin.user_id}/status", json={"role": "user"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert client.get("/health/metrics", headers=admin_headers).status_code == 403
@@ -0,0 +1,71 @@
+# tests/test_query_budget.py
+"""핫 엔드포인트의 SQL 수 예산 (assert_max_queries). 행 수를 늘려도 쿼리 수가 그대로여야 함 (N+1 회귀 방지).
+
+예산에는 인증(get_current_user) 쿼리도 포함됨: 유저 캐시 miss 면 user row 조회 1번, hit 이면 0.
+"""
+import pytest
+
+from app.core.query_stats import assert_max_queries
+from app.models.review import Review
+from app.models.users import User
+from tests.conftest import auth_headers, make_books
+
+ROWS = 30
+
+
+@pytest.fixture
+def catalog(db, author, replicate):
+    books = make_books(db, author, ROWS)
+    users = [
+        User(email=f"reviewer{i}@example.com", password="x", name=f"reviewer {i}", role="user", status="active")
+        for i in range(ROWS)
+    ]
+    db.add_all(users)
+    db.flush()
+    db.add_all(
+        Review(user_id=reviewer.user_id, book_id=books[0].book_id, content="good", rating=i % 5 + 1, like_count=i)
+        for i, reviewer in enumerate(users)
+    )
+    books[0].review_count = ROWS
+    db.commit()
+    replicate()
+    return books
+
+
+def test_book_list_budget(client, user, catalog):
+    headers = auth_headers(user)
+    # 인증(캐시 miss) 1 + COUNT 1 + 목록 1
+    with assert_max_queries(3):
+        assert client.get("/api/v1/books", params={"size": ROWS}, headers=headers).status_code == 200
+    # 이후로는 인증이 유저 캐시 hit → 0. fields=author 는 JOIN 한 번 (저자별 lazy load 없음)
+    with assert_max_queries(2):
+        response = client.get("/api/v1/books", params={"size": ROWS, "fields": "book_id,author"}, headers=headers)
+    assert all(item["author"] is not None for item in response.json()["payload"]["content"])
+    # 커서 모드는 COUNT 도 안 함
+    with assert_max_queries(1):
+        assert client.get("/api/v1/books", params={"size": ROWS, "cursor": ""}, headers=headers).status_code == 200
+
+
+def test_get_book_budget(client, catalog):
+    book_id = catalog[0].book_id
+    with assert_max_queries(1):
+        first = client.get(f"/api/v1/books/{book_id}")
+    assert first.status_code == 200
+    # 캐시 hit + If-None-Match 일치 → DB 안 거치고 304
+    with assert_max_queries(0):
+        cached = client.get(f"/api/v1/books/{book_id}", headers={"If-None-Match": first.headers["etag"]})
+    assert cached.status_code == 304
+
+
+def test_review_list_budget(client, catalog):
+    url = f"/api/v1/books/{catalog[0].book_id}/reviews"
+    # 도서 집계 1 + 목록 1 (리뷰 COUNT 없음)
+    with assert_max_queries(2):
+        response = client.get(url, params={"size": ROWS})
+    assert len(response.json()["content"]) == ROWS
+    # expand=user 는 작성자 IN 쿼리 1번 추가 (행마다 user 조회 안 함)
+    with assert_max_queries(3):
+        response = client.get(url, params={"size": ROWS, "expand": "user"})
+    assert all(item["author"] is not None for item in response.json()["content"])
+    with assert_max_queries(2):
+        assert client.get(url, params={"size": ROWS, "sort": "likes,desc", "cursor": ""}).status_code == 200
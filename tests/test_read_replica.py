@@ -0,0 +1,58 @@
+# tests/test_read_replica.py
+"""읽기 replica 라우팅: 기본은 replica, X-Read-Consistency: strong 이면 primary, 쓰기는 항상 primary."""
+from starlette.requests import Request
+
+from app.db import SessionLocal, is_replica_session, read_session_factory
+from tests.conftest import auth_headers, make_books
+
+STRONG = {"X-Read-Consistency": "strong"}
+
+
+def _request(headers: dict) -> Request:
+    raw = [(key.lower().encode(), value.encode()) for key, value in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def test_read_session_factory_routes_by_header():
+    replica = read_session_factory(_request({}))()
+    primary = read_session_factory(_request({"X-Read-Consistency": "STRONG"}))()
+    try:
+        assert is_replica_session(replica)
+        assert not is_replica_session(primary)
+        assert read_session_factory(_request(STRONG)) is SessionLocal
+    finally:
+        replica.close()
+        primary.close()
+
+
+def test_async_book_list_reads_replica_unless_strong(client, db, user, author):
+    make_books(db, author, 2)            # primary 에만 있음 (replica 는 아직 복제 전)
+    headers = auth_headers(user)
+
+    lagging = client.get("/api/v1/books", headers=headers).json()["payload"]
+    assert lagging["totalElements"] == 0
+    assert lagging["content"] == []
+
+    strong = client.get("/api/v1/books", headers={**headers, **STRONG}).json()["payload"]
+    assert strong["totalElements"] == 2
+    assert len(strong["content"]) == 2
+
+
+def test_sync_author_list_reads_replica_until_replicated(client, db, user, author, replicate):
+    headers = auth_headers(user)
+    assert client.get("/api/v1/authors", headers=headers).json()["content"] == []
+    assert len(client.get("/api/v1/authors", headers={**headers, **STRONG}).json()["content"]) == 1
+
+    replicate()
+    content = client.get("/api/v1/authors", headers=headers).json()["content"]
+    assert [row["author_id"] for row in content] == [author.author_id]
+
+
+def test_writes_go_to_primary(client, admin):
+    response = client.post("/api/v1/authors", json={"name": "new author"}, headers=auth_headers(admin))
+    assert response.status_code == 201
+
+    headers = auth_headers(admin)
+    names = [row["name"] for row in client.get("/api/v1/authors", headers={**headers, **STRONG}).json()["content"]]
+    assert names == ["new author"]
+    assert client.get("/api/v1/authors", headers=headers).json()["content"] == []
@@ -0,0 +1,28 @@
+# tests/test_review_list.py
+"""리뷰 목록: meta.total / rating 은 도서 캐시 스냅샷이 아니라 목록과 같은 세션에서 읽은 book 집계."""
+from app.core.book_cache import book_cache
+from app.models.review import Review
+from tests.conftest import make_books
+
+
+def test_total_comes_from_same_session_as_page(client, db, user, author, replicate):
+    book = make_books(db, author, 1)[0]
+    assert book_cache.get(db, book.book_id).review_count == 0     # 캐시에 review_count=0 스냅샷
+
+    # 캐시 무효화 없이 집계가 바뀜 (다른 워커의 쓰기, 수동 SQL 등)
+    db.add_all(Review(user_id=user.user_id, book_id=book.book_id, content="good", rating=4) for _ in range(2))
+    book.review_count, book.rating_sum, book.rating_4, book.rating_avg = 2, 8, 2, 4
+    db.commit()
+    replicate()
+
+    body = client.get(f"/api/v1/books/{book.book_id}/reviews").json()
+    assert len(body["content"]) == 2
+    assert body["meta"]["total"] == 2
+    assert body["rating"]["review_count"] == 2
+    assert body["rating"]["histogram"]["4"] == 2
+
+
+def test_missing_book_is_404(client):
+    response = client.get("/api/v1/books/999999/reviews")
+    assert response.status_code == 404
+    assert response.json()["message"] == "BOOK_NOT_FOUND"
@@ -0,0 +1,125 @@
+# tests/test_search.py
+"""도서 keyword 검색 백엔드: like(기본, SQLite 에서도 동작) / memory(프로세스 내 역색인)."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core import search
+from app.core.config import get_settings
+from app.core.search import SearchIndex
+from app.db import SessionLocal
+from app.models.books import Book
+from tests.conftest import auth_headers
+
+settings = get_settings()
+
+TITLES = [
+    ("Python Cookbook", "recipes for python"),
+    ("Learning Pythonic Code", "idioms"),
+    ("Rust in Action", "systems programming, not python"),
+    ("Cooking at home", "no code at all"),
+]
+
+
+@pytest.fixture
+def shelf(db, author, replicate):
+    start = datetime(2024, 1, 1)
+    books = [
+        Book(title=title, description=description, price=10000 * (i + 1), stock=1,
+             author_id=author.author_id, created_at=start + timedelta(days=i))
+        for i, (title, description) in enumerate(TITLES)
+    ]
+    db.add_all(books)
+    db.commit()
+    replicate()
+    return {book.title: book.book_id for book in books}
+
+
+@pytest.fixture
+def memory_backend(monkeypatch):
+    """memory 백엔드 + 테스트마다 빈 색인 (다른 테스트의 색인/결과 캐시와 안 섞이게)."""
+    index = SearchIndex()
+    monkeypatch.setattr(settings, "SEARCH_BACKEND", "memory")
+    monkeypatch.setattr(search, "search_index", index)
+    return index
+
+
+def _build(index: SearchIndex) -> None:
+    index.build(search._load_books_from(SessionLocal)())
+
+
+def _search(client, headers, **params):
+    response = client.get("/api/v1/books", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["payload"]
+
+
+def test_like_is_default_backend_with_substring_match(client, user, shelf):
+    assert settings.SEARCH_BACKEND == "like"
+    payload = _search(client, auth_headers(user), keyword="ython")
+
+    # keyword 가 있어도 기본 정렬은 created_at,desc (relevance 는 요청할 때만)
+    assert payload["sort"] == "created_at,desc"
+    assert [item["book_id"] for item in payload["content"]] == [
+        shelf["Rust in Action"], shelf["Learning Pythonic Code"], shelf["Python Cookbook"],
+    ]
+    assert payload["content"][0]["highlight"] is not None
+
+
+def test_memory_backend_falls_back_to_like_until_built(client, user, shelf, memory_backend, monkeypatch):
+    started = []
+    monkeypatch.setattr(memory_backend, "_start_background_build", started.append)
+
+    payload = _search(client, auth_headers(user), keyword="ython", sort="relevance")
+
+    # 요청 안에서 빌드하지 않고 백그라운드 빌드만 요청, 응답은 LIKE(부분 일치) 결과
+    assert started
+    assert memory_backend.stats()["built"] is False
+    assert payload["totalElements"] == 3
+
+
+def test_memory_backend_ranks_by_relevance(client, user, shelf, memory_backend):
+    _build(memory_backend)
+    headers = auth_headers(user)
+
+    payload = _search(client, headers, keyword="code", sort="relevance")
+    # 제목에 나온 문서가 설명에만 나온 문서보다 앞
+    assert [item["book_id"] for item in payload["content"]] == [
+        shelf["Learning Pythonic Code"], shelf["Cooking at home"],
+    ]
+    assert payload["content"][0]["score"] > payload["content"][1]["score"] > 0
+
+    # 마지막 단어는 prefix 매칭, 여러 단어는 AND
+    prefix = _search(client, headers, keyword="pyth", sort="relevance")
+    assert prefix["totalElements"] == 3
+    both = _search(client, headers, keyword="learning pyth", sort="relevance")
+    assert [item["book_id"] for item in both["content"]] == [shelf["Learning Pythonic Code"]]
+
+
+def test_memory_backend_sees_books_created_in_this_worker(client, admin, author, shelf, memory_backend):
+    _build(memory_backend)
+    headers = auth_headers(admin)
+    created = client.post(
+        "/api/v1/books",
+        json={"title": "Fluent Python", "description": "", "price": 1000, "stock": 1, "author_id": author.author_id},
+        headers=headers,
+    )
+    assert created.status_code == 201
+
+    payload = _search(client, {**headers, "X-Read-Consistency": "strong"}, keyword="fluent", sort="relevance")
+    assert [item["book_id"] for item in payload["content"]] == [created.json()["book_id"]]
+
+
+def test_memory_relevance_with_filters_beyond_cap(client, user, shelf, memory_backend, monkeypatch):
+    _build(memory_backend)
+    headers = auth_headers(user)
+    # 매칭 3건 > cap 2: 필터(가격)를 통과하는 도서가 cap 이하면 그 안에서 점수 계산 → 정확한 total
+    monkeypatch.setattr(settings, "SEARCH_MAX_FILTER_IDS", 2)
+    narrow = _search(client, headers, keyword="pyth", sort="relevance", min_price=30000)
+    assert narrow["totalElements"] == 1
+    assert [item["book_id"] for item in narrow["content"]] == [shelf["Rust in Action"]]
+    assert narrow["content"][0]["score"] > 0
+
+    # 매칭도 필터 통과분도 cap 초과 → 잘린 total 대신 LIKE 경로의 정확한 수
+    wide = _search(client, headers, keyword="pyth", sort="relevance", min_price=0)
+    assert wide["totalElements"] == 3